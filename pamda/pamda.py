@@ -1,18 +1,54 @@
+import array, heapq, operator, os
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from functools import reduce
+from itertools import chain
 from pamda.pamda_utils import pamda_utils
 from pamda.pamda_fast import (
+    __aperture__,
+    __assocPaths__,
+    __batchOutput__,
+    __broadcast__,
+    __copyPath__,
+    __difference__,
+    __dissocPath__,
+    __dissocPaths__,
+    __fingerprint__,
     __getForceDict__,
-    __assocPath__,
+    __getKeyFn__,
     __groupByHashable__,
     __groupKeys__,
+    __groupWithKey__,
+    __hashJoin__,
+    __intersection__,
+    __mergeSetOp__,
     __mergeDeep__,
+    __countNodes__,
+    __mergeDeepItems__,
+    __mergeDeepMany__,
+    __mergeJoin__,
+    __nest__,
     __pathOr__,
     __pluck__,
-    __getKeyValues__,
+    __quantiles__,
+    __rolling__,
+    __selectRanks__,
+    __splitEvery__,
+    __symmetricDifference__,
     __flatten__,
+    __iterUniqBy__,
+    __uniqBy__,
     __unnest__,
 )
 from pamda.pamda_curry import curry_obj
+from pamda.pamda_table import PamdaTable
+from pamda.pamda_stats import PamdaStats
+from pamda.pamda_lens import PamdaLens
+from pamda.pamda_hamt import PamdaMap
+from pamda.pamda_query import PamdaQuery
+from pamda import pamda_numpy
+from pamda.pamda_external import __externalSort__, __uniqSorted__
+from pamda.pamda_numpy import ndarray
 from pamda import pamda_wrappers
 from typing import Any
 
@@ -68,19 +104,20 @@ class pamda(pamda_utils):
             out.append(acc)
         return out
 
-    def add(self, a: int | float, b: int | float):
+    def add(self, a: int | float | ndarray, b: int | float | ndarray):
         """
         Function:
 
         - Adds two numbers
+        - Note: numpy arrays are added element-wise
 
         Requires:
 
         - `a`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The first number to add
         - `b`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The second number to add
 
         Example:
@@ -91,6 +128,45 @@ class pamda(pamda_utils):
         """
         return a + b
 
+    def addBatch(
+        self,
+        a: int | float | list | tuple | array.array | memoryview | ndarray,
+        b: int | float | list | tuple | array.array | memoryview | ndarray,
+    ):
+        """
+        Function:
+
+        - Adds two sequences of numbers element-wise in a single loop
+        - Scalars are broadcast to the length of the sequences
+
+        Requires:
+
+        - `a`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The first number(s) to add
+        - `b`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The second number(s) to add
+
+        Notes:
+
+        - All sequences must have the same length
+        - Sequences (including `memoryview`s) are read without being copied
+        - If the first sequence passed is an `array.array` or a `memoryview`, a typed `array.array` is returned, otherwise a list is returned
+        - numpy arrays are processed with numpy
+
+        Example:
+
+        ```
+        pamda.addBatch([1, 2, 3], 1) #=> [2, 3, 4]
+        pamda.addBatch([1, 2, 3], [3, 2, 1]) #=> [4, 4, 4]
+        ```
+        """
+        if pamda_numpy.__isArray__(a, b):
+            return a + b
+        (a, b), like = __broadcast__(a, b)
+        return __batchOutput__(like, list(map(operator.add, a, b)))
+
     def adjust(self, index: int, fn, data: list):
         """
         Function:
@@ -128,7 +204,9 @@ class pamda(pamda_utils):
         data[index] = fn(data[index])
         return data
 
-    def assocPath(self, path: list | str | int | tuple, value, data: dict):
+    def assocPath(
+        self, path: list | str | int | tuple | PamdaLens, value, data: dict
+    ):
         """
         Function:
 
@@ -138,9 +216,10 @@ class pamda(pamda_utils):
         Requires:
 
         - `path`:
-            - Type: list[str | int | tuple] | str | int | tuple
+            - Type: list[str | int | tuple] | str | int | tuple | PamdaLens
             - What: The path to check
             - Note: If a string is passed, assumes a single item path list with that string
+            - Note: If a lens is passed (see `pamda.lens`), its compiled setter is used
         - `value`:
             - Type: any
             - What: The value to appropriate to the end of the path
@@ -155,6 +234,8 @@ class pamda(pamda_utils):
         pamda.assocPath(path=['a','c'], value=3, data=data) #=> {'a':{'b':1, 'c':3}}
         ```
         """
+        if isinstance(path, PamdaLens):
+            return path.set(value, data)
         if not isinstance(path, list):
             path = [path]
         reduce(__getForceDict__, path[:-1], data).__setitem__(path[-1], value)
@@ -204,6 +285,182 @@ class pamda(pamda_utils):
         )
         return data
 
+    def adjustImmutable(self, index: int, fn, data: list):
+        """
+        Function:
+
+        - Same as `pamda.adjust` but returns a new list instead of updating `data` in place
+        - Only the list itself is copied (shallow), so every other item is shared with `data`
+
+        Requires:
+
+        - `index`:
+            - Type: int
+            - What: The 0 based index of the item in the list to adjust
+            - Note: If the index is out of range, picks the (-)first / (+)last item
+        - `fn`:
+            - Type: function | method
+            - What: The function to apply the index item to
+            - Note: This is automatically curried
+        - `data`:
+            - Type: list
+            - What: The list to adjust
+
+        Example:
+
+        ```
+        data=[1,5,9]
+        pamda.adjustImmutable(index=1, fn=pamda.inc, data=data) #=> [1,6,9]
+        data #=> [1,5,9]
+        ```
+        """
+        return self.adjust(index, fn, list(data))
+
+    def aperture(self, n: int, data):
+        """
+        Function:
+
+        - Lazily yields every run of `n` consecutive items (a sliding window) as a list
+        - Returns a generator, so only `n` items are held in memory at a time
+
+        Requires:
+
+        - `n`:
+            - Type: int
+            - What: The size of each window
+        - `data`:
+            - Type: list | iterable
+            - What: The items to slide over (EG: a list, a generator or a file stream)
+
+        Example:
+
+        ```
+        list(pamda.aperture(2, [1, 2, 3, 4])) #=> [[1, 2], [2, 3], [3, 4]]
+        ```
+        """
+        if n < 1:
+            raise Exception("`n` must be a positive int")
+        return __aperture__(n, data)
+
+    def assocPathComplexImmutable(
+        self, default, default_fn, path: list | int | float | tuple, data: dict
+    ):
+        """
+        Function:
+
+        - Same as `pamda.assocPathComplex` but returns a new dictionary instead of updating `data` in place
+        - Only the dictionaries (and lists) along the path are copied, so every untouched subtree is shared with `data`
+
+        Requires:
+
+        - `default`:
+            - Type: any
+            - What: The default item to add to a path that does not yet exist
+        - `default_fn`:
+            - Type: function | method
+            - What: A unary (single input) function that takes in the current path item (or default) and adjusts it
+        - `path`:
+            - Type: list[str | int | tuple] | str | int | tuple
+            - What: The path to check
+        - `data`:
+            - Type: dict
+            - What: A dictionary to check if the path exists
+
+        Example:
+
+        ```
+        data={'a':{'b':1}, 'x':{'y':2}}
+        output=pamda.assocPathComplexImmutable(default=[2], default_fn=lambda x:x+[1], path=['a','c'], data=data)
+        #=> {'a':{'b':1,'c':[2,1]}, 'x':{'y':2}}
+        data #=> {'a':{'b':1}, 'x':{'y':2}}
+        output['x'] is data['x'] #=> True
+        ```
+        """
+        if self.getArity(default_fn) != 1:
+            raise Exception(
+                "`assocPathComplexImmutable` `default_fn` must be an unary (single input) function."
+            )
+        if not isinstance(path, list):
+            path = [path]
+        output, path_object = __copyPath__(path, data)
+        path_object[path[-1]] = default_fn(path_object.get(path[-1], default))
+        return output
+
+    def assocPathImmutable(
+        self, path: list | str | int | tuple, value, data: dict
+    ):
+        """
+        Function:
+
+        - Same as `pamda.assocPath` but returns a new dictionary instead of updating `data` in place
+        - Only the dictionaries (and lists) along the path are copied, so every untouched subtree is shared with `data`
+
+        Requires:
+
+        - `path`:
+            - Type: list[str | int | tuple] | str | int | tuple
+            - What: The path to set
+            - Note: If a string is passed, assumes a single item path list with that string
+        - `value`:
+            - Type: any
+            - What: The value to appropriate to the end of the path
+        - `data`:
+            - Type: dict
+            - What: A dictionary in which to associate the given value to the given path
+
+        Example:
+
+        ```
+        data={'a':{'b':1}, 'x':{'y':2}}
+        output=pamda.assocPathImmutable(path=['a','c'], value=3, data=data) #=> {'a':{'b':1, 'c':3}, 'x':{'y':2}}
+        data #=> {'a':{'b':1}, 'x':{'y':2}}
+        output['x'] is data['x'] #=> True
+        ```
+        """
+        if not isinstance(path, list):
+            path = [path]
+        output, path_object = __copyPath__(path, data)
+        path_object[path[-1]] = value
+        return output
+
+    def assocPaths(self, pairs: list, data: dict):
+        """
+        Function:
+
+        - Sets many values at many paths within a nested dictionary in one call
+        - Each pair only descends from the end of the prefix it shares with the previous pair
+            - Note: Pairs grouped (or sorted) by path descend each shared prefix only once
+        - The result is the same as calling `pamda.assocPath` for each pair in order
+        - Note: This updates the object in place, but also returns the object
+
+        Requires:
+
+        - `pairs`:
+            - Type: list of tuples of (path, value)
+            - What: The paths and the values to set at them
+            - Note: Each path is a list of keys or a single key (assumes a single item path list with that key)
+            - Note: Missing (or non dict) items along each path are replaced with dictionaries
+        - `data`:
+            - Type: dict
+            - What: A dictionary in which to set the values
+
+        Example:
+
+        ```
+        data={'a':{'b':1}}
+        pamda.assocPaths([(['a','c'], 2), (['a','d','e'], 3), ('f', 4)], data)
+        #=> {'a':{'b':1, 'c':2, 'd':{'e':3}}, 'f':4}
+        ```
+        """
+        normalized = []
+        for path, value in pairs:
+            if not isinstance(path, list):
+                path = [path]
+            elif len(path) == 0:
+                raise Exception("`assocPaths` paths must have at least one key")
+            normalized.append((path, value))
+        return __assocPaths__(normalized, data)
+
     def asyncKill(self, fn: curry_obj):
         """
         Function:
@@ -369,22 +626,28 @@ class pamda(pamda_utils):
         """
         return fn.asyncWait()
 
-    def clamp(self, minimum: int | float, maximum: int | float, a: int | float):
+    def clamp(
+        self,
+        minimum: int | float | ndarray,
+        maximum: int | float | ndarray,
+        a: int | float | ndarray,
+    ):
         """
         Function:
 
         - Forces data to be within minimum and maximum
+        - Note: numpy arrays are clamped element-wise with numpy
 
         Requires:
 
         - `minimum`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The minimum number
         - `maximum`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The maximum number
         - `a`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The number to clamp
 
         Example:
@@ -394,8 +657,85 @@ class pamda(pamda_utils):
         pamda.clamp(1, 3, 5) #=> 3
         ```
         """
+        if pamda_numpy.__isArray__(minimum, maximum, a):
+            return pamda_numpy.__clamp__(minimum, maximum, a)
         return min(max(a, minimum), maximum)
 
+    def clampBatch(
+        self,
+        minimum: (
+            int | float | list | tuple | array.array | memoryview | ndarray
+        ),
+        maximum: (
+            int | float | list | tuple | array.array | memoryview | ndarray
+        ),
+        a: int | float | list | tuple | array.array | memoryview | ndarray,
+    ):
+        """
+        Function:
+
+        - Forces a sequence of numbers to be within minimum and maximum element-wise in a single loop
+        - Scalars are broadcast to the length of the sequences
+
+        Requires:
+
+        - `minimum`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The minimum number(s)
+        - `maximum`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The maximum number(s)
+        - `a`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The number(s) to clamp
+
+        Notes:
+
+        - See `addBatch` for the notes on sequences and return types
+
+        Example:
+
+        ```
+        pamda.clampBatch(1, 3, [0, 2, 5]) #=> [1, 2, 3]
+        ```
+        """
+        if pamda_numpy.__isArray__(minimum, maximum, a):
+            return pamda_numpy.__clamp__(minimum, maximum, a)
+        (minimum, maximum, a), like = __broadcast__(minimum, maximum, a)
+        return __batchOutput__(
+            like, list(map(min, map(max, a, minimum), maximum))
+        )
+
+    def countBy(self, path_or_fn, data):
+        """
+        Function:
+
+        - Counts the number of items for each key without building any sublists
+        - Returns a `collections.Counter` (a dict subclass) of each key to its count
+            - Counters are mergeable (EG: `counts_a + counts_b` or `counts_a.update(counts_b)`) for chunked or parallel data
+
+        Requires:
+
+        - `path_or_fn`:
+            - Type: function | method | list | str | int | tuple
+            - What: The key to count by
+            - Note: A function is called with each item and must return a hashable key
+            - Note: A str or int is a top level key, a list is a nested path and a tuple is a set of top level keys (counted as a tuple of values)
+        - `data`:
+            - Type: list | iterable
+            - What: The items to count (EG: a list, a generator or a file stream)
+
+        Example:
+
+        ```
+        data=[{'color':'red', 'size':1}, {'color':'blue', 'size':1}, {'color':'red', 'size':2}]
+        pamda.countBy('color', data) #=> Counter({'red': 2, 'blue': 1})
+        pamda.countBy(('color', 'size'), data) #=> Counter({('red', 1): 1, ('blue', 1): 1, ('red', 2): 1})
+        pamda.countBy(lambda x: x['size'] > 1, data) #=> Counter({False: 2, True: 1})
+        ```
+        """
+        return Counter(map(__getKeyFn__(path_or_fn), data))
+
     def curry(self, fn):
         """
         Function:
@@ -503,112 +843,377 @@ class pamda(pamda_utils):
             raise Exception("`a` must be an `int` or a `float`")
         return a - 1
 
-    def difference(self, a: list, b: list):
+    def decBatch(
+        self,
+        data: int | float | list | tuple | array.array | memoryview | ndarray,
+    ):
         """
         Function:
 
-        - Combines two lists into a list of no duplicate items present in the first list but not the second
+        - Decrements a sequence of numbers by one element-wise in a single loop
 
         Requires:
 
-        - `a`:
-            - Type: list
-            - What: List of items in which to look for a difference
-        - `b`:
-            - Type: list
-            - What: List of items in which to compare when looking for the difference
+        - `data`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The number(s) to decrement
+
+        Notes:
+
+        - See `addBatch` for the notes on sequences and return types
 
         Example:
 
         ```
-        a=['a','b']
-        b=['b','c']
-        pamda.difference(a=a, b=b) #=> ['a']
-        pamda.difference(a=b, b=a) #=> ['c']
+        pamda.decBatch([1, 2, 3]) #=> [0, 1, 2]
         ```
         """
-        return list(set(a).difference(set(b)))
+        if pamda_numpy.__isArray__(data):
+            return data - 1
+        (data,), like = __broadcast__(data)
+        return __batchOutput__(like, [i - 1 for i in data])
 
-    def dissocPath(self, path: list | str | int | tuple, data: dict):
+    def describe(self, data):
         """
         Function:
 
-        - Removes the value at the end of a path within a nested dictionary
-        - Note: This updates the object in place, but also returns the object
+        - Summarizes numeric data in a single streaming pass without materializing it
+        - Returns the count, mean, sample variance, sample standard deviation, min and max of the data
 
         Requires:
 
-        - `path`:
-            - Type: list of strs | str
-            - What: The path to remove from the dictionary
-            - Note: If a string is passed, assumes a single item path list with that string
         - `data`:
-            - Type: dict
-            - What: A dictionary with a path to be removed
+            - Type: iterable of (ints | floats)
+            - What: The data to summarize (EG: a list, a generator or a file stream)
+            - Note: If the data is empty, every value except for count is None
+
+        Notes:
+
+        - For chunked or distributed data, use `pamda.pamda_stats.PamdaStats` accumulators and merge them
+            - EG: `(PamdaStats().updateMany(chunk_a) + PamdaStats().updateMany(chunk_b)).toDict()`
 
         Example:
 
         ```
-        data={'a':{'b':{'c':0,'d':1}}}
-        pamda.dissocPath(path=['a','b','c'], data=data) #=> {'a':{'b':{'d':1}}}
+        pamda.describe([1, 2, 3, 4])
+        #=> {'count': 4, 'mean': 2.5, 'variance': 1.6666666666666667, 'std': 1.2909944487358056, 'min': 1, 'max': 4}
+
+        pamda.describe(int(line) for line in open('values.txt'))
         ```
         """
-        if not isinstance(path, list):
-            path = [path]
-        if not self.hasPath(path=path, data=data):
-            raise Exception("Path does not exist")
-        else:
-            reduce(__getForceDict__, path[:-1], data).pop(path[-1])
-        return data
+        return PamdaStats().updateMany(data).toDict()
 
-    def flatten(self, data: list):
+    def difference(self, a: list, b: list, presorted: bool = False):
         """
         Function:
 
-        - Flattens a list of lists of lists ... into a single list depth first
+        - Combines two lists into a list of no duplicate items present in the first list but not the second
+        - Keeps the order of the first list
+        - Only the smaller list is fully loaded into a set
+        - Unhashable items (EG: dicts) are compared by value
 
         Requires:
 
-        - `data`:
-            - Type: list of lists
-            - What: The list of lists to reduce to a single list
+        - `a`:
+            - Type: list
+            - What: The first list of items
+        - `b`:
+            - Type: list
+            - What: The second list of items
+
+        Optional:
+
+        - `presorted`:
+            - Type: bool
+            - What: Whether both lists are already sorted ascending
+            - Default: False
+            - Note: If True, a sort-merge is used that needs no extra memory
+            - Note: Raises an exception if either list turns out to be unsorted
+
         Example:
 
         ```
-        data=[['a','b'],[1,[2]]]
-        pamda.flatten(data=data) #=> ['a','b',1,2]
+        a=['a','b']
+        b=['b','c']
+        pamda.difference(a=a, b=b) #=> ['a']
+        pamda.difference(a=b, b=a) #=> ['c']
         ```
         """
-        return __flatten__(data)
+        if presorted:
+            return list(__mergeSetOp__(True, False, False, a, b))
+        try:
+            return __difference__(a, b)
+        except TypeError:
+            return __difference__(a, b, __fingerprint__)
 
-    def flip(self, fn):
+    def differenceBy(self, fn, a: list, b: list, presorted: bool = False):
         """
         Function:
 
-        - Returns a new function equivalent to the supplied function except that the first two inputs are flipped
+        - Same as `pamda.difference` but compares items by the key returned from `fn`
+        - Returns the first item for each distinct key
+        - Useful for lists of dicts (EG: comparing records by an id)
 
         Requires:
 
         - `fn`:
             - Type: function | method
-            - What: The function or method to flip
-            - Note: This function must have an arity of at least 2 (take two inputs)
-            - Note: Only args are flipped, kwargs are passed as normal
+            - What: A function that takes an item and returns the key to compare it by
+        - `a`:
+            - Type: list
+            - What: The first list of items
+        - `b`:
+            - Type: list
+            - What: The second list of items
 
-        Notes:
+        Optional:
 
-        - Input functions are not flipped in place
-        - The returned function is a flipped version of the input function
-        - A curried function can be flipped in place by calling fn.flip()
-        - A function can be flipped multiple times:
-            - At each flip, the first and second inputs for the function as it is currently curried are switched
-            - Flipping a function two times before adding an input will return the initial value
+        - `presorted`:
+            - Type: bool
+            - What: Whether both lists are already sorted ascending by `fn`
+            - Default: False
+            - Note: If True, a sort-merge is used that needs no extra memory
+            - Note: Raises an exception if either list turns out to be unsorted
 
-        Examples:
+        Example:
 
         ```
-        def concat(a,b,c,d):
-            return str(a)+str(b)+str(c)+str(d)
+        a=[{'id':1, 'v':'a'}, {'id':2, 'v':'b'}]
+        b=[{'id':2, 'v':'x'}, {'id':3, 'v':'c'}]
+        pamda.differenceBy(lambda x: x['id'], a, b) #=> [{'id':1, 'v':'a'}]
+        ```
+        """
+        if presorted:
+            return list(__mergeSetOp__(True, False, False, a, b, fn))
+        try:
+            return __difference__(a, b, fn)
+        except TypeError:
+            return __difference__(a, b, lambda x: __fingerprint__(fn(x)))
+
+    def differenceExternal(
+        self,
+        path: list | str | int | tuple,
+        a,
+        b,
+        chunk_size: int = 100000,
+        temp_dir: str | None = None,
+    ):
+        """
+        Function:
+
+        - Lazily gets the items present in the first iterable but not the second
+        - Uses an external sort so inputs larger than memory can be processed
+            - Each input is read in chunks of `chunk_size` items which are sorted and spilled to temp files as needed
+            - The sorted runs are lazily merged with `heapq.merge` and compared with a single sort-merge pass
+        - Returns a generator that streams the results in ascending order of their keys
+        - Returns the first item (in input order) for each distinct key
+
+        Requires:
+
+        - `path`:
+            - Type: list | str | int | tuple
+            - What: The key to compare items by
+            - Note: A str or int is a top level key, a list is a nested path and a tuple is a set of top level keys
+            - Note: Use an empty list to compare the items themselves
+        - `a`:
+            - Type: iterable
+            - What: The first iterable of items (EG: a list, a generator or a file stream)
+        - `b`:
+            - Type: iterable
+            - What: The second iterable of items (EG: a list, a generator or a file stream)
+
+        Optional:
+
+        - `chunk_size`:
+            - Type: int
+            - What: The maximum number of items (per input) held in memory while sorting
+            - Default: 100000
+        - `temp_dir`:
+            - Type: str | None
+            - What: The directory in which to spill sorted runs
+            - Default: None (the system temp directory)
+
+        Example:
+
+        ```
+        a=[{'id':3}, {'id':1}, {'id':2}]
+        b=[{'id':2}, {'id':4}]
+        list(pamda.differenceExternal('id', a, b)) #=> [{'id':1}, {'id':3}]
+        ```
+        """
+        key = __getKeyFn__(path)
+        return __mergeSetOp__(
+            True,
+            False,
+            False,
+            __externalSort__(a, key, chunk_size, temp_dir),
+            __externalSort__(b, key, chunk_size, temp_dir),
+            key,
+        )
+
+    def dissocPath(
+        self, path: list | str | int | tuple | PamdaLens, data: dict
+    ):
+        """
+        Function:
+
+        - Removes the value at the end of a path within a nested dictionary
+        - Note: This updates the object in place, but also returns the object
+
+        Requires:
+
+        - `path`:
+            - Type: list of strs | str | PamdaLens
+            - What: The path to remove from the dictionary
+            - Note: If a string is passed, assumes a single item path list with that string
+            - Note: If a lens is passed (see `pamda.lens`), its compiled deleter is used
+        - `data`:
+            - Type: dict
+            - What: A dictionary with a path to be removed
+
+        Example:
+
+        ```
+        data={'a':{'b':{'c':0,'d':1}}}
+        pamda.dissocPath(path=['a','b','c'], data=data) #=> {'a':{'b':{'d':1}}}
+        ```
+        """
+        if isinstance(path, PamdaLens):
+            return path.delete(data)
+        if not isinstance(path, list):
+            path = [path]
+        return __dissocPath__(path, data)
+
+    def dissocPathImmutable(self, path: list | str | int | tuple, data: dict):
+        """
+        Function:
+
+        - Same as `pamda.dissocPath` but returns a new dictionary instead of updating `data` in place
+        - Only the dictionaries (and lists) along the path are copied, so every untouched subtree is shared with `data`
+
+        Requires:
+
+        - `path`:
+            - Type: list of strs | str
+            - What: The path to remove from the dictionary
+            - Note: If a string is passed, assumes a single item path list with that string
+        - `data`:
+            - Type: dict
+            - What: A dictionary with a path to be removed
+
+        Example:
+
+        ```
+        data={'a':{'b':{'c':0,'d':1}}}
+        pamda.dissocPathImmutable(path=['a','b','c'], data=data) #=> {'a':{'b':{'d':1}}}
+        data #=> {'a':{'b':{'c':0,'d':1}}}
+        ```
+        """
+        if not isinstance(path, list):
+            path = [path]
+        output, path_object = __copyPath__(path, data, create=False)
+        try:
+            del path_object[path[-1]]
+        except (KeyError, IndexError, TypeError):
+            raise Exception("Path does not exist")
+        return output
+
+    def dissocPaths(self, paths: list, data: dict, prune: bool = False):
+        """
+        Function:
+
+        - Removes the values at the end of many paths within a nested dictionary
+        - Each path only descends from the end of the prefix it shares with the previous path
+            - Note: Paths grouped (or sorted) by prefix descend each shared prefix only once
+        - Paths that do not exist are ignored
+        - Note: This updates the object in place, but also returns the object
+
+        Requires:
+
+        - `paths`:
+            - Type: list of (lists | strs | ints | tuples)
+            - What: The paths to remove from the dictionary
+            - Note: If a non list path is passed, assumes a single item path list with that key
+        - `data`:
+            - Type: dict
+            - What: A dictionary with paths to be removed
+
+        Optional:
+
+        - `prune`:
+            - Type: bool
+            - What: Whether to also remove parent dictionaries (or lists) that are left empty by a removal
+            - Default: False
+            - Note: Only containers that become empty because of a removal are pruned (never `data` itself)
+
+        Example:
+
+        ```
+        data={'a':{'b':{'c':0}, 'd':1}, 'e':{'f':2}}
+        pamda.dissocPaths(paths=[['a','b','c'], ['e','f'], ['x','y']], data=data) #=> {'a':{'b':{}, 'd':1}, 'e':{}}
+        data={'a':{'b':{'c':0}, 'd':1}, 'e':{'f':2}}
+        pamda.dissocPaths(paths=[['a','b','c'], ['e','f']], data=data, prune=True) #=> {'a':{'d':1}}
+        ```
+        """
+        normalized = []
+        for path in paths:
+            if not isinstance(path, list):
+                path = [path]
+            elif len(path) == 0:
+                raise Exception(
+                    "`dissocPaths` paths must have at least one key"
+                )
+            normalized.append(path)
+        return __dissocPaths__(normalized, data, prune)
+
+    def flatten(self, data: list):
+        """
+        Function:
+
+        - Flattens a list of lists of lists ... into a single list depth first
+
+        Requires:
+
+        - `data`:
+            - Type: list of lists
+            - What: The list of lists to reduce to a single list
+        Example:
+
+        ```
+        data=[['a','b'],[1,[2]]]
+        pamda.flatten(data=data) #=> ['a','b',1,2]
+        ```
+        """
+        return __flatten__(data)
+
+    def flip(self, fn):
+        """
+        Function:
+
+        - Returns a new function equivalent to the supplied function except that the first two inputs are flipped
+
+        Requires:
+
+        - `fn`:
+            - Type: function | method
+            - What: The function or method to flip
+            - Note: This function must have an arity of at least 2 (take two inputs)
+            - Note: Only args are flipped, kwargs are passed as normal
+
+        Notes:
+
+        - Input functions are not flipped in place
+        - The returned function is a flipped version of the input function
+        - A curried function can be flipped in place by calling fn.flip()
+        - A function can be flipped multiple times:
+            - At each flip, the first and second inputs for the function as it is currently curried are switched
+            - Flipping a function two times before adding an input will return the initial value
+
+        Examples:
+
+        ```
+        def concat(a,b,c,d):
+            return str(a)+str(b)+str(c)+str(d)
 
         flip_concat=pamda.flip(concat)
 
@@ -767,15 +1372,20 @@ class pamda(pamda_utils):
         Function:
 
         - Splits a list into a list of sublists where each sublist is determined by adjacent pairwise comparisons from a provided function
+        - If `fn` is unary, it is treated as a key function and adjacent items with equal keys are grouped together
 
         Requires:
 
         - `fn`:
             - Type: function | method
             - What: The function or method to groub with
-            - Note: Must return a boolean value
-            - Note: This function must have an arity of two (take two inputs)
-            - Note: This function is applied to each item plus the next adjacent item in the list recursively
+            - Note: If this function has an arity of two (takes two inputs):
+                - It must return a boolean value
+                - It is applied to each item plus the next adjacent item in the list recursively
+            - Note: If this function has an arity of one (takes one input):
+                - It must return a value that can be compared with `==`
+                - It is applied once to each item in the list
+                - This is much faster than the pairwise comparison for large lists
         - `data`:
             - Type: list
             - What: List of items to apply the function to and then group the results
@@ -789,10 +1399,19 @@ class pamda(pamda_utils):
         data=[1,2,3,1,1,2,2,3,3,3]
         pamda.groupWith(areEqual,data) #=> [[1], [2], [3], [1, 1], [2, 2], [3, 3, 3]]
         ```
+
+        ```
+        data=[{'a':1},{'a':1},{'a':2},{'a':1}]
+        pamda.groupWith(lambda x: x['a'],data) #=> [[{'a':1},{'a':1}], [{'a':2}], [{'a':1}]]
+        ```
         """
         curried_fn = self.curry(fn)
+        if curried_fn.__arity__ == 1:
+            return __groupWithKey__(fn, data)
         if curried_fn.__arity__ != 2:
-            raise Exception("groupWith `fn` must take exactly two parameters")
+            raise Exception(
+                "groupWith `fn` must take exactly one or two parameters"
+            )
         previous = data[0]
         output = []
         sublist = [previous]
@@ -807,7 +1426,42 @@ class pamda(pamda_utils):
         output.append(sublist)
         return output
 
-    def hasPath(self, path: list | str, data: dict):
+    def groupWithSorted(self, fn, data: list):
+        """
+        Function:
+
+        - Splits a list into a list of sublists where each sublist contains all items with an equal key from a provided function
+        - Unlike `groupWith`, items do not need to be adjacent to be grouped together
+        - Groups are returned in ascending key order and items keep their original order within each group
+
+        Requires:
+
+        - `fn`:
+            - Type: function | method
+            - What: The key function to group with
+            - Note: This function must be unary (take one input)
+            - Note: Must return a sortable value (all keys must be comparable with `<`)
+        - `data`:
+            - Type: list
+            - What: List of items to apply the function to and then group the results
+
+        Example:
+
+        ```
+        data=[1,2,3,1,1,2,2,3,3,3]
+        pamda.groupWithSorted(lambda x: x, data) #=> [[1, 1, 1], [2, 2, 2], [3, 3, 3, 3]]
+        ```
+        """
+        curried_fn = self.curry(fn)
+        if curried_fn.__arity__ != 1:
+            raise Exception(
+                "groupWithSorted `fn` must only take one parameter as its input"
+            )
+        return __groupWithKey__(fn, sorted(data, key=fn))
+
+    def hasPath(
+        self, path: list | str | PamdaLens | PamdaQuery, data: dict | PamdaMap
+    ):
         """
         Function:
 
@@ -816,11 +1470,13 @@ class pamda(pamda_utils):
         Requires:
 
         - `path`:
-            - Type: list of strs | str
+            - Type: list of strs | str | PamdaLens | PamdaQuery
             - What: The path to check
             - Note: If a string is passed, assumes a single item path list with that string
+            - Note: If a lens is passed (see `pamda.lens`), its compiled accessor is used
+            - Note: If a query is passed (see `pamda.query`), checks if anything matches it
         - `data`:
-            - Type: dict
+            - Type: dict | PamdaMap
             - What: A dictionary to check if the path exists
 
         Example:
@@ -831,6 +1487,8 @@ class pamda(pamda_utils):
         pamda.hasPath(path=['a','d'], data=data) #=> False
         ```
         """
+        if isinstance(path, (PamdaLens, PamdaQuery)):
+            return path.has(data)
         if isinstance(path, str):
             path = [path]
         try:
@@ -839,11 +1497,12 @@ class pamda(pamda_utils):
         except (KeyError, IndexError, TypeError):
             return False
 
-    def hardRound(self, decimal_places: int, a: int | float):
+    def hardRound(self, decimal_places: int, a: int | float | ndarray):
         """
         Function:
 
         - Rounds to a set number of decimal places regardless of floating point math in python
+        - Note: numpy arrays are rounded element-wise with numpy
 
         Requires:
 
@@ -853,7 +1512,7 @@ class pamda(pamda_utils):
             - Default: 0
             - Notes: Negative numbers accepted (EG -1 rounds to the nearest 10)
         - `a`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The number to round
 
         Example:
@@ -864,8 +1523,48 @@ class pamda(pamda_utils):
         pamda.hardRound(-1,a) #=> 10
         ```
         """
+        if pamda_numpy.__isArray__(a):
+            return pamda_numpy.__hardRound__(decimal_places, a)
         return int(a * (10**decimal_places) + 0.5) / (10**decimal_places)
 
+    def hardRoundBatch(
+        self,
+        decimal_places: int,
+        a: int | float | list | tuple | array.array | memoryview | ndarray,
+    ):
+        """
+        Function:
+
+        - Rounds a sequence of numbers to a set number of decimal places element-wise in a single loop (see `hardRound`)
+
+        Requires:
+
+        - `decimal_places`:
+            - Type: int
+            - What: The number of decimal places to round to
+            - Notes: Negative numbers accepted (EG -1 rounds to the nearest 10)
+        - `a`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The number(s) to round
+
+        Notes:
+
+        - See `addBatch` for the notes on sequences and return types
+
+        Example:
+
+        ```
+        pamda.hardRoundBatch(1, [12.345, 1.26]) #=> [12.3, 1.3]
+        ```
+        """
+        if pamda_numpy.__isArray__(a):
+            return pamda_numpy.__hardRound__(decimal_places, a)
+        (a,), like = __broadcast__(a)
+        multiplier = 10**decimal_places
+        return __batchOutput__(
+            like, [int(i * multiplier + 0.5) / multiplier for i in a]
+        )
+
     def head(self, data: list | str):
         """
         Function:
@@ -915,20 +1614,128 @@ class pamda(pamda_utils):
             raise Exception("`a` must be an `int` or a `float`")
         return a + 1
 
-    def intersection(self, a: list, b: list):
+    def incBatch(
+        self,
+        data: int | float | list | tuple | array.array | memoryview | ndarray,
+    ):
+        """
+        Function:
+
+        - Increments a sequence of numbers by one element-wise in a single loop
+
+        Requires:
+
+        - `data`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The number(s) to increment
+
+        Notes:
+
+        - See `addBatch` for the notes on sequences and return types
+
+        Example:
+
+        ```
+        pamda.incBatch([1, 2, 3]) #=> [2, 3, 4]
+        ```
+        """
+        if pamda_numpy.__isArray__(data):
+            return data + 1
+        (data,), like = __broadcast__(data)
+        return __batchOutput__(like, [i + 1 for i in data])
+
+    def indexBy(
+        self,
+        path_or_keys: list | str | int | tuple,
+        data: list,
+        duplicates: str = "last",
+    ):
+        """
+        Function:
+
+        - Creates a lookup dictionary from the key of each item in a list to that item
+        - The dictionary is built in C level loops (no per item python function calls for flat keys)
+
+        Requires:
+
+        - `path_or_keys`:
+            - Type: list | str | int | tuple
+            - What: The key to index each item by
+            - Note: A str or int is a top level key (EG: 'id')
+            - Note: A list is a path to a nested key (EG: ['user', 'id']) where missing paths are indexed as None
+            - Note: A tuple is a set of top level keys (EG: ('id', 'date')) which are indexed as a tuple of values
+        - `data`:
+            - Type: list of dicts
+            - What: The items to index
+
+        Optional:
+
+        - `duplicates`:
+            - Type: str
+            - What: How to handle items with duplicate keys
+            - Default: "last"
+            - Options:
+                - "last": The last item with a key is kept
+                - "first": The first item with a key is kept
+                - "error": An exception is raised
+
+        Example:
+
+        ```
+        data=[
+            {'id':1, 'user':{'name':'a'}},
+            {'id':2, 'user':{'name':'b'}},
+            {'id':1, 'user':{'name':'c'}},
+        ]
+        pamda.indexBy('id', data) #=> {1: {'id':1, 'user':{'name':'c'}}, 2: {'id':2, 'user':{'name':'b'}}}
+        pamda.indexBy('id', data, duplicates='first') #=> {1: {'id':1, 'user':{'name':'a'}}, 2: {'id':2, 'user':{'name':'b'}}}
+        pamda.indexBy(['user','name'], data) #=> {'a': {...}, 'b': {...}, 'c': {...}}
+        ```
+        """
+        if duplicates not in ("last", "first", "error"):
+            raise Exception(
+                "`duplicates` must be one of 'last', 'first' or 'error'"
+            )
+        keys = list(map(__getKeyFn__(path_or_keys), data))
+        if duplicates == "first":
+            output = dict.fromkeys(keys)
+            output.update(zip(reversed(keys), reversed(data)))
+            return output
+        output = dict(zip(keys, data))
+        if duplicates == "error" and len(output) != len(data):
+            seen = set()
+            for key in keys:
+                if key in seen:
+                    raise Exception(f"Duplicate key found in indexBy: {key}")
+                seen.add(key)
+        return output
+
+    def intersection(self, a: list, b: list, presorted: bool = False):
         """
         Function:
 
         - Combines two lists into a list of no duplicates composed of those elements common to both lists
+        - Keeps the order of the first list
+        - Only the smaller list is fully loaded into a set
+        - Unhashable items (EG: dicts) are compared by value
 
         Requires:
 
         - `a`:
             - Type: list
-            - What: List of items in which to look for an intersection
+            - What: The first list of items
         - `b`:
             - Type: list
-            - What: List of items in which to look for an intersection
+            - What: The second list of items
+
+        Optional:
+
+        - `presorted`:
+            - Type: bool
+            - What: Whether both lists are already sorted ascending
+            - Default: False
+            - Note: If True, a sort-merge is used that needs no extra memory
+            - Note: Raises an exception if either list turns out to be unsorted
 
         Example:
 
@@ -938,23 +1745,261 @@ class pamda(pamda_utils):
         pamda.intersection(a=a, b=b) #=> ['b']
         ```
         """
-        return list(set(a).intersection(set(b)))
+        if presorted:
+            return list(__mergeSetOp__(False, True, False, a, b))
+        try:
+            return __intersection__(a, b)
+        except TypeError:
+            return __intersection__(a, b, __fingerprint__)
 
-    def map(self, fn, data: list | dict):
+    def intersectionBy(self, fn, a: list, b: list, presorted: bool = False):
         """
         Function:
 
-        - Maps a function over a list or a dictionary
+        - Same as `pamda.intersection` but compares items by the key returned from `fn`
+        - Returns the first item for each distinct key
+        - Useful for lists of dicts (EG: comparing records by an id)
 
         Requires:
 
         - `fn`:
             - Type: function | method
-            - What: The function or method to map over the list or dictionary
-            - Note: This function should have an arity of 1
-        - `data`:
-            - Type: list | dict
-            - What: The list or dict of items to map the function over
+            - What: A function that takes an item and returns the key to compare it by
+        - `a`:
+            - Type: list
+            - What: The first list of items
+        - `b`:
+            - Type: list
+            - What: The second list of items
+
+        Optional:
+
+        - `presorted`:
+            - Type: bool
+            - What: Whether both lists are already sorted ascending by `fn`
+            - Default: False
+            - Note: If True, a sort-merge is used that needs no extra memory
+            - Note: Raises an exception if either list turns out to be unsorted
+
+        Example:
+
+        ```
+        a=[{'id':1, 'v':'a'}, {'id':2, 'v':'b'}]
+        b=[{'id':2, 'v':'x'}, {'id':3, 'v':'c'}]
+        pamda.intersectionBy(lambda x: x['id'], a, b) #=> [{'id':2, 'v':'b'}]
+        ```
+        """
+        if presorted:
+            return list(__mergeSetOp__(False, True, False, a, b, fn))
+        try:
+            return __intersection__(a, b, fn)
+        except TypeError:
+            return __intersection__(a, b, lambda x: __fingerprint__(fn(x)))
+
+    def intersectionExternal(
+        self,
+        path: list | str | int | tuple,
+        a,
+        b,
+        chunk_size: int = 100000,
+        temp_dir: str | None = None,
+    ):
+        """
+        Function:
+
+        - Lazily gets the items (from the first iterable) present in both iterables
+        - Uses an external sort so inputs larger than memory can be processed
+            - Each input is read in chunks of `chunk_size` items which are sorted and spilled to temp files as needed
+            - The sorted runs are lazily merged with `heapq.merge` and compared with a single sort-merge pass
+        - Returns a generator that streams the results in ascending order of their keys
+        - Returns the first item (in input order) for each distinct key
+
+        Requires:
+
+        - `path`:
+            - Type: list | str | int | tuple
+            - What: The key to compare items by
+            - Note: A str or int is a top level key, a list is a nested path and a tuple is a set of top level keys
+            - Note: Use an empty list to compare the items themselves
+        - `a`:
+            - Type: iterable
+            - What: The first iterable of items (EG: a list, a generator or a file stream)
+        - `b`:
+            - Type: iterable
+            - What: The second iterable of items (EG: a list, a generator or a file stream)
+
+        Optional:
+
+        - `chunk_size`:
+            - Type: int
+            - What: The maximum number of items (per input) held in memory while sorting
+            - Default: 100000
+        - `temp_dir`:
+            - Type: str | None
+            - What: The directory in which to spill sorted runs
+            - Default: None (the system temp directory)
+
+        Example:
+
+        ```
+        a=[{'id':3}, {'id':1}, {'id':2}]
+        b=[{'id':2}, {'id':4}]
+        list(pamda.intersectionExternal('id', a, b)) #=> [{'id':2}]
+        ```
+        """
+        key = __getKeyFn__(path)
+        return __mergeSetOp__(
+            False,
+            True,
+            False,
+            __externalSort__(a, key, chunk_size, temp_dir),
+            __externalSort__(b, key, chunk_size, temp_dir),
+            key,
+        )
+
+    def join(
+        self,
+        left_keys: list,
+        right_keys: list,
+        left,
+        right,
+        how: str = "inner",
+        presorted: bool = False,
+    ):
+        """
+        Function:
+
+        - Joins two lists of dictionaries on matching key values
+        - Each output item is a merged dictionary of a left item and a right item
+            - Note: If both items have the same (non join) key, the right item's value is used
+        - Items without a match (for left and outer joins) have the other side's keys filled in as None
+            - Note: The other side's keys are taken from its first item
+
+        Requires:
+
+        - `left_keys`:
+            - Type: list of strs
+            - What: The keys of the left items to join on
+        - `right_keys`:
+            - Type: list of strs
+            - What: The keys of the right items to join on
+            - Note: Must be the same length as `left_keys` (matched by position)
+        - `left`:
+            - Type: list of dicts | iterable of dicts (if presorted)
+            - What: The left items to join
+        - `right`:
+            - Type: list of dicts | iterable of dicts (if presorted)
+            - What: The right items to join
+
+        Optional:
+
+        - `how`:
+            - Type: str
+            - What: The type of join to perform
+            - Default: "inner"
+            - Options:
+                - "inner": Only items with a match on both sides
+                - "left": All left items (with matches where available)
+                - "outer": All left items (with matches where available) followed by all unmatched right items
+        - `presorted`:
+            - Type: bool
+            - What: Whether both inputs are already sorted ascending by their join keys
+            - Default: False
+            - Note: If False, a hash join is used that indexes the smaller list and returns a list in the order of `left`
+            - Note: If True, a sort-merge join is used that returns a generator in sorted key order and streams over iterables
+            - Note: Raises an exception if either input turns out to be unsorted (when presorted is True)
+
+        Example:
+
+        ```
+        users=[{'id':1, 'name':'a'}, {'id':2, 'name':'b'}]
+        orders=[{'user_id':1, 'total':5}, {'user_id':1, 'total':7}, {'user_id':3, 'total':9}]
+        pamda.join(['id'], ['user_id'], users, orders) #=> [
+        #=>     {'id':1, 'name':'a', 'user_id':1, 'total':5},
+        #=>     {'id':1, 'name':'a', 'user_id':1, 'total':7}
+        #=> ]
+        pamda.join(['id'], ['user_id'], users, orders, how='left')[-1]
+        #=> {'id':2, 'name':'b', 'user_id':None, 'total':None}
+        ```
+        """
+        if how not in ("inner", "left", "outer"):
+            raise Exception("`how` must be one of 'inner', 'left' or 'outer'")
+        if len(left_keys) != len(right_keys):
+            raise Exception(
+                "`left_keys` and `right_keys` must be the same length"
+            )
+        left_key = __getKeyFn__(tuple(left_keys))
+        right_key = __getKeyFn__(tuple(right_keys))
+        if not presorted:
+            if not isinstance(left, list) or not isinstance(right, list):
+                raise Exception(
+                    "`left` and `right` must be lists unless presorted"
+                )
+            left_nulls = dict.fromkeys(left[0]) if left else {}
+            right_nulls = dict.fromkeys(right[0]) if right else {}
+            return __hashJoin__(
+                left_key, right_key, left, right, how, left_nulls, right_nulls
+            )
+        left, right = iter(left), iter(right)
+        first_left, first_right = next(left, None), next(right, None)
+        if first_left is not None:
+            left = chain([first_left], left)
+        if first_right is not None:
+            right = chain([first_right], right)
+        return __mergeJoin__(
+            left_key,
+            right_key,
+            left,
+            right,
+            how,
+            dict.fromkeys(first_left or {}),
+            dict.fromkeys(first_right or {}),
+        )
+
+    def lens(self, path: list | str | int | tuple):
+        """
+        Function:
+
+        - Compiles a path into a lens with specialized get, getOr, has, set and delete accessors
+        - Each accessor is generated as straight-line code for the exact depth of the path
+        - Lenses can be passed as the path to `path`, `pathOr`, `hasPath`, `assocPath`, `dissocPath`, `pluck` and `pluckIf` and as `value_key` or `path_keys` items in `nest`/`nestItem`
+        - Lenses are callable (returning `get`), so they can also be used as key functions (EG: in `sortBy` or `countBy`)
+
+        Requires:
+
+        - `path`:
+            - Type: list | str | int | tuple
+            - What: The path to compile
+            - Note: If a non list is passed, assumes a single item path list with that key
+
+        Example:
+
+        ```
+        lens = pamda.lens(['a','b'])
+        data = [{'a':{'b':1}}, {'a':{'b':2}}, {'a':{}}]
+        pamda.pluck(lens, data) #=> [1, 2, None]
+        lens.getOr(0, data[2]) #=> 0
+        lens.set(3, data[2]) #=> {'a':{'b':3}}
+        lens.has(data[2]) #=> True
+        ```
+        """
+        return PamdaLens(path)
+
+    def map(self, fn, data: list | dict):
+        """
+        Function:
+
+        - Maps a function over a list or a dictionary
+
+        Requires:
+
+        - `fn`:
+            - Type: function | method
+            - What: The function or method to map over the list or dictionary
+            - Note: This function should have an arity of 1
+        - `data`:
+            - Type: list | dict
+            - What: The list or dict of items to map the function over
 
         Examples:
 
@@ -990,16 +2035,17 @@ class pamda(pamda_utils):
         else:
             return [fn(i) for i in data]
 
-    def mean(self, data: list):
+    def mean(self, data: list | ndarray):
         """
         Function:
 
         - Calculates the mean of a given list
+        - Note: numpy arrays (and large numeric lists if opted in with `pamda.pamda_numpy.useNumpy`) are processed with numpy
 
         Requires:
 
         - `data`:
-            - Type: list of (floats | ints)
+            - Type: list of (floats | ints) | numpy.ndarray
             - What: The list with wich to calculate the mean
             - Note: If the length of this list is 0, returns None
 
@@ -1017,24 +2063,38 @@ class pamda(pamda_utils):
         #=> None
         ```
         """
+        array = pamda_numpy.__asNumericArray__(data)
+        if array is not None:
+            return pamda_numpy.__mean__(array)
         if len(data) == 0:
             return None
         return sum(data) / len(data)
 
-    def median(self, data: list):
+    def median(self, data: list | array.array | ndarray, inplace: bool = False):
         """
         Function:
 
         - Calculates the median of a given list
         - If the length of the list is even, calculates the mean of the two central values
+        - Uses a selection algorithm (expected O(n)) instead of sorting the list
+        - Note: numpy arrays (and large numeric lists if opted in with `pamda.pamda_numpy.useNumpy`) are processed with numpy
 
         Requires:
 
         - `data`:
-            - Type: list of (floats | ints)
+            - Type: list of (floats | ints) | array.array | numpy.ndarray
             - What: The list with wich to calculate the mean
             - Note: If the length of this list is 0, returns None
 
+        Optional:
+
+        - `inplace`:
+            - Type: bool
+            - What: Whether to partition `data` in place instead of copying it
+            - Default: False
+            - Note: This avoids copying `data` (only O(1) extra memory is used for lists and arrays), but reorders `data`
+            - Note: Lists and arrays are partitioned by Python level swaps, which is slower than partitioning a copy
+
         Examples:
 
         ```
@@ -1055,22 +2115,27 @@ class pamda(pamda_utils):
         #=> None
         ```
         """
-        if not isinstance(data, (list)):
-            raise Exception("`median` `data` must be a list")
+        array = pamda_numpy.__asNumericArray__(data)
+        if array is not None:
+            return pamda_numpy.__median__(array, inplace and array is data)
         length = len(data)
         if length == 0:
             return None
-        data = sorted(data)
+        mid = length // 2
         if length % 2 == 0:
-            return (data[int(length / 2)] + data[int(length / 2) - 1]) / 2
-        return data[int(length / 2)]
+            values = __selectRanks__([mid - 1, mid], data, inplace)
+            return (values[mid] + values[mid - 1]) / 2
+        return __selectRanks__([mid], data, inplace)[mid]
 
-    def mergeDeep(self, update_data, data):
+    def mergeDeep(self, update_data, data, inplace: bool = False):
         """
         Function:
 
         - Recursively merges two nested dictionaries keeping all keys at each layer
         - Values from `update_data` are used when keys are present in both dictionaries
+        - Neither input is modified unless `inplace` is True
+        - Without `inplace`, only dictionaries with keys in both inputs are copied, every other subtree is shared with the inputs
+        - Note: Trees are walked with an explicit stack, so very deep trees do not hit the recursion limit
 
         Requires:
 
@@ -1080,6 +2145,16 @@ class pamda(pamda_utils):
         - `data`:
             - Type: any
             - What: The original data that will be merged into
+            - Note: If either input is a `PamdaMap` (see `pamda.pamda_hamt`) and the other is a PamdaMap or a dict, a new PamdaMap is returned that shares all unmerged structure
+
+        Optional:
+
+        - `inplace`:
+            - Type: bool
+            - What: Whether to merge into the dictionaries of `data` instead of copying them
+            - Default: False
+            - Note: This avoids copying every merged dictionary, but modifies `data` (subtrees of `update_data` are shared, not copied)
+            - Note: This has no effect if either input is a `PamdaMap`
 
         Example:
 
@@ -1092,30 +2167,185 @@ class pamda(pamda_utils):
         ) #=> {'a':{'b':{'c':'d','h':'i'},'e':'g'}}
         ```
         """
-        return __mergeDeep__(update_data, data)
+        if isinstance(data, (dict, PamdaMap)) and isinstance(
+            update_data, PamdaMap
+        ):
+            if isinstance(data, dict):
+                data = PamdaMap(data)
+            return data.mergeDeep(update_data)
+        if isinstance(data, PamdaMap) and isinstance(update_data, dict):
+            return data.mergeDeep(update_data)
+        return __mergeDeep__(update_data, data, inplace)
+
+    def mergeDeepMany(self, updates: list, data, inplace: bool = False):
+        """
+        Function:
+
+        - Recursively merges a list of nested dictionaries into `data` in a single traversal
+        - Equivalent to merging each update into `data` with `pamda.mergeDeep` in order (later updates take precedence)
+        - Each merged dictionary is copied once, instead of once per update as with repeated `pamda.mergeDeep` calls
+        - Neither `data` nor `updates` are modified unless `inplace` is True
+
+        Requires:
+
+        - `updates`:
+            - Type: list
+            - What: The updates to merge (in order of increasing precedence)
+        - `data`:
+            - Type: any
+            - What: The original data that will be merged into
+            - Note: If `data` or any update is a `PamdaMap` (see `pamda.pamda_hamt`), each update is merged in turn with `pamda.mergeDeep`
+
+        Optional:
+
+        - `inplace`:
+            - Type: bool
+            - What: Whether to merge into the dictionaries of `data` instead of copying them
+            - Default: False
+            - Note: The dictionaries in `updates` are never modified, but their subtrees may be shared with the output
+            - Note: This has no effect if `data` or any update is a `PamdaMap`
+
+        Example:
+
+        ```
+        data={'a':{'b':1,'c':2}}
+        overlays=[{'a':{'b':3}}, {'a':{'d':4}}, {'e':5}]
+        pamda.mergeDeepMany(overlays, data) #=> {'a':{'b':3,'c':2,'d':4},'e':5}
+        ```
+        """
+        if isinstance(data, PamdaMap) or any(
+            isinstance(update_data, PamdaMap) for update_data in updates
+        ):
+            for update_data in updates:
+                data = self.mergeDeep(update_data, data)
+            return data
+        return __mergeDeepMany__(updates, data, inplace)
 
-    def nest(self, path_keys: list, value_key: str, data: list):
+    def mergeDeepParallel(
+        self,
+        update_data,
+        data,
+        workers: int | None = None,
+        threshold: int = 100000,
+    ):
+        """
+        Function:
+
+        - Recursively merges two nested dictionaries like `pamda.mergeDeep`, but merges the top level subtrees in parallel across a process pool
+        - The top level keys found in both dictionaries are partitioned across the workers, each worker merges its subtrees independently and the results are stitched back together
+        - Falls back to `pamda.mergeDeep` if the inputs are small (see `threshold`), if there are fewer than two top level keys to merge or if fewer than two workers are available
+        - Neither input is modified
+
+        Requires:
+
+        - `update_data`:
+            - Type: any
+            - What: The new data that will take precedence during merging
+        - `data`:
+            - Type: any
+            - What: The original data that will be merged into
+
+        Optional:
+
+        - `workers`:
+            - Type: int | None
+            - What: The number of worker processes to use
+            - Default: None (the number of CPUs)
+        - `threshold`:
+            - Type: int
+            - What: The minimum number of keys (counted across every layer of both inputs) needed to merge in parallel
+            - Default: 100000
+            - Note: Subtrees are pickled to and from the workers, so small merges are faster serially
+
+        Notes:
+
+        - Merged top level subtrees are copies (returned from the workers), so they do not share structure with the inputs
+        - All values in merged subtrees must be picklable
+        - On platforms that spawn worker processes (Windows and macOS), call this from within an `if __name__ == "__main__":` block
+
+        Example:
+
+        ```
+        data={'a':{'b':{'c':'d'},'e':'f'},'x':{'y':1}}
+        update_data={'a':{'b':{'h':'i'},'e':'g'},'x':{'z':2}}
+        pamda.mergeDeepParallel(
+            update_data=update_data,
+            data=data,
+            threshold=0
+        ) #=> {'a':{'b':{'c':'d','h':'i'},'e':'g'},'x':{'y':1,'z':2}}
+        ```
+        """
+        if (
+            isinstance(data, PamdaMap)
+            or not isinstance(data, dict)
+            or not isinstance(update_data, dict)
+        ):
+            return self.mergeDeep(update_data, data)
+        if workers is None:
+            workers = os.cpu_count() or 1
+        items = [
+            (key, value, data[key])
+            for key, value in update_data.items()
+            if isinstance(value, dict) and isinstance(data.get(key), dict)
+        ]
+        workers = min(workers, len(items))
+        if (
+            workers < 2
+            or __countNodes__(data, threshold)
+            + __countNodes__(update_data, threshold)
+            < threshold
+        ):
+            return __mergeDeep__(update_data, data)
+        # Use several chunks per worker to even out unbalanced subtrees
+        n_chunks = min(len(items), workers * 4)
+        chunks = [items[i::n_chunks] for i in range(n_chunks)]
+        output = dict(data)
+        output.update(update_data)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for merged in executor.map(__mergeDeepItems__, chunks):
+                output.update(merged)
+        return output
+
+    def nest(
+        self,
+        path_keys: list,
+        value_key: str | PamdaLens | PamdaQuery,
+        data: list,
+        agg_fn=None,
+    ):
         """
         Function:
 
         - Nests a list of dictionaries into a nested dictionary
         - Similar items are appended to a list in the end of the nested dictionary
+        - Optionally reduces each of those lists with an aggregation function
 
         Requires:
 
         - `path_keys`:
-            - Type: list of strs
+            - Type: list of (strs | PamdaLens)
             - What: The variables to pull from each item in data
             - Note: Used to build out the nested dicitonary
             - Note: Order matters as the nesting occurs in order of variable
+            - Note: If a lens is passed (see `pamda.lens`), the (nested) value at its path is used
         - `value_key`:
-            - Type: str
+            - Type: str | PamdaLens | PamdaQuery
             - What: The variable to add to the list at the end of the nested dictionary path
+            - Note: If a lens is passed (see `pamda.lens`), the (nested) value at its path is used
+            - Note: If a query is passed (see `pamda.query`), every match of each item is added to the list
         - `data`:
             - Type: list of dicts
             - What: A list of dictionaries to use for nesting purposes
 
-        Example:
+        Optional:
+
+        - `agg_fn`:
+            - Type: function | method | None
+            - What: A unary function applied to each list at the end of the nested dictionary
+            - Default: None (the lists are returned as is)
+            - EG: `sum`, `len`, `pamda.mean`
+
+        Examples:
 
         ```
         data=[
@@ -1129,40 +2359,67 @@ class pamda(pamda_utils):
             data=data
         ) #=> {'a':{'b':['c','d'], 'e':['f']}}
         ```
+
+        ```
+        data=[
+            {'x_1':'a','x_2':'b', 'output':1},
+            {'x_1':'a','x_2':'b', 'output':2},
+            {'x_1':'a','x_2':'e', 'output':3}
+        ]
+        pamda.nest(
+            path_keys=['x_1','x_2'],
+            value_key='output',
+            data=data,
+            agg_fn=sum
+        ) #=> {'a':{'b':3, 'e':3}}
+        ```
         """
         if not isinstance(data, list):
             raise Exception("Attempting to `nest` an object that is not a list")
         if len(data) == 0:
             raise Exception("Attempting to `nest` from an empty list")
-        nested_output = {}
-        for items in __groupKeys__(path_keys, data):
-            nested_output = __assocPath__(
-                path=__getKeyValues__(path_keys, items[0]),
-                value=[i.get(value_key) for i in items],
-                data=nested_output,
-            )
-        return nested_output
+        return __nest__(
+            path_keys=path_keys,
+            value_fn=(
+                value_key.get
+                if isinstance(value_key, (PamdaLens, PamdaQuery))
+                else lambda item: item.get(value_key)
+            ),
+            agg_fn=agg_fn,
+            data=data,
+            extend=isinstance(value_key, PamdaQuery),
+        )
 
-    def nestItem(self, path_keys: list, data: list):
+    def nestItem(self, path_keys: list, data: list, agg_fn=None):
         """
         Function:
 
         - Nests a list of dictionaries into a nested dictionary
         - Similar items are appended to a list in the end of the nested dictionary
         - Similar to `nest`, except no values are plucked for the aggregated list
+        - Optionally reduces each of those lists with an aggregation function
 
         Requires:
 
         - `path_keys`:
-            - Type: list of strs
+            - Type: list of (strs | PamdaLens)
             - What: The variables to pull from each item in data
             - Note: Used to build out the nested dicitonary
             - Note: Order matters as the nesting occurs in order of variable
+            - Note: If a lens is passed (see `pamda.lens`), the (nested) value at its path is used
         - `data`:
             - Type: list of dicts
             - What: A list of dictionaries to use for nesting purposes
 
-        Example:
+        Optional:
+
+        - `agg_fn`:
+            - Type: function | method | None
+            - What: A unary function applied to each list of items at the end of the nested dictionary
+            - Default: None (the lists are returned as is)
+            - EG: `len`
+
+        Examples:
 
         ```
         data=[
@@ -1176,22 +2433,23 @@ class pamda(pamda_utils):
         )
         #=> {'a': {'b': [{'x_1': 'a', 'x_2': 'b'}, {'x_1': 'a', 'x_2': 'b'}], 'e': [{'x_1': 'a', 'x_2': 'e'}]}}
 
+        pamda.nestItem(
+            path_keys=['x_1','x_2'],
+            data=data,
+            agg_fn=len
+        )
+        #=> {'a': {'b': 2, 'e': 1}}
         ```
         """
         if not isinstance(data, list):
             raise Exception("Attempting to `nest` an object that is not a list")
         if len(data) == 0:
             raise Exception("Attempting to `nest` from an empty list")
-        nested_output = {}
-        for items in __groupKeys__(path_keys, data):
-            nested_output = __assocPath__(
-                path=__getKeyValues__(path_keys, items[0]),
-                value=items,
-                data=nested_output,
-            )
-        return nested_output
+        return __nest__(
+            path_keys=path_keys, value_fn=None, agg_fn=agg_fn, data=data
+        )
 
-    def path(self, path: list | str, data: dict):
+    def path(self, path: list | str | PamdaLens, data: dict | PamdaMap):
         """
         Function:
 
@@ -1200,11 +2458,12 @@ class pamda(pamda_utils):
         Requires:
 
         - `path`:
-            - Type: list of strs | str
+            - Type: list of strs | str | PamdaLens
             - What: The path to pull given the data
             - Note: If a string is passed, assumes a single item path list with that string
+            - Note: If a lens is passed (see `pamda.lens`), its compiled accessor is used
         - `data`:
-            - Type: dict
+            - Type: dict | PamdaMap
             - What: A dictionary to get the path from
 
         Example:
@@ -1214,11 +2473,15 @@ class pamda(pamda_utils):
         pamda.path(path=['a','b'], data=data) #=> 1
         ```
         """
+        if isinstance(path, PamdaLens):
+            return path.get(data)
         if isinstance(path, str):
             path = [path]
         return __pathOr__(None, path, data)
 
-    def pathOr(self, default, path: list | str, data: dict):
+    def pathOr(
+        self, default, path: list | str | PamdaLens, data: dict | PamdaMap
+    ):
         """
         Function:
 
@@ -1230,11 +2493,12 @@ class pamda(pamda_utils):
             - Type: any
             - What: The object to return if the path does not exist
         - `path`:
-            - Type: list of strs | str
+            - Type: list of strs | str | PamdaLens
             - What: The path to pull given the data
             - Note: If a string is passed, assumes a single item path list with that string
+            - Note: If a lens is passed (see `pamda.lens`), its compiled accessor is used
         - `data`:
-            - Type: dict
+            - Type: dict | PamdaMap
             - What: A dictionary to get the path from
 
         Example:
@@ -1244,6 +2508,8 @@ class pamda(pamda_utils):
         pamda.path(default=2, path=['a','c'], data=data) #=> 2
         ```
         """
+        if isinstance(path, PamdaLens):
+            return path.getOr(default, data)
         if isinstance(path, str):
             path = [path]
         try:
@@ -1302,21 +2568,44 @@ class pamda(pamda_utils):
             out = fn(out)
         return out
 
-    def pivot(self, data: list[dict] | dict[Any, list]):
+    def pivot(
+        self,
+        data: (
+            list[dict]
+            | dict[Any, list]
+            | dict[Any, ndarray]
+            | PamdaTable
+            | ndarray
+        ),
+        typed: bool = False,
+    ):
         """
         Function:
 
         - Pivots a list of dictionaries into a dictionary of lists
         - Pivots a dictionary of lists into a list of dictionaries
+        - Pivots a `PamdaTable` into a list of dictionaries
+        - Pivots a structured numpy array into a dictionary of numpy arrays (column views)
+        - Pivots a dictionary of numpy arrays into a list of dictionaries
 
         Requires:
 
         - `data`:
-            - Type: list of dicts | dict of lists
+            - Type: list of dicts | dict of lists | PamdaTable | structured numpy.ndarray | dict of numpy.ndarrays
             - What: The data to pivot
             - Note: If a list of dictionaries is passed, all dictionaries must have the same keys
             - Note: If a dictionary of lists is passed, all lists must have the same length
 
+        Optional:
+
+        - `typed`:
+            - Type: bool
+            - What: Whether to pivot a list of dictionaries into a `PamdaTable` with typed columns instead of a dictionary of lists
+            - Default: False
+            - Note: Numeric columns are stored as `array.array('q')` (ints) or `array.array('d')` (floats)
+            - Note: None values in numeric columns are tracked with a null mask (see `PamdaTable.mask`)
+            - Note: Use `PamdaTable.memoryview` for zero-copy access to the typed columns
+
         Example:
 
         ```
@@ -1325,6 +2614,7 @@ class pamda(pamda_utils):
             {'a':3,'b':4}
         ]
         pamda.pivot(data=data) #=> {'a':[1,3],'b':[2,4]}
+        pamda.pivot(data=data, typed=True).pluck('a') #=> array('q', [1, 3])
 
         data={'a':[1,3],'b':[2,4]}
         pamda.pivot(data=data)
@@ -1334,7 +2624,15 @@ class pamda(pamda_utils):
         #=> ]
         ```
         """
+        if isinstance(data, PamdaTable):
+            return data.toListOfDicts()
+        if isinstance(data, ndarray) or (
+            isinstance(data, dict) and pamda_numpy.__isArray__(*data.values())
+        ):
+            return pamda_numpy.__pivot__(data)
         if isinstance(data, list):
+            if typed:
+                return PamdaTable.fromListOfDicts(data)
             return {
                 key: [record[key] for record in data] for key in data[0].keys()
             }
@@ -1344,20 +2642,25 @@ class pamda(pamda_utils):
                 for i in range(len(data[list(data.keys())[0]]))
             ]
 
-    def pluck(self, path: list | str, data: list):
+    def pluck(
+        self, path: list | str | PamdaLens | PamdaQuery, data: list | ndarray
+    ):
         """
         Function:
 
         - Returns the values of a path within a list of nested dictionaries
+        - Returns a view of the (nested) field within a structured numpy array
 
         Requires:
 
         - `path`:
-            - Type: list of strs
+            - Type: list of strs | str | PamdaLens | PamdaQuery
             - What: The path to pull given the data
             - Note: If a string is passed, assumes a single item path list with that string
+            - Note: If a lens is passed (see `pamda.lens`), its compiled accessor is used for each item
+            - Note: If a query is passed (see `pamda.query`), every match of every item is returned in a single flat list
         - `data`:
-            - Type: list of dicts
+            - Type: list of dicts | structured numpy.ndarray
             - What: A list of dictionaries to get the path from
 
         Example:
@@ -1369,11 +2672,24 @@ class pamda(pamda_utils):
         """
         if len(data) == 0:
             raise Exception("Attempting to pluck from an empty list")
+        if isinstance(path, PamdaQuery):
+            if isinstance(data, ndarray):
+                raise Exception("Queries can not be plucked from numpy arrays")
+            get = path.get
+            return [value for item in data for value in get(item)]
+        if isinstance(path, PamdaLens):
+            if isinstance(data, ndarray):
+                return pamda_numpy.__pluck__(path.path, data)
+            return list(map(path.get, data))
         if isinstance(path, str):
             path = [path]
+        if isinstance(data, ndarray):
+            return pamda_numpy.__pluck__(path, data)
         return __pluck__(path, data)
 
-    def pluckIf(self, fn, path: list | str, data: list):
+    def pluckIf(
+        self, fn, path: list | str | PamdaLens | PamdaQuery, data: list
+    ):
         """
         Function:
 
@@ -1387,9 +2703,11 @@ class pamda(pamda_utils):
             - Note: Only items that return true are plucked
             - Note: Should be a unary function (take one input)
         - `path`:
-            - Type: list of strs
+            - Type: list of strs | str | PamdaLens | PamdaQuery
             - What: The path to pull given the data
             - Note: If a string is passed, assumes a single item path list with that string
+            - Note: If a lens is passed (see `pamda.lens`), its compiled accessor is used for each item
+            - Note: If a query is passed (see `pamda.query`), every match of every selected item is returned in a single flat list
         - `data`:
             - Type: list of dicts
             - What: A list of dictionary to get the path from
@@ -1409,6 +2727,12 @@ class pamda(pamda_utils):
             raise Exception(
                 "`pluckIf` `fn` must have an arity of 1 (take one input)"
             )
+        if isinstance(path, PamdaQuery):
+            get = path.get
+            return [value for item in data if fn(item) for value in get(item)]
+        if isinstance(path, PamdaLens):
+            get = path.get
+            return [get(i) for i in data if fn(i)]
         if isinstance(path, str):
             path = [path]
         if len(path) == 1:
@@ -1474,6 +2798,125 @@ class pamda(pamda_utils):
         """
         return [data[key] for key in keys]
 
+    def quantile(
+        self,
+        q: float | int,
+        data: list | array.array | ndarray,
+        inplace: bool = False,
+    ):
+        """
+        Function:
+
+        - Calculates a quantile of a given list
+        - Linearly interpolates between the two closest values (matching the numpy default)
+        - Uses a selection algorithm (expected O(n)) instead of sorting the list
+
+        Requires:
+
+        - `q`:
+            - Type: float | int
+            - What: The quantile to calculate
+            - Note: Must be between 0 and 1 (inclusive)
+        - `data`:
+            - Type: list of (floats | ints) | array.array | numpy.ndarray
+            - What: The list with which to calculate the quantile
+            - Note: If the length of this list is 0, returns None
+
+        Optional:
+
+        - `inplace`:
+            - Type: bool
+            - What: Whether to partition `data` in place instead of copying it
+            - Default: False
+            - Note: This avoids copying `data` (only O(1) extra memory is used for lists and arrays), but reorders `data`
+            - Note: Lists and arrays are partitioned by Python level swaps, which is slower than partitioning a copy
+
+        Example:
+
+        ```
+        data=[1,2,3,4,5]
+        pamda.quantile(0.5, data) #=> 3
+        pamda.quantile(0.9, data) #=> 4.6
+        ```
+        """
+        return self.quantiles([q], data, inplace)[0]
+
+    def quantiles(
+        self,
+        qs: list,
+        data: list | array.array | ndarray,
+        inplace: bool = False,
+    ):
+        """
+        Function:
+
+        - Calculates multiple quantiles of a given list
+        - Linearly interpolates between the two closest values (matching the numpy default)
+        - Uses a single selection pass (expected O(n)) shared by all of the quantiles instead of sorting the list
+
+        Requires:
+
+        - `qs`:
+            - Type: list of (floats | ints)
+            - What: The quantiles to calculate
+            - Note: Each must be between 0 and 1 (inclusive)
+        - `data`:
+            - Type: list of (floats | ints) | array.array | numpy.ndarray
+            - What: The list with which to calculate the quantiles
+            - Note: If the length of this list is 0, returns a list of None
+
+        Optional:
+
+        - `inplace`:
+            - Type: bool
+            - What: Whether to partition `data` in place instead of copying it
+            - Default: False
+            - Note: This avoids copying `data` (only O(1) extra memory is used for lists and arrays), but reorders `data`
+            - Note: Lists and arrays are partitioned by Python level swaps, which is slower than partitioning a copy
+
+        Example:
+
+        ```
+        data=[1,2,3,4,5]
+        pamda.quantiles([0.1, 0.5, 0.9], data) #=> [1.4, 3, 4.6]
+        ```
+        """
+        array = pamda_numpy.__asNumericArray__(data)
+        if array is not None:
+            return pamda_numpy.__quantiles__(
+                qs, array, inplace and array is data
+            )
+        return __quantiles__(qs, data, inplace)
+
+    def query(self, path: list | str | int | tuple):
+        """
+        Function:
+
+        - Compiles a path with wildcard, slice and predicate segments into a query plan that yields matches lazily
+        - Segments can be `'*'` (every value of a dict, `PamdaMap` or other Mapping or item of a list), a `slice` (the items of a list within the slice), a unary function (every value or item for which it returns a truthy value) or any other key
+        - Note: Queries with more than 16 wildcard, slice or predicate segments are interpreted instead of compiled
+        - Queries can be passed as the path to `hasPath`, `pluck` and `pluckIf` and as the `value_key` in `nest`
+        - Queries are callable (returning a list of every match)
+
+        Requires:
+
+        - `path`:
+            - Type: list | str | int | tuple
+            - What: The path to compile
+            - Note: If a non list is passed, assumes a single item path list with that key
+
+        Example:
+
+        ```
+        query = pamda.query(['users', '*', 'orders', '*', 'total'])
+        data = {'users': {'u1': {'orders': [{'total': 3}, {'total': 8}]}, 'u2': {'orders': [{'total': 9}]}}}
+        query(data) #=> [3, 8, 9]
+        list(query.items(data))[0] #=> (['users', 'u1', 'orders', 0, 'total'], 3)
+        pamda.pluck(pamda.query(['orders', lambda x: x['total'] > 5, 'total']), list(data['users'].values())) #=> [8, 9]
+        ```
+        """
+        return PamdaQuery(path)
+
     def reduce(self, fn, initial_accumulator, data: list):
         """
         Function:
@@ -1524,20 +2967,66 @@ class pamda(pamda_utils):
             acc = fn(acc, i)
         return acc
 
-    def safeDivide(self, denominator: int | float, a: int | float):
+    def rolling(self, window: int, agg, data):
+        """
+        Function:
+
+        - Calculates an aggregate over every full sliding window of `window` consecutive items
+        - Built in aggregates run in O(n) total regardless of the window size
+
+        Requires:
+
+        - `window`:
+            - Type: int
+            - What: The number of consecutive items in each window
+        - `agg`:
+            - Type: str | function | method
+            - What: The aggregate to calculate for each window
+            - Options:
+                - "sum": The sum of each window (using a running total)
+                - "mean": The mean of each window (using a running total)
+                - "min": The minimum of each window (using a monotonic deque)
+                - "max": The maximum of each window (using a monotonic deque)
+                - A function that takes a list of the window's items and returns a value (O(n*window))
+        - `data`:
+            - Type: list | iterable of (ints | floats)
+            - What: The items to aggregate (EG: a list, a generator or a file stream)
+
+        Notes:
+
+        - The output has one value per full window (`len(data) - window + 1` values)
+
+        Example:
+
+        ```
+        data=[1, 3, 2, 5, 4]
+        pamda.rolling(3, 'sum', data) #=> [6, 10, 11]
+        pamda.rolling(3, 'mean', data) #=> [2.0, 3.3333333333333335, 3.6666666666666665]
+        pamda.rolling(3, 'max', data) #=> [3, 5, 5]
+        pamda.rolling(2, lambda x: x[1] - x[0], data) #=> [2, -1, 3, -1]
+        ```
+        """
+        if window < 1:
+            raise Exception("`window` must be a positive int")
+        return __rolling__(window, agg, data)
+
+    def safeDivide(
+        self, denominator: int | float | ndarray, a: int | float | ndarray
+    ):
         """
         Function:
 
         - Forces division to work by enforcing a denominator of 1 if the provided denominator is zero
+        - Note: numpy arrays are divided element-wise with numpy
 
         Requires:
 
         - `denominator`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The denominator
 
         - `a`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The numerator
 
         Example:
@@ -1547,18 +3036,56 @@ class pamda(pamda_utils):
         pamda.safeDivide(0,10) #=> 10
         ```
         """
+        if pamda_numpy.__isArray__(denominator, a):
+            return pamda_numpy.__safeDivideDefault__(1, denominator, a)
         return a / denominator if denominator != 0 else a
 
+    def safeDivideBatch(
+        self,
+        denominator: (
+            int | float | list | tuple | array.array | memoryview | ndarray
+        ),
+        a: int | float | list | tuple | array.array | memoryview | ndarray,
+    ):
+        """
+        Function:
+
+        - Divides a sequence of numbers element-wise in a single loop enforcing a denominator of 1 where the provided denominator is zero (see `safeDivide`)
+        - Scalars are broadcast to the length of the sequences
+
+        Requires:
+
+        - `denominator`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The denominator(s)
+        - `a`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The numerator(s)
+
+        Notes:
+
+        - See `addBatch` for the notes on sequences and return types
+
+        Example:
+
+        ```
+        pamda.safeDivideBatch(2, [10, 4]) #=> [5, 2]
+        pamda.safeDivideBatch([2, 0], [10, 4]) #=> [5, 4]
+        ```
+        """
+        return self.safeDivideDefaultBatch(1, denominator, a)
+
     def safeDivideDefault(
         self,
         default_denominator: int | float,
-        denominator: int | float,
-        a: int | float,
+        denominator: int | float | ndarray,
+        a: int | float | ndarray,
     ):
         """
         Function:
 
         - Forces division to work by enforcing a non zero default denominator if the provided denominator is zero
+        - Note: numpy arrays are divided element-wise with numpy
 
         Requires:
 
@@ -1567,10 +3094,10 @@ class pamda(pamda_utils):
             - What: A non zero denominator to use if denominator is zero
             - Default: 1
         - `denominator`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The denominator
         - `a`:
-            - Type: int | float
+            - Type: int | float | numpy.ndarray
             - What: The numerator
 
         Example:
@@ -1584,22 +3111,224 @@ class pamda(pamda_utils):
             raise Exception(
                 "`safeDivideDefault` `default_denominator` can not be 0"
             )
+        if pamda_numpy.__isArray__(denominator, a):
+            return pamda_numpy.__safeDivideDefault__(
+                default_denominator, denominator, a
+            )
         return a / denominator if denominator != 0 else a / default_denominator
 
-    def symmetricDifference(self, a: list, b: list):
+    def safeDivideDefaultBatch(
+        self,
+        default_denominator: int | float,
+        denominator: (
+            int | float | list | tuple | array.array | memoryview | ndarray
+        ),
+        a: int | float | list | tuple | array.array | memoryview | ndarray,
+    ):
+        """
+        Function:
+
+        - Divides a sequence of numbers element-wise in a single loop enforcing a non zero default denominator where the provided denominator is zero (see `safeDivideDefault`)
+        - Scalars are broadcast to the length of the sequences
+
+        Requires:
+
+        - `default_denominator`:
+            - Type: int | float
+            - What: A non zero denominator to use where denominator is zero
+        - `denominator`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The denominator(s)
+        - `a`:
+            - Type: int | float | list | tuple | array.array | memoryview | numpy.ndarray
+            - What: The numerator(s)
+
+        Notes:
+
+        - See `addBatch` for the notes on sequences and return types
+
+        Example:
+
+        ```
+        pamda.safeDivideDefaultBatch(2, [5, 0], [10, 10]) #=> [2, 5]
+        ```
+        """
+        if default_denominator == 0:
+            raise Exception(
+                "`safeDivideDefaultBatch` `default_denominator` can not be 0"
+            )
+        if pamda_numpy.__isArray__(denominator, a):
+            return pamda_numpy.__safeDivideDefault__(
+                default_denominator, denominator, a
+            )
+        if isinstance(denominator, (int, float)):
+            (a,), like = __broadcast__(a)
+            if denominator == 0:
+                denominator = default_denominator
+            return __batchOutput__(like, [i / denominator for i in a])
+        (denominator, a), like = __broadcast__(denominator, a)
+        return __batchOutput__(
+            like,
+            [
+                i / (d if d != 0 else default_denominator)
+                for i, d in zip(a, denominator)
+            ],
+        )
+
+    def sortBy(self, path_or_fn, data: list, descending: bool = False):
+        """
+        Function:
+
+        - Returns a new list sorted by the key of each item
+        - Keys are computed once per item and the sort is stable
+
+        Requires:
+
+        - `path_or_fn`:
+            - Type: function | method | list | str | int | tuple
+            - What: The key to sort by
+            - Note: A function is called with each item and returns its key
+            - Note: A str or int is a top level key, a list is a nested path and a tuple is a set of top level keys (sorted in order)
+        - `data`:
+            - Type: list
+            - What: The items to sort
+
+        Optional:
+
+        - `descending`:
+            - Type: bool
+            - What: Whether to sort from the largest key to the smallest key
+            - Default: False
+
+        Example:
+
+        ```
+        data=[{'a':2, 'b':'x'}, {'a':1, 'b':'y'}, {'a':2, 'b':'z'}]
+        pamda.sortBy('a', data) #=> [{'a':1, 'b':'y'}, {'a':2, 'b':'x'}, {'a':2, 'b':'z'}]
+        pamda.sortBy(lambda x: x['b'], data, descending=True) #=> [{'a':2, 'b':'z'}, {'a':1, 'b':'y'}, {'a':2, 'b':'x'}]
+        ```
+        """
+        return sorted(data, key=__getKeyFn__(path_or_fn), reverse=descending)
+
+    def sortWith(self, specs: list, data: list):
+        """
+        Function:
+
+        - Returns a new list sorted by multiple keys, each with its own direction
+        - The sort is stable
+        - Consecutive keys with the same direction are combined so each direction change costs one sort pass
+
+        Requires:
+
+        - `specs`:
+            - Type: list of (tuples of (key, bool) | keys)
+            - What: The keys to sort by in order of priority
+            - Note: Each spec is either a key or a tuple of the key and whether to sort that key descending
+            - Note: A key is a function or method, a str or int (top level key), a tuple (set of top level keys) or a list (nested path)
+            - Note: A tuple spec is only read as `(key, descending)` if it has two items and the second is a bool, otherwise it must be a tuple of top level keys
+        - `data`:
+            - Type: list
+            - What: The items to sort
+
+        Example:
+
+        ```
+        data=[{'a':1, 'b':1}, {'a':2, 'b':1}, {'a':1, 'b':2}]
+        pamda.sortWith([('a', True), 'b'], data) #=> [{'a':2, 'b':1}, {'a':1, 'b':1}, {'a':1, 'b':2}]
+        ```
+        """
+        passes = []
+        for spec in specs:
+            if (
+                isinstance(spec, tuple)
+                and len(spec) == 2
+                and isinstance(spec[1], bool)
+            ):
+                path_or_fn, descending = spec
+            elif isinstance(spec, tuple) and (
+                len(spec) == 0
+                or not all(
+                    isinstance(i, (str, int)) and not isinstance(i, bool)
+                    for i in spec
+                )
+            ):
+                raise Exception(
+                    "Each `sortWith` spec must be a key or a (key, bool) tuple, "
+                    f"got {spec!r}"
+                )
+            else:
+                path_or_fn, descending = spec, False
+            key_fn = __getKeyFn__(path_or_fn)
+            if passes and passes[-1][1] == descending:
+                passes[-1][0].append(key_fn)
+            else:
+                passes.append(([key_fn], descending))
+        output = list(data)
+        # Stable sorts applied from the lowest priority keys to the highest
+        for key_fns, descending in reversed(passes):
+            if len(key_fns) == 1:
+                key_fn = key_fns[0]
+            else:
+                key_fn = lambda item, key_fns=key_fns: tuple(
+                    [fn(item) for fn in key_fns]
+                )
+            output.sort(key=key_fn, reverse=descending)
+        return output
+
+    def splitEvery(self, n: int, data):
+        """
+        Function:
+
+        - Lazily splits items into consecutive chunks (lists) of `n` items
+        - The last chunk may have fewer than `n` items
+        - Returns a generator, so only one chunk is held in memory at a time
+
+        Requires:
+
+        - `n`:
+            - Type: int
+            - What: The size of each chunk
+        - `data`:
+            - Type: list | iterable
+            - What: The items to split (EG: a list, a generator or a file stream)
+
+        Example:
+
+        ```
+        list(pamda.splitEvery(2, [1, 2, 3, 4, 5])) #=> [[1, 2], [3, 4], [5]]
+        ```
+        """
+        if n < 1:
+            raise Exception("`n` must be a positive int")
+        return __splitEvery__(n, data)
+
+    def symmetricDifference(self, a: list, b: list, presorted: bool = False):
         """
         Function:
 
         - Combines two lists into a list of no duplicates items present in one list but not the other
+        - Keeps the order of the input lists (items only in the first list come first)
+        - Only the smaller list is fully loaded into a set
+        - Unhashable items (EG: dicts) are compared by value
+        - Note: If `presorted` is True, the output is in sorted order instead
 
         Requires:
 
         - `a`:
             - Type: list
-            - What: List of items in which to look for a difference
+            - What: The first list of items
         - `b`:
             - Type: list
-            - What: List of items in which to look for a difference
+            - What: The second list of items
+
+        Optional:
+
+        - `presorted`:
+            - Type: bool
+            - What: Whether both lists are already sorted ascending
+            - Default: False
+            - Note: If True, a sort-merge is used that needs no extra memory
+            - Note: Raises an exception if either list turns out to be unsorted
 
         Example:
 
@@ -1609,7 +3338,60 @@ class pamda(pamda_utils):
         pamda.symmetricDifference(a=a, b=b) #=> ['a','c']
         ```
         """
-        return list(set(a).difference(set(b))) + list(set(b).difference(set(a)))
+        if presorted:
+            return list(__mergeSetOp__(True, False, True, a, b))
+        try:
+            return __symmetricDifference__(a, b)
+        except TypeError:
+            return __symmetricDifference__(a, b, __fingerprint__)
+
+    def symmetricDifferenceBy(
+        self, fn, a: list, b: list, presorted: bool = False
+    ):
+        """
+        Function:
+
+        - Same as `pamda.symmetricDifference` but compares items by the key returned from `fn`
+        - Returns the first item for each distinct key
+        - Useful for lists of dicts (EG: comparing records by an id)
+
+        Requires:
+
+        - `fn`:
+            - Type: function | method
+            - What: A function that takes an item and returns the key to compare it by
+        - `a`:
+            - Type: list
+            - What: The first list of items
+        - `b`:
+            - Type: list
+            - What: The second list of items
+
+        Optional:
+
+        - `presorted`:
+            - Type: bool
+            - What: Whether both lists are already sorted ascending by `fn`
+            - Default: False
+            - Note: If True, a sort-merge is used that needs no extra memory
+            - Note: Raises an exception if either list turns out to be unsorted
+
+        Example:
+
+        ```
+        a=[{'id':1, 'v':'a'}, {'id':2, 'v':'b'}]
+        b=[{'id':2, 'v':'x'}, {'id':3, 'v':'c'}]
+        pamda.symmetricDifferenceBy(lambda x: x['id'], a, b) #=> [{'id':1, 'v':'a'}, {'id':3, 'v':'c'}]
+        ```
+        """
+        if presorted:
+            return list(__mergeSetOp__(True, False, True, a, b, fn))
+        try:
+            return __symmetricDifference__(a, b, fn)
+        except TypeError:
+            return __symmetricDifference__(
+                a, b, lambda x: __fingerprint__(fn(x))
+            )
 
     def tail(self, data: list | str):
         """
@@ -1689,6 +3471,174 @@ class pamda(pamda_utils):
         fn = self.curry(fn)
         return fn.thunkify()
 
+    def topK(self, k: int, path_or_fn, data, descending: bool = True):
+        """
+        Function:
+
+        - Returns the `k` items with the largest (or smallest) keys, in sorted order
+        - Uses a heap of size `k` so the data is never fully sorted and iterables are streamed
+        - Ties keep their input order
+
+        Requires:
+
+        - `k`:
+            - Type: int
+            - What: The number of items to return
+        - `path_or_fn`:
+            - Type: function | method | list | str | int | tuple
+            - What: The key to rank by
+            - Note: A function is called with each item and returns its key
+            - Note: A str or int is a top level key, a list is a nested path and a tuple is a set of top level keys
+        - `data`:
+            - Type: list | iterable
+            - What: The items to rank (EG: a list, a generator or a file stream)
+
+        Optional:
+
+        - `descending`:
+            - Type: bool
+            - What: Whether to get the items with the largest keys (True) or the smallest keys (False)
+            - Default: True
+
+        Example:
+
+        ```
+        data=[{'a':3}, {'a':1}, {'a':5}, {'a':4}]
+        pamda.topK(2, 'a', data) #=> [{'a':5}, {'a':4}]
+        pamda.topK(2, 'a', data, descending=False) #=> [{'a':1}, {'a':3}]
+        ```
+        """
+        if descending:
+            return heapq.nlargest(k, data, key=__getKeyFn__(path_or_fn))
+        return heapq.nsmallest(k, data, key=__getKeyFn__(path_or_fn))
+
+    def uniq(self, data, lazy: bool = False):
+        """
+        Function:
+
+        - Removes duplicate items while keeping the first occurrence of each item in order
+        - Unhashable items (EG: dicts and lists) are compared by value
+
+        Requires:
+
+        - `data`:
+            - Type: list | iterable
+            - What: The items to deduplicate (EG: a list, a generator or a file stream)
+            - Note: Iterables are consumed in a single pass
+
+        Optional:
+
+        - `lazy`:
+            - Type: bool
+            - What: Whether to return a generator that yields each unique item as soon as it is read instead of a list
+            - Default: False
+            - Note: Only the seen keys are held in memory, so this can stream over large iterables
+
+        Example:
+
+        ```
+        pamda.uniq([3, 1, 3, 2, 1]) #=> [3, 1, 2]
+        pamda.uniq([{'a':1}, {'a':1}, {'a':2}]) #=> [{'a':1}, {'a':2}]
+        next(pamda.uniq(iter([3, 1, 3]), lazy=True)) #=> 3
+        ```
+        """
+        if lazy:
+            return __iterUniqBy__(None, data)
+        return __uniqBy__(None, data)
+
+    def uniqBy(self, path_or_fn, data, lazy: bool = False):
+        """
+        Function:
+
+        - Removes items with duplicate keys while keeping the first item with each key in order
+        - Unhashable keys (EG: dicts and lists) are compared by value
+
+        Requires:
+
+        - `path_or_fn`:
+            - Type: function | method | list | str | int | tuple
+            - What: The key to deduplicate by
+            - Note: A function is called with each item and returns its key
+            - Note: A str or int is a top level key, a list is a nested path and a tuple is a set of top level keys
+        - `data`:
+            - Type: list | iterable
+            - What: The items to deduplicate (EG: a list, a generator or a file stream)
+            - Note: Iterables are consumed in a single pass
+
+        Optional:
+
+        - `lazy`:
+            - Type: bool
+            - What: Whether to return a generator that yields each item with a new key as soon as it is read instead of a list
+            - Default: False
+            - Note: Only the seen keys are held in memory, so this can stream over large iterables
+
+        Example:
+
+        ```
+        data=[
+            {'event':{'id':1}, 'v':'a'},
+            {'event':{'id':2}, 'v':'b'},
+            {'event':{'id':1}, 'v':'c'},
+        ]
+        pamda.uniqBy(['event','id'], data) #=> [{'event':{'id':1}, 'v':'a'}, {'event':{'id':2}, 'v':'b'}]
+        ```
+        """
+        if lazy:
+            return __iterUniqBy__(__getKeyFn__(path_or_fn), data)
+        return __uniqBy__(__getKeyFn__(path_or_fn), data)
+
+    def uniqExternal(
+        self,
+        path: list | str | int | tuple,
+        data,
+        chunk_size: int = 100000,
+        temp_dir: str | None = None,
+    ):
+        """
+        Function:
+
+        - Lazily removes items with duplicate keys from an iterable
+        - Uses an external sort so inputs larger than memory can be processed
+            - The input is read in chunks of `chunk_size` items which are sorted and spilled to temp files as needed
+            - The sorted runs are lazily merged with `heapq.merge`
+        - Returns a generator that streams the results in ascending order of their keys
+        - Returns the first item (in input order) for each distinct key
+
+        Requires:
+
+        - `path`:
+            - Type: list | str | int | tuple
+            - What: The key to deduplicate items by
+            - Note: A str or int is a top level key, a list is a nested path and a tuple is a set of top level keys
+            - Note: Use an empty list to compare the items themselves
+        - `data`:
+            - Type: iterable
+            - What: The items to deduplicate (EG: a list, a generator or a file stream)
+
+        Optional:
+
+        - `chunk_size`:
+            - Type: int
+            - What: The maximum number of items held in memory while sorting
+            - Default: 100000
+        - `temp_dir`:
+            - Type: str | None
+            - What: The directory in which to spill sorted runs
+            - Default: None (the system temp directory)
+
+        Example:
+
+        ```
+        data=[{'id':2, 'v':'a'}, {'id':1, 'v':'b'}, {'id':2, 'v':'c'}]
+        list(pamda.uniqExternal('id', data)) #=> [{'id':1, 'v':'b'}, {'id':2, 'v':'a'}]
+        ```
+        """
+        key = __getKeyFn__(path)
+        return __uniqSorted__(
+            __externalSort__(data, key, chunk_size, temp_dir), key
+        )
+
     def unnest(self, data: list):
         """
         Function:
@@ -0,0 +1,116 @@
+import heapq, pickle, tempfile
+from itertools import groupby, islice
+
+# The maximum number of sorted runs merged at once (limits open file handles)
+__max_open_runs__ = 256
+# The number of items pickled together when spilling a run to disk
+__spill_batch_size__ = 1024
+
+
+def __spillRun__(items, temp_dir=None):
+    """
+    An internal function to write sorted items to an anonymous temp file
+
+    Items are pickled in small batches so the run can be read back lazily.
+    """
+    file = tempfile.TemporaryFile(dir=temp_dir)
+    items = iter(items)
+    while True:
+        batch = list(islice(items, __spill_batch_size__))
+        if not batch:
+            break
+        pickle.dump(batch, file, protocol=pickle.HIGHEST_PROTOCOL)
+    file.seek(0)
+    return file
+
+
+def __readRun__(file):
+    """
+    An internal generator to lazily read back (and then close) a spilled run
+    """
+    try:
+        while True:
+            try:
+                batch = pickle.load(file)
+            except EOFError:
+                return
+            yield from batch
+    finally:
+        file.close()
+
+
+def __mergeRuns__(runs: list, key, temp_dir=None):
+    """
+    An internal function to merge spilled runs into a single spilled run
+
+    The merged runs are closed as soon as the new run is written.
+    """
+    try:
+        return __spillRun__(
+            heapq.merge(*[__readRun__(i) for i in runs], key=key), temp_dir
+        )
+    finally:
+        for run in runs:
+            run.close()
+
+
+def __externalSort__(data, key, chunk_size: int, temp_dir=None):
+    """
+    An internal generator to sort any iterable with bounded memory
+
+    Function:
+
+    - Reads `data` in chunks of `chunk_size` items and sorts each chunk in memory
+    - If all of the data fits in a single chunk, it is never written to disk
+    - Otherwise each sorted chunk is spilled as a run to a temp file and the runs are lazily merged with heapq.merge
+    - The sort is stable: items with equal keys keep their input order
+    """
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise Exception("`chunk_size` must be a positive int")
+    data = iter(data)
+    # levels[i] holds the runs merged i times (older runs first), so each
+    # item is rewritten once per level instead of once per cascade merge
+    levels = [[]]
+    try:
+        while True:
+            chunk = list(islice(data, chunk_size))
+            if not chunk:
+                break
+            chunk.sort(key=key)
+            if not levels[0] and len(levels) == 1 and len(chunk) < chunk_size:
+                # Everything fit into memory
+                yield from chunk
+                return
+            levels[0].append(__spillRun__(chunk, temp_dir))
+            del chunk
+            level = 0
+            while len(levels[level]) >= __max_open_runs__:
+                # Merge a full level into one run on the next level
+                if level + 1 == len(levels):
+                    levels.append([])
+                levels[level + 1].append(
+                    __mergeRuns__(levels[level], key, temp_dir)
+                )
+                levels[level] = []
+                level += 1
+        # Older (higher level) runs come first to keep the sort stable
+        runs = [run for level in reversed(levels) for run in level]
+        levels = [runs]
+        if len(runs) > __max_open_runs__:
+            # Merge the newest runs so at most the max number are open
+            split = __max_open_runs__ - 1
+            runs[split:] = [__mergeRuns__(runs[split:], key, temp_dir)]
+        yield from heapq.merge(*[__readRun__(i) for i in runs], key=key)
+    finally:
+        for level in levels:
+            for run in level:
+                run.close()
+
+
+def __uniqSorted__(data, key):
+    """
+    An internal generator to yield the first item of each run of equal keys
+    in sorted data
+    """
+    for _, group in groupby(data, key):
+        yield next(group)
@@ -1,4 +1,7 @@
+import array, random
+from collections import deque
 from functools import reduce
+from itertools import filterfalse, groupby, islice, repeat
 from operator import itemgetter
 
 
@@ -82,14 +85,27 @@ def __groupKeys__(keys: list, data: list):
     return list(output.values())
 
 
-def __mergeDeep__(update_data, data):
+def __groupWithKey__(fn, data: list):
+    """
+    An internal version of pamda.groupWith (key mode) designed for calling speed
+
+    Uses itertools.groupby so each item's key is computed once and adjacent
+    keys are compared with C-level equality instead of a Python predicate
+    call per adjacent pair.
+    """
+    return [list(group) for _, group in groupby(data, fn)]
+
+
+def __mergeDeep__(update_data, data, inplace: bool = False):
     """
     An internal version of pamda.mergeDeep designed for calling speed
 
     Function:
 
-    - Recursively merges two nested dictionaries keeping all keys at each layer
+    - Merges two nested dictionaries keeping all keys at each layer
     - Values from `update_data` are used when keys are present in both dictionaries
+    - Uses an explicit stack instead of recursion, so tree depth is not bounded by the recursion limit
+    - Only dictionaries with keys in both inputs are copied, every other subtree is shared with the inputs
 
     Requires:
 
@@ -100,6 +116,13 @@ def __mergeDeep__(update_data, data):
         - Type: any
         - What: The original data that will be merged into
 
+    Optional:
+
+    - `inplace`:
+        - Type: bool
+        - What: Whether to merge into the dictionaries of `data` instead of copying them
+        - Default: False
+
     Example:
 
     ```
@@ -113,20 +136,122 @@ def __mergeDeep__(update_data, data):
     """
     if not isinstance(data, dict) or not isinstance(update_data, dict):
         return update_data
-    output = dict(data)
-    keys_original = set(data.keys())
-    keys_update = set(update_data.keys())
-    similar_keys = keys_original.intersection(keys_update)
-    similar_dict = {
-        key: __mergeDeep__(update_data[key], data[key]) for key in similar_keys
-    }
-    new_keys = keys_update.difference(keys_original)
-    new_dict = {key: update_data[key] for key in new_keys}
-    output.update(similar_dict)
-    output.update(new_dict)
+    output = data if inplace else dict(data)
+    stack = [(output, update_data)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        target, update = pop()
+        for key, value in update.items():
+            if isinstance(value, dict):
+                current = target.get(key)
+                if isinstance(current, dict):
+                    if not inplace:
+                        current = dict(current)
+                        target[key] = current
+                    push((current, value))
+                    continue
+            target[key] = value
     return output
 
 
+def __countNodes__(data: dict, limit: int):
+    """
+    An internal function to count the keys of every dictionary in a nested
+    dictionary, stopping early once `limit` keys have been counted
+    """
+    count = 0
+    stack = [data]
+    while stack:
+        node = stack.pop()
+        count += len(node)
+        if count >= limit:
+            break
+        stack.extend([i for i in node.values() if isinstance(i, dict)])
+    return count
+
+
+def __mergeDeepItems__(items: list):
+    """
+    An internal worker function for pamda.mergeDeepParallel
+
+    Merges a list of `(key, update_data, data)` items and returns a list of
+    `(key, merged)` items. The items are private copies (unpickled in the
+    worker process), so they are merged in place.
+    """
+    return [
+        (key, __mergeDeep__(update_data, data, True))
+        for key, update_data, data in items
+    ]
+
+
+def __mergeDeepMany__(updates: list, data, inplace: bool = False):
+    """
+    An internal function to merge a list of updates into data in a single
+    traversal
+
+    Function:
+
+    - Equivalent to merging each update (in order) into `data` with `__mergeDeep__`
+    - Each node is visited once with every update that reaches it, so each merged dictionary is copied once instead of once per update
+    - For each key, only the values after the last non dictionary value (in data then update order) are merged, since that value replaces everything before it
+    - If `inplace` is True, dictionaries from `data` are merged into directly (dictionaries from updates are never modified)
+    """
+    absent = __mergeDeepMany__
+    # Each stack item is (target, layers, owned) where `layers` are the
+    # update dicts to merge into `target` (in order) and `owned` flags that
+    # the dicts in `target` come from `data` and may be updated in place
+    root = {None: data}
+    stack = [(root, [{None: i} for i in updates], inplace)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        target, layers, owned = pop()
+        if len(layers) == 1:
+            # A single layer is a pairwise merge
+            for key, value in layers[0].items():
+                if isinstance(value, dict):
+                    current = target.get(key)
+                    if isinstance(current, dict):
+                        if not owned:
+                            current = dict(current)
+                            target[key] = current
+                        push((current, [value], owned))
+                        continue
+                target[key] = value
+            continue
+        values = {}
+        for layer in layers:
+            for key, value in layer.items():
+                try:
+                    values[key].append(value)
+                except KeyError:
+                    values[key] = [value]
+        for key, sequence in values.items():
+            last = sequence[-1]
+            if not isinstance(last, dict):
+                target[key] = last
+                continue
+            current = target.get(key, absent)
+            start = len(sequence) - 1
+            while start > 0 and isinstance(sequence[start - 1], dict):
+                start -= 1
+            if start == 0 and isinstance(current, dict):
+                if owned:
+                    child, child_owned = current, True
+                else:
+                    child, child_owned = dict(current), False
+                target[key] = child
+                push((child, sequence, child_owned))
+            elif start == len(sequence) - 1:
+                target[key] = last
+            else:
+                child = dict(sequence[start])
+                target[key] = child
+                push((child, sequence[start + 1 :], False))
+    return root[None]
+
+
 def __pathOr__(default, path: list, data: dict):
     """
     An internal version of pamda.pathOr designed for calling speed
@@ -174,6 +299,85 @@ def __pluck__(path: list, data: list):
     return [__pathOr__(None, path, i) for i in data]
 
 
+def __nest__(path_keys: list, value_fn, agg_fn, data: list, extend=False):
+    """
+    An internal version of pamda.nest / pamda.nestItem designed for calling speed
+
+    Builds the nested output in a single pass over `data`. Each record's
+    leaf list is looked up by its full key tuple, so only the first record
+    of each group walks the output tree. That walk reuses the subtree cached
+    for every prefix already seen instead of descending from the root.
+
+    Requires:
+
+    - `path_keys`:
+        - Type: list of (strs | callables)
+        - What: The keys to nest by (in order)
+        - Note: Callable keys (EG: lenses) are called with each record to get its key
+    - `value_fn`:
+        - Type: function | None
+        - What: A unary function to get the leaf value from each record
+        - Note: If None, the record itself is used
+    - `agg_fn`:
+        - Type: function | None
+        - What: A unary function applied to each leaf list once all records are nested
+        - Note: If None, leaves are left as lists
+    - `data`:
+        - Type: list of dicts
+        - What: The records to nest
+
+    Optional:
+
+    - `extend`:
+        - Type: bool
+        - What: Whether `value_fn` returns an iterable of values (EG: query matches) to add to the leaf list instead of a single value
+        - Default: False
+    """
+    depth = len(path_keys)
+    if any(callable(key) for key in path_keys):
+        # Some keys are lenses (or other accessors)
+        getters = [
+            key if callable(key) else itemgetter(key) for key in path_keys
+        ]
+        key_fn = lambda item: tuple([getter(item) for getter in getters])
+    elif depth == 1:
+        key = path_keys[0]
+        key_fn = lambda item: (item[key],)
+    else:
+        key_fn = itemgetter(*path_keys)
+    output = {}
+    # Maps a full key tuple to its leaf list
+    leaves = {}
+    # Maps a key prefix tuple to the dict found at the end of that prefix
+    subtrees = {(): output}
+    for item in data:
+        path = key_fn(item)
+        leaf = leaves.get(path)
+        if leaf is None:
+            parent = subtrees.get(path[:-1])
+            if parent is None:
+                parent = output
+                for idx in range(depth - 1):
+                    prefix = path[: idx + 1]
+                    child = subtrees.get(prefix)
+                    if child is None:
+                        child = {}
+                        parent[path[idx]] = child
+                        subtrees[prefix] = child
+                    parent = child
+            leaf = []
+            parent[path[-1]] = leaf
+            leaves[path] = leaf
+        if extend:
+            leaf.extend(value_fn(item))
+        else:
+            leaf.append(item if value_fn is None else value_fn(item))
+    if agg_fn is not None:
+        for path, leaf in leaves.items():
+            subtrees[path[:-1]][path[-1]] = agg_fn(leaf)
+    return output
+
+
 def __getKeyValues__(keys: list, data: dict):
     """
     An internal function to pluck the values of keys out of a dictionary designed for calling speed
@@ -238,3 +442,750 @@ def __unnest__(data: list):
         else:
             append(i)
     return out
+
+
+def __broadcast__(*args):
+    """
+    An internal function to line up the arguments of batch (element-wise) functions designed for calling speed
+
+    Function:
+
+    - Returns a list of iterables (one per argument) and the first sequence argument
+    - Scalars (ints and floats) are repeated to match the length of the sequences
+    - Sequences (list, tuple, array.array, memoryview) are passed through without copying
+    - If every argument is a scalar, each is wrapped in a single item list and None is returned as the sequence
+
+    Requires:
+
+    - `args`:
+        - Type: int | float | list | tuple | array.array | memoryview
+        - What: The arguments to broadcast
+        - Note: All sequences must have the same length
+    """
+    like = None
+    iterables = []
+    for arg in args:
+        if isinstance(arg, (int, float)):
+            iterables.append(arg)
+        elif like is None:
+            like = arg
+            iterables.append(arg)
+        elif len(arg) != len(like):
+            raise Exception(
+                "All sequences passed to a batch function must have the same length"
+            )
+        else:
+            iterables.append(arg)
+    if like is None:
+        return [[arg] for arg in args], None
+    return [
+        repeat(arg) if isinstance(arg, (int, float)) else arg
+        for arg in iterables
+    ], like
+
+
+def __batchOutput__(like, values: list):
+    """
+    An internal function to format the output of batch (element-wise) functions designed for calling speed
+
+    Function:
+
+    - Returns a typed `array.array` if `like` is an `array.array` or a `memoryview`
+        - The typecode of `like` is kept when possible, otherwise `'d'` is used (EG: float results of int inputs)
+    - Returns the single value if `like` is None (all scalar inputs, see `__broadcast__`)
+    - Otherwise returns `values` (a list)
+    """
+    if like is None:
+        return values[0]
+    if isinstance(like, array.array):
+        typecode = like.typecode
+    elif isinstance(like, memoryview) and like.format in array.typecodes:
+        typecode = like.format
+    else:
+        return values
+    try:
+        return array.array(typecode, values)
+    except (TypeError, OverflowError):
+        return array.array("d", values)
+
+
+def __selectRanks__(ranks: list, data: list, inplace: bool = False):
+    """
+    An internal function to select the values at multiple sorted ranks of a list designed for calling speed
+
+    Function:
+
+    - Returns a dictionary of the value at each rank (0 based index of the sorted data) without sorting the data
+    - Uses a quickselect with a random pivot and a three way partition, which is expected O(n)
+    - All ranks share each partitioning pass, only the sides that contain a requested rank are partitioned further
+
+    Requires:
+
+    - `ranks`:
+        - Type: list of ints
+        - What: The ranks to select
+    - `data`:
+        - Type: list | array.array
+        - What: The data to select from
+
+    Optional:
+
+    - `inplace`:
+        - Type: bool
+        - What: Whether to partition `data` in place instead of partitioning copies
+        - Default: False
+        - Note: Items are swapped within `data` (reordering it), so only O(1) extra memory is used per pass
+        - Note: The swaps run as Python level loops, so this is slower than partitioning copies
+    """
+    output = {}
+    randrange = random.randrange
+    if inplace:
+        stack = [(0, len(data), ranks)]
+        while stack:
+            start, end, ranks = stack.pop()
+            if end - start <= 64:
+                for idx, value in enumerate(sorted(data[start:end]), start):
+                    data[idx] = value
+                for rank in ranks:
+                    output[rank] = data[rank]
+                continue
+            pivot = data[randrange(start, end)]
+            # Three way (Dutch flag) partition of the range by swapping items
+            # into [< pivot | == pivot | > pivot] without any extra storage
+            lower, idx, upper = start, start, end - 1
+            while idx <= upper:
+                value = data[idx]
+                if value < pivot:
+                    data[idx] = data[lower]
+                    data[lower] = value
+                    lower += 1
+                    idx += 1
+                elif value > pivot:
+                    data[idx] = data[upper]
+                    data[upper] = value
+                    upper -= 1
+                else:
+                    idx += 1
+            lower_ranks = []
+            upper_ranks = []
+            for rank in ranks:
+                if rank < lower:
+                    lower_ranks.append(rank)
+                elif rank <= upper:
+                    output[rank] = pivot
+                else:
+                    upper_ranks.append(rank)
+            if lower_ranks:
+                stack.append((start, lower, lower_ranks))
+            if upper_ranks:
+                stack.append((upper + 1, end, upper_ranks))
+        return output
+    stack = [(data, 0, ranks)]
+    while stack:
+        values, offset, ranks = stack.pop()
+        if len(values) <= 64:
+            values = sorted(values)
+            for rank in ranks:
+                output[rank] = values[rank - offset]
+            continue
+        pivot = values[randrange(len(values))]
+        lower = [i for i in values if i < pivot]
+        upper = [i for i in values if i > pivot]
+        n_lower = len(lower)
+        n_lower_equal = len(values) - len(upper)
+        lower_ranks = []
+        upper_ranks = []
+        for rank in ranks:
+            if rank - offset < n_lower:
+                lower_ranks.append(rank)
+            elif rank - offset < n_lower_equal:
+                output[rank] = pivot
+            else:
+                upper_ranks.append(rank)
+        if lower_ranks:
+            stack.append((lower, offset, lower_ranks))
+        if upper_ranks:
+            stack.append((upper, offset + n_lower_equal, upper_ranks))
+    return output
+
+
+def __quantiles__(qs: list, data: list, inplace: bool = False):
+    """
+    An internal version of pamda.quantiles designed for calling speed
+
+    Uses linear interpolation between the two closest ranks (the numpy
+    default) and selects every needed rank in a single shared quickselect.
+    """
+    length = len(data)
+    if length == 0:
+        return [None for q in qs]
+    positions = []
+    for q in qs:
+        if not 0 <= q <= 1:
+            raise Exception("Quantiles must be between 0 and 1 (inclusive)")
+        position = (length - 1) * q
+        low = int(position)
+        positions.append((low, min(low + 1, length - 1), position - low))
+    ranks = sorted({rank for low, high, _ in positions for rank in (low, high)})
+    values = __selectRanks__(ranks, data, inplace)
+    return [
+        (
+            values[low]
+            if fraction == 0
+            else values[low] + (values[high] - values[low]) * fraction
+        )
+        for low, high, fraction in positions
+    ]
+
+
+def __fingerprint__(item):
+    """
+    An internal function to get a hashable fingerprint of a (possibly
+    unhashable) item so it can be used in sets and dictionary keys
+
+    Dictionaries, lists, tuples and sets are converted recursively and tagged
+    with their type so (EG) a list and a tuple with the same items differ.
+    """
+    if isinstance(item, dict):
+        return (
+            dict,
+            frozenset((k, __fingerprint__(v)) for k, v in item.items()),
+        )
+    if isinstance(item, (list, tuple)):
+        return (type(item), tuple([__fingerprint__(i) for i in item]))
+    if isinstance(item, (set, frozenset)):
+        return (set, frozenset(item))
+    return item
+
+
+def __firstByKey__(key, data: list):
+    """
+    An internal function to get a dictionary of each distinct key (in order of
+    first occurrence) to the first item in data with that key
+    """
+    if key is None:
+        return dict(zip(data, data))
+    output = {}
+    setdefault = output.setdefault
+    for item in data:
+        setdefault(key(item), item)
+    return output
+
+
+def __keysOf__(key, data: list):
+    """
+    An internal function to lazily get the key of each item in data
+    """
+    return data if key is None else map(key, data)
+
+
+def __difference__(a: list, b: list, key=None):
+    """
+    An internal version of pamda.difference and pamda.differenceBy
+
+    Keeps the order of `a` and only builds a set (or dict) from the smaller
+    input. When `a` is smaller, the intersection of its keys with `b` is
+    computed by `dict_keys & iterable`, which only stores matches.
+    """
+    if len(a) <= len(b):
+        first = __firstByKey__(key, a)
+        common = first.keys() & __keysOf__(key, b)
+        return [item for k, item in first.items() if k not in common]
+    exclude = set(__keysOf__(key, b))
+    if key is None:
+        return list(dict.fromkeys(filterfalse(exclude.__contains__, a)))
+    output = {}
+    for item in a:
+        k = key(item)
+        if k not in exclude and k not in output:
+            output[k] = item
+    return list(output.values())
+
+
+def __intersection__(a: list, b: list, key=None):
+    """
+    An internal version of pamda.intersection and pamda.intersectionBy
+
+    Keeps the order of `a` and only builds a set (or dict) from the smaller
+    input.
+    """
+    if len(a) <= len(b):
+        first = __firstByKey__(key, a)
+        common = first.keys() & __keysOf__(key, b)
+        return [item for k, item in first.items() if k in common]
+    include = set(__keysOf__(key, b))
+    if key is None:
+        return list(dict.fromkeys(filter(include.__contains__, a)))
+    output = {}
+    for item in a:
+        k = key(item)
+        if k in include and k not in output:
+            output[k] = item
+    return list(output.values())
+
+
+def __symmetricDifference__(a: list, b: list, key=None):
+    """
+    An internal version of pamda.symmetricDifference and
+    pamda.symmetricDifferenceBy
+
+    Returns the items only in `a` (in the order of `a`) followed by the items
+    only in `b` (in the order of `b`). Only the smaller input is fully
+    materialized as a dict; the larger input only stores its unmatched keys.
+    """
+    swap = len(a) > len(b)
+    small, large = (b, a) if swap else (a, b)
+    first = __firstByKey__(key, small)
+    common = first.keys() & __keysOf__(key, large)
+    small_only = [item for k, item in first.items() if k not in common]
+    if key is None:
+        large_only = list(dict.fromkeys(filterfalse(first.__contains__, large)))
+    else:
+        output = {}
+        for item in large:
+            k = key(item)
+            if k not in first and k not in output:
+                output[k] = item
+        large_only = list(output.values())
+    return large_only + small_only if swap else small_only + large_only
+
+
+def __mergeSetOp__(keep_a: bool, keep_both: bool, keep_b: bool, a, b, key=None):
+    """
+    An internal sort-merge version of the pamda set operations for inputs
+    that are already sorted (ascending) by key
+
+    Walks both inputs once with O(1) extra memory, skipping duplicate
+    (adjacent) keys. Items only in `a`, in both (the item from `a`) or only in
+    `b` are yielded according to `keep_a`, `keep_both` and `keep_b`.
+    """
+    key = (lambda x: x) if key is None else key
+    done = object()
+    a, b = iter(a), iter(b)
+
+    def advance(iterator, current):
+        for item in iterator:
+            k = key(item)
+            if k != current:
+                if k < current:
+                    raise Exception("Presorted inputs must be sorted ascending")
+                return item, k
+        return done, None
+
+    x = next(a, done)
+    y = next(b, done)
+    kx = None if x is done else key(x)
+    ky = None if y is done else key(y)
+    while x is not done or y is not done:
+        if y is done or (x is not done and kx < ky):
+            if keep_a:
+                yield x
+            x, kx = advance(a, kx)
+        elif x is done or ky < kx:
+            if keep_b:
+                yield y
+            y, ky = advance(b, ky)
+        else:
+            if keep_both:
+                yield x
+            x, kx = advance(a, kx)
+            y, ky = advance(b, ky)
+
+
+def __getKeyFn__(path_or_fn):
+    """
+    An internal function to resolve a key specification into a key function
+
+    - A function is returned as is
+    - A str or int is a flat key and uses operator.itemgetter
+    - A tuple is a set of flat keys and uses a multi-key operator.itemgetter (returning a tuple)
+    - A list is a path: an empty list returns the item itself and any other list uses a nested lookup (returning None if the path does not exist)
+    """
+    if callable(path_or_fn):
+        return path_or_fn
+    if isinstance(path_or_fn, (str, int)):
+        return itemgetter(path_or_fn)
+    if isinstance(path_or_fn, tuple):
+        if len(path_or_fn) == 1:
+            key = path_or_fn[0]
+            return lambda item: (item[key],)
+        return itemgetter(*path_or_fn)
+    if isinstance(path_or_fn, list):
+        if len(path_or_fn) == 0:
+            return lambda item: item
+        return lambda item: __pathOr__(None, path_or_fn, item)
+    raise Exception(
+        "Key must be a function, a str, an int, a tuple of keys or a list path"
+    )
+
+
+def __hashJoin__(
+    left_key,
+    right_key,
+    left: list,
+    right: list,
+    how: str,
+    left_nulls,
+    right_nulls,
+):
+    """
+    An internal hash join used by pamda.join
+
+    Builds a hash index on the smaller input and probes it with the larger
+    input. Output rows are in the order of `left` (with matches in the order
+    of `right`), followed by unmatched `right` rows for outer joins.
+    """
+    output = []
+    append = output.append
+    if len(right) <= len(left):
+        index = {}
+        for row in right:
+            index.setdefault(right_key(row), []).append(row)
+        matched = set()
+        for row in left:
+            key = left_key(row)
+            rows = index.get(key)
+            if rows is None:
+                if how != "inner":
+                    append({**right_nulls, **row})
+                continue
+            matched.add(key)
+            for other in rows:
+                append({**row, **other})
+        if how == "outer":
+            for other in right:
+                if right_key(other) not in matched:
+                    append({**left_nulls, **other})
+        return output
+    index = {}
+    for idx, row in enumerate(left):
+        index.setdefault(left_key(row), []).append(idx)
+    matches = [None] * len(left)
+    unmatched = []
+    for other in right:
+        idxs = index.get(right_key(other))
+        if idxs is None:
+            if how == "outer":
+                unmatched.append(other)
+            continue
+        for idx in idxs:
+            if matches[idx] is None:
+                matches[idx] = [other]
+            else:
+                matches[idx].append(other)
+    for row, rows in zip(left, matches):
+        if rows is None:
+            if how != "inner":
+                append({**right_nulls, **row})
+            continue
+        for other in rows:
+            append({**row, **other})
+    output.extend({**left_nulls, **other} for other in unmatched)
+    return output
+
+
+def __mergeJoin__(
+    left_key, right_key, left, right, how: str, left_nulls, right_nulls
+):
+    """
+    An internal sort-merge join used by pamda.join for presorted inputs
+
+    Walks both (ascending sorted) inputs once, grouping adjacent rows with
+    equal keys. Only the current group of `right` rows is held in memory.
+    Raises an exception if either input turns out to be unsorted.
+    """
+    left_groups = groupby(left, left_key)
+    right_groups = groupby(right, right_key)
+
+    def advance(groups, previous):
+        group = next(groups, None)
+        if (
+            group is not None
+            and previous is not None
+            and group[0] < previous[0]
+        ):
+            raise Exception(
+                "Presorted inputs must be sorted ascending by their keys"
+            )
+        return group
+
+    l = advance(left_groups, None)
+    r = advance(right_groups, None)
+    while l is not None or r is not None:
+        if r is None or (l is not None and l[0] < r[0]):
+            if how != "inner":
+                for row in l[1]:
+                    yield {**right_nulls, **row}
+            l = advance(left_groups, l)
+        elif l is None or r[0] < l[0]:
+            if how == "outer":
+                for other in r[1]:
+                    yield {**left_nulls, **other}
+            r = advance(right_groups, r)
+        else:
+            rows = list(r[1])
+            for row in l[1]:
+                for other in rows:
+                    yield {**row, **other}
+            l = advance(left_groups, l)
+            r = advance(right_groups, r)
+
+
+def __iterUniqBy__(key, data, keys=None):
+    """
+    An internal generator version of pamda.uniq and pamda.uniqBy
+
+    Items are consumed one at a time against a seen-set, falling back to a
+    value fingerprint for keys that are unhashable (EG: dicts). Each key is
+    computed once, or taken from `keys` if they were already computed.
+    """
+    seen = set()
+    add = seen.add
+    if keys is not None:
+        pairs = zip(keys, data)
+    elif key is None:
+        pairs = ((i, i) for i in data)
+    else:
+        pairs = ((key(i), i) for i in data)
+    for k, item in pairs:
+        try:
+            if k in seen:
+                continue
+            add(k)
+        except TypeError:
+            k = __fingerprint__(k)
+            if k in seen:
+                continue
+            add(k)
+        yield item
+
+
+def __uniqBy__(key, data):
+    """
+    An internal version of pamda.uniq and pamda.uniqBy
+
+    Lists with hashable keys are deduplicated with C level dict operations.
+    Otherwise `__iterUniqBy__` is used (reusing any keys already computed).
+    """
+    keys = None
+    if isinstance(data, list):
+        try:
+            if key is None:
+                return list(dict.fromkeys(data))
+            keys = list(map(key, data))
+            output = dict.fromkeys(keys)
+            output.update(zip(reversed(keys), reversed(data)))
+            return list(output.values())
+        except TypeError:
+            pass
+    return list(__iterUniqBy__(key, data, keys))
+
+
+def __rolling__(window: int, agg, data):
+    """
+    An internal version of pamda.rolling
+
+    Each window aggregate is computed incrementally in O(1) amortized time:
+
+    - sum and mean keep a running total (recomputed exactly once per `window`
+      steps so floating point drift cannot accumulate)
+    - min and max keep a monotonic deque of (index, value) candidates
+    - a callable is applied to each full window as a list (O(n*window))
+    """
+    output = []
+    append = output.append
+    if agg == "sum" or agg == "mean":
+        values = deque()
+        total = 0
+        steps = 0
+        for value in data:
+            values.append(value)
+            total += value
+            if len(values) > window:
+                total -= values.popleft()
+            steps += 1
+            if steps == window:
+                total = sum(values)
+                steps = 0
+            if len(values) == window:
+                append(total)
+        if agg == "mean":
+            return [i / window for i in output]
+        return output
+    if agg == "min" or agg == "max":
+        is_min = agg == "min"
+        candidates = deque()
+        for idx, value in enumerate(data):
+            if is_min:
+                while candidates and candidates[-1][1] >= value:
+                    candidates.pop()
+            else:
+                while candidates and candidates[-1][1] <= value:
+                    candidates.pop()
+            candidates.append((idx, value))
+            if candidates[0][0] <= idx - window:
+                candidates.popleft()
+            if idx >= window - 1:
+                append(candidates[0][1])
+        return output
+    if callable(agg):
+        values = deque(maxlen=window)
+        for value in data:
+            values.append(value)
+            if len(values) == window:
+                append(agg(list(values)))
+        return output
+    raise Exception("`agg` must be 'sum', 'mean', 'min', 'max' or a function")
+
+
+def __aperture__(n: int, data):
+    """
+    An internal generator version of pamda.aperture
+    """
+    window = deque(maxlen=n)
+    for item in data:
+        window.append(item)
+        if len(window) == n:
+            yield list(window)
+
+
+def __splitEvery__(n: int, data):
+    """
+    An internal generator version of pamda.splitEvery
+    """
+    data = iter(data)
+    while True:
+        chunk = list(islice(data, n))
+        if not chunk:
+            return
+        yield chunk
+
+
+def __assocPaths__(pairs: list, data):
+    """
+    An internal version of pamda.assocPaths designed for calling speed
+
+    Applies the (path, value) pairs in order while keeping a stack of the
+    containers along the previous path. Each pair only descends from the
+    end of the prefix it shares with the previous pair, so pairs grouped by
+    prefix walk each shared prefix once. Missing (or non dict/list) items are
+    replaced with dicts inline, exactly like __getForceDict__, so the result
+    matches calling assocPath for each pair in order.
+    """
+    previous = ()
+    nodes = [data]
+    for path, value in pairs:
+        depth = len(path) - 1
+        limit = min(depth, len(nodes) - 1)
+        idx = 0
+        while idx < limit and path[idx] == previous[idx]:
+            idx += 1
+        del nodes[idx + 1 :]
+        node = nodes[idx]
+        while idx < depth:
+            key = path[idx]
+            try:
+                child = node[key]
+                if not isinstance(child, (dict, list)):
+                    child = {}
+                    node[key] = child
+            except (KeyError, IndexError):
+                child = {}
+                node[key] = child
+            nodes.append(child)
+            node = child
+            idx += 1
+        node[path[depth]] = value
+        previous = path
+    return data
+
+
+def __dissocPath__(path: list, data):
+    """
+    An internal version of pamda.dissocPath designed for calling speed
+
+    Walks the path once (without creating or replacing any items) and removes
+    its final key, raising an exception if any part of the path is missing.
+    """
+    try:
+        node = data
+        for key in path[:-1]:
+            node = node[key]
+        del node[path[-1]]
+    except (KeyError, IndexError, TypeError):
+        raise Exception("Path does not exist")
+    return data
+
+
+def __dissocPaths__(paths: list, data, prune: bool = False):
+    """
+    An internal version of pamda.dissocPaths designed for calling speed
+
+    Removes the paths in order while keeping a stack of the containers along
+    the previous path (like __assocPaths__), so grouped paths descend each
+    shared prefix once. Missing paths are ignored. If `prune` is True, each
+    container emptied by a removal is itself removed from its parent dict
+    (recursively up to, but not including, the root).
+    """
+    previous = ()
+    nodes = [data]
+    for path in paths:
+        depth = len(path) - 1
+        limit = min(depth, len(nodes) - 1)
+        idx = 0
+        while idx < limit and path[idx] == previous[idx]:
+            idx += 1
+        del nodes[idx + 1 :]
+        previous = path
+        node = nodes[idx]
+        try:
+            while idx < depth:
+                node = node[path[idx]]
+                nodes.append(node)
+                idx += 1
+            del node[path[depth]]
+        except (KeyError, IndexError, TypeError):
+            continue
+        if prune:
+            while (
+                idx > 0
+                and len(nodes[idx]) == 0
+                and isinstance(nodes[idx - 1], dict)
+            ):
+                del nodes[idx - 1][path[idx - 1]]
+                idx -= 1
+            del nodes[idx + 1 :]
+    return data
+
+
+def __copyPath__(path: list, data, create: bool = True):
+    """
+    An internal function for immutable (structural sharing) path updates
+
+    Shallow copies `data` and every dict or list along `path[:-1]`, linking
+    each copy into its copied parent. Every other subtree is shared with the
+    original. Returns the copied root and the copied container that holds the
+    final key of the path.
+
+    If `create` is True, missing (or non dict/list) items along the path are
+    replaced with new dicts (like __getForceDict__). Otherwise an exception is
+    raised if any part of the path is missing.
+    """
+    root = data.copy()
+    node = root
+    for key in path[:-1]:
+        try:
+            child = node[key]
+            if isinstance(child, (dict, list)):
+                child = child.copy()
+            elif create:
+                child = {}
+            else:
+                raise TypeError
+        except (KeyError, IndexError, TypeError):
+            if not create:
+                raise Exception("Path does not exist")
+            child = {}
+        node[key] = child
+        node = child
+    return root, node
@@ -0,0 +1,597 @@
+from collections.abc import Mapping
+from pamda.pamda_fast import __mergeDeep__
+
+# Marks a slot pair in a bitmap node as holding a child node instead of a key
+__node__ = object()
+__absent__ = object()
+__hash_mask__ = (1 << 64) - 1
+
+
+def __itemsOf__(data):
+    """
+    An internal function to iterate the items of a dict, Mapping or PamdaMap
+    (walking the trie directly instead of looking up each key for maps)
+    """
+    if isinstance(data, PamdaMap):
+        return data.__iterItems__()
+    return data.items()
+
+
+def __hash64__(key):
+    """
+    An internal function to get an unsigned 64 bit hash of a key
+    """
+    return hash(key) & __hash_mask__
+
+
+class __BitmapNode__:
+    """
+    An internal HAMT node with up to 32 slots selected by 5 bits of the hash
+    at each level. Slots are stored as flat (key, value) pairs in `array`
+    where the key is `__node__` if the value is a child node.
+
+    Nodes are immutable unless their `edit` token matches the token of the
+    transient map that is updating them.
+    """
+
+    __slots__ = ("bitmap", "array", "edit")
+
+    def __init__(self, bitmap: int, array: list, edit):
+        self.bitmap = bitmap
+        self.array = array
+        self.edit = edit
+
+    def find(self, shift: int, hashed: int, key, default):
+        bit = 1 << ((hashed >> shift) & 31)
+        if not self.bitmap & bit:
+            return default
+        idx = 2 * (self.bitmap & (bit - 1)).bit_count()
+        k = self.array[idx]
+        if k is __node__:
+            return self.array[idx + 1].find(shift + 5, hashed, key, default)
+        if k is key or k == key:
+            return self.array[idx + 1]
+        return default
+
+    def __editable__(self, edit):
+        if edit is not None and self.edit is edit:
+            return self
+        return __BitmapNode__(self.bitmap, list(self.array), edit)
+
+    def assoc(self, edit, shift: int, hashed: int, key, value, added: list):
+        bit = 1 << ((hashed >> shift) & 31)
+        idx = 2 * (self.bitmap & (bit - 1)).bit_count()
+        if self.bitmap & bit:
+            k = self.array[idx]
+            v = self.array[idx + 1]
+            if k is __node__:
+                child = v.assoc(edit, shift + 5, hashed, key, value, added)
+                if child is v:
+                    return self
+                node = self.__editable__(edit)
+                node.array[idx + 1] = child
+                return node
+            if k is key or k == key:
+                if v is value:
+                    return self
+                node = self.__editable__(edit)
+                node.array[idx + 1] = value
+                return node
+            added[0] = True
+            node = self.__editable__(edit)
+            node.array[idx] = __node__
+            node.array[idx + 1] = __createNode__(
+                edit, shift + 5, k, v, hashed, key, value
+            )
+            return node
+        added[0] = True
+        node = self.__editable__(edit)
+        node.bitmap |= bit
+        node.array[idx:idx] = [key, value]
+        return node
+
+    def dissoc(self, edit, shift: int, hashed: int, key, removed: list):
+        bit = 1 << ((hashed >> shift) & 31)
+        if not self.bitmap & bit:
+            return self
+        idx = 2 * (self.bitmap & (bit - 1)).bit_count()
+        k = self.array[idx]
+        v = self.array[idx + 1]
+        if k is __node__:
+            child = v.dissoc(edit, shift + 5, hashed, key, removed)
+            if child is v:
+                return self
+            if child is not None:
+                node = self.__editable__(edit)
+                node.array[idx + 1] = child
+                return node
+        elif k is key or k == key:
+            removed[0] = True
+        else:
+            return self
+        if self.bitmap == bit:
+            return None
+        node = self.__editable__(edit)
+        node.bitmap ^= bit
+        del node.array[idx : idx + 2]
+        return node
+
+    def iterItems(self):
+        array = self.array
+        for idx in range(0, len(array), 2):
+            if array[idx] is __node__:
+                yield from array[idx + 1].iterItems()
+            else:
+                yield array[idx], array[idx + 1]
+
+    def iterKeys(self):
+        array = self.array
+        for idx in range(0, len(array), 2):
+            if array[idx] is __node__:
+                yield from array[idx + 1].iterKeys()
+            else:
+                yield array[idx]
+
+
+class __CollisionNode__:
+    """
+    An internal HAMT node holding keys whose full 64 bit hashes are equal
+    """
+
+    __slots__ = ("hashed", "array", "edit")
+
+    def __init__(self, hashed: int, array: list, edit):
+        self.hashed = hashed
+        self.array = array
+        self.edit = edit
+
+    def __keyIndex__(self, key):
+        array = self.array
+        for idx in range(0, len(array), 2):
+            if array[idx] is key or array[idx] == key:
+                return idx
+        return -1
+
+    def find(self, shift: int, hashed: int, key, default):
+        idx = self.__keyIndex__(key)
+        return default if idx < 0 else self.array[idx + 1]
+
+    def __editable__(self, edit):
+        if edit is not None and self.edit is edit:
+            return self
+        return __CollisionNode__(self.hashed, list(self.array), edit)
+
+    def assoc(self, edit, shift: int, hashed: int, key, value, added: list):
+        if hashed != self.hashed:
+            # Nest this node under a bitmap node so the new key can be placed
+            bit = 1 << ((self.hashed >> shift) & 31)
+            return __BitmapNode__(bit, [__node__, self], edit).assoc(
+                edit, shift, hashed, key, value, added
+            )
+        idx = self.__keyIndex__(key)
+        if idx >= 0:
+            if self.array[idx + 1] is value:
+                return self
+            node = self.__editable__(edit)
+            node.array[idx + 1] = value
+            return node
+        added[0] = True
+        node = self.__editable__(edit)
+        node.array.extend((key, value))
+        return node
+
+    def dissoc(self, edit, shift: int, hashed: int, key, removed: list):
+        idx = self.__keyIndex__(key)
+        if idx < 0:
+            return self
+        removed[0] = True
+        if len(self.array) == 2:
+            return None
+        node = self.__editable__(edit)
+        del node.array[idx : idx + 2]
+        return node
+
+    def iterItems(self):
+        array = self.array
+        for idx in range(0, len(array), 2):
+            yield array[idx], array[idx + 1]
+
+    def iterKeys(self):
+        return iter(self.array[::2])
+
+
+def __createNode__(
+    edit, shift: int, key_a, value_a, hashed_b: int, key_b, value_b
+):
+    """
+    An internal function to create a node holding two keys that share the
+    hash bits used by every level above `shift`
+    """
+    hashed_a = __hash64__(key_a)
+    if hashed_a == hashed_b:
+        return __CollisionNode__(
+            hashed_a, [key_a, value_a, key_b, value_b], edit
+        )
+    added = [False]
+    node = __BitmapNode__(0, [], edit)
+    node = node.assoc(edit, shift, hashed_a, key_a, value_a, added)
+    return node.assoc(edit, shift, hashed_b, key_b, value_b, added)
+
+
+class PamdaMap(Mapping):
+    def __init__(self, data: dict | Mapping | None = None):
+        """
+        Function:
+
+        Initialize a persistent (immutable) map backed by a hash array mapped trie (HAMT).
+        - Note: `assoc` and `dissoc` return new maps in O(log32 n) time that share all untouched structure with the original
+            - This makes snapshots and versions of large maps cheap (no full copies)
+        - Note: Maps are read compatible with dicts (`map[key]`, `get`, `in`, `len`, iteration, `keys`, `values`, `items`)
+            - They can be read with `pamda.path`, `pamda.pathOr` and `pamda.hasPath` and merged with `pamda.mergeDeep`
+        - Note: Use `transient` (or `update` / `fromDict`) for fast bulk builds
+
+        Optional:
+
+        - `data`:
+            - Type: dict | Mapping | None
+            - What: The initial items of the map (nested dicts are kept as dicts)
+            - Default: None (an empty map)
+
+        Example:
+
+        ```
+        from pamda.pamda_hamt import PamdaMap
+
+        v1 = PamdaMap({'a': 1})
+        v2 = v1.assoc('b', 2)
+        v1 #=> PamdaMap({'a': 1})
+        v2 #=> PamdaMap({'a': 1, 'b': 2})
+
+        config = PamdaMap.fromDict({'db': {'host': 'x', 'port': 1}})
+        config2 = config.assocPath(['db', 'port'], 2)
+        pamda.path(['db', 'port'], config2) #=> 2
+        config2['db'] is config['db'] #=> False (only the changed path is copied)
+        ```
+        """
+        self.root = None
+        self.count = 0
+        if data:
+            transient = PamdaTransientMap(self)
+            for key, value in __itemsOf__(data):
+                transient.assoc(key, value)
+            self.root = transient.root
+            self.count = transient.count
+
+    @classmethod
+    def __fromRoot__(cls, root, count: int):
+        output = cls.__new__(cls)
+        output.root = root
+        output.count = count
+        return output
+
+    @classmethod
+    def fromDict(cls, data: dict | Mapping, deep: bool = True):
+        """
+        Function:
+
+        - Creates a map from a dictionary (using a transient for the bulk build)
+
+        Requires:
+
+        - `data`:
+            - Type: dict | Mapping
+            - What: The dictionary to convert
+
+        Optional:
+
+        - `deep`:
+            - Type: bool
+            - What: Whether nested dictionaries are also converted into maps
+            - Default: True
+        """
+        transient = PamdaTransientMap(cls())
+        for key, value in __itemsOf__(data):
+            if deep and isinstance(value, dict):
+                value = cls.fromDict(value, deep=True)
+            transient.assoc(key, value)
+        return transient.persistent()
+
+    def toDict(self, deep: bool = True):
+        """
+        Function:
+
+        - Returns the map as a dictionary
+
+        Optional:
+
+        - `deep`:
+            - Type: bool
+            - What: Whether nested maps are also converted into dictionaries
+            - Default: True
+        """
+        if not deep:
+            return dict(self.__iterItems__())
+        return {
+            key: (
+                value.toDict(deep=True)
+                if isinstance(value, PamdaMap)
+                else value
+            )
+            for key, value in self.__iterItems__()
+        }
+
+    def __repr__(self):
+        return f"PamdaMap({dict(self.__iterItems__())!r})"
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        if self.root is not None:
+            value = self.root.find(0, __hash64__(key), key, __absent__)
+            if value is not __absent__:
+                return value
+        raise KeyError(key)
+
+    def get(self, key, default=None):
+        if self.root is None:
+            return default
+        return self.root.find(0, __hash64__(key), key, default)
+
+    def __contains__(self, key):
+        return (
+            self.root is not None
+            and self.root.find(0, __hash64__(key), key, __absent__)
+            is not __absent__
+        )
+
+    def __iter__(self):
+        if self.root is not None:
+            yield from self.root.iterKeys()
+
+    def __iterItems__(self):
+        """
+        Lazily yields each (key, value) pair of the map by walking the trie
+        """
+        if self.root is not None:
+            yield from self.root.iterItems()
+
+    def assoc(self, key, value):
+        """
+        Function:
+
+        - Returns a new map with `key` set to `value`
+        - Only the O(log32 n) nodes along the key's hash path are copied
+
+        Requires:
+
+        - `key`:
+            - Type: any hashable
+            - What: The key to set
+        - `value`:
+            - Type: any
+            - What: The value to set
+        """
+        added = [False]
+        root = (
+            self.root if self.root is not None else __BitmapNode__(0, [], None)
+        )
+        root = root.assoc(None, 0, __hash64__(key), key, value, added)
+        if root is self.root:
+            return self
+        return PamdaMap.__fromRoot__(root, self.count + added[0])
+
+    def dissoc(self, key):
+        """
+        Function:
+
+        - Returns a new map without `key` (or this map if `key` is not present)
+        - Only the O(log32 n) nodes along the key's hash path are copied
+
+        Requires:
+
+        - `key`:
+            - Type: any hashable
+            - What: The key to remove
+        """
+        if self.root is None:
+            return self
+        removed = [False]
+        root = self.root.dissoc(None, 0, __hash64__(key), key, removed)
+        if not removed[0]:
+            return self
+        return PamdaMap.__fromRoot__(root, self.count - 1)
+
+    def update(self, data: dict | Mapping):
+        """
+        Function:
+
+        - Returns a new map with every item of `data` set (using a transient for the bulk update)
+
+        Requires:
+
+        - `data`:
+            - Type: dict | Mapping
+            - What: The items to set
+        """
+        transient = self.transient()
+        for key, value in __itemsOf__(data):
+            transient.assoc(key, value)
+        return transient.persistent()
+
+    def transient(self):
+        """
+        Function:
+
+        - Returns a transient (mutable) version of this map for fast bulk updates
+        - This map is not modified: the transient copies each node once (on first write) and then updates it in place
+        - Call `persistent` on the transient to get the resulting map
+        """
+        return PamdaTransientMap(self)
+
+    def assocPath(self, path: list, value):
+        """
+        Function:
+
+        - Returns a new map with `value` set at a nested path
+        - Missing (or non map) items along the path are replaced with new maps
+        - Only the maps along the path are copied, so every untouched subtree is shared
+
+        Requires:
+
+        - `path`:
+            - Type: list
+            - What: The path to set
+        - `value`:
+            - Type: any
+            - What: The value to set
+        """
+        if not isinstance(path, list):
+            path = [path]
+        if len(path) == 1:
+            return self.assoc(path[0], value)
+        child = self.get(path[0])
+        if not isinstance(child, PamdaMap):
+            child = PamdaMap()
+        return self.assoc(path[0], child.assocPath(path[1:], value))
+
+    def dissocPath(self, path: list):
+        """
+        Function:
+
+        - Returns a new map without the value at a nested path
+        - Raises an exception if the path does not exist
+        - Only the maps along the path are copied, so every untouched subtree is shared
+
+        Requires:
+
+        - `path`:
+            - Type: list
+            - What: The path to remove
+        """
+        if not isinstance(path, list):
+            path = [path]
+        if path[0] not in self:
+            raise Exception("Path does not exist")
+        if len(path) == 1:
+            return self.dissoc(path[0])
+        child = self[path[0]]
+        if not isinstance(child, PamdaMap):
+            raise Exception("Path does not exist")
+        return self.assoc(path[0], child.dissocPath(path[1:]))
+
+    def mergeDeep(self, update_data):
+        """
+        Function:
+
+        - Returns a new map with `update_data` recursively merged into this map (like `pamda.mergeDeep`)
+        - Values from `update_data` are used when keys are present in both
+        - Only the maps (and dicts) along merged keys are copied, so every untouched subtree is shared
+
+        Requires:
+
+        - `update_data`:
+            - Type: PamdaMap | dict
+            - What: The new data that will take precedence during merging
+
+        Notes:
+
+        - If either value under a key is a map (and the other is a map or a dict), they are merged into a new map
+        - If both values under a key are dicts, they are merged with `pamda.mergeDeep` (so maps nested inside those dicts are treated as plain values)
+        """
+        transient = self.transient()
+        for key, update_value in __itemsOf__(update_data):
+            value = self.get(key, __absent__)
+            if isinstance(value, PamdaMap):
+                if isinstance(update_value, (PamdaMap, dict)):
+                    update_value = value.mergeDeep(update_value)
+            elif isinstance(value, dict):
+                if isinstance(update_value, PamdaMap):
+                    update_value = PamdaMap(value).mergeDeep(update_value)
+                elif isinstance(update_value, dict):
+                    update_value = __mergeDeep__(update_value, value)
+            transient.assoc(key, update_value)
+        return transient.persistent()
+
+
+class PamdaTransientMap:
+    def __init__(self, source: PamdaMap):
+        """
+        Function:
+
+        Initialize a transient (mutable) map from a persistent map for fast bulk updates.
+        - Note: Nodes shared with `source` are copied on first write, after which they are updated in place
+        - Note: Call `persistent` to get the resulting PamdaMap; the transient can not be used afterwards
+
+        Requires:
+
+        - `source`:
+            - Type: PamdaMap
+            - What: The map to start from (it is never modified)
+        """
+        self.edit = object()
+        self.root = source.root
+        self.count = source.count
+
+    def __check__(self):
+        if self.edit is None:
+            raise Exception("Transient used after `persistent` was called")
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, key):
+        value = self.get(key, __absent__)
+        if value is __absent__:
+            raise KeyError(key)
+        return value
+
+    def get(self, key, default=None):
+        if self.root is None:
+            return default
+        return self.root.find(0, __hash64__(key), key, default)
+
+    def __contains__(self, key):
+        return self.get(key, __absent__) is not __absent__
+
+    def assoc(self, key, value):
+        """
+        Function:
+
+        - Sets `key` to `value` in place and returns the transient
+        """
+        self.__check__()
+        added = [False]
+        root = (
+            self.root
+            if self.root is not None
+            else __BitmapNode__(0, [], self.edit)
+        )
+        self.root = root.assoc(self.edit, 0, __hash64__(key), key, value, added)
+        self.count += added[0]
+        return self
+
+    def dissoc(self, key):
+        """
+        Function:
+
+        - Removes `key` (if present) in place and returns the transient
+        """
+        self.__check__()
+        if self.root is not None:
+            removed = [False]
+            self.root = self.root.dissoc(
+                self.edit, 0, __hash64__(key), key, removed
+            )
+            self.count -= removed[0]
+        return self
+
+    def persistent(self):
+        """
+        Function:
+
+        - Returns the resulting persistent PamdaMap and ends the transient
+        """
+        self.__check__()
+        self.edit = None
+        return PamdaMap.__fromRoot__(self.root, self.count)
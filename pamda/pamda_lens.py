@@ -0,0 +1,102 @@
+from pamda.pamda_fast import __getForceDict__
+
+
+class PamdaLens:
+    def __init__(self, path: list | str | int | tuple):
+        """
+        Function:
+
+        Initialize a lens: a path that is compiled once into specialized accessor functions.
+        - Note: Each accessor is generated as straight-line code for the exact depth of the path (EG: `data[k0][k1][k2]`)
+        - Note: This avoids normalizing the path and reducing over it on every call
+        - Note: Calling a lens (`lens(data)`) is the same as `lens.get(data)`, so lenses can be used as key functions
+
+        Methods:
+
+        - `get(data)`: Returns the value at the path or None if the path does not exist (like `pamda.path`)
+        - `getOr(default, data)`: Returns the value at the path or `default` if the path does not exist (like `pamda.pathOr`)
+        - `has(data)`: Returns whether the path exists (like `pamda.hasPath`)
+        - `set(value, data)`: Sets the value at the path, creating missing dicts along the way (like `pamda.assocPath`)
+        - `delete(data)`: Removes the value at the path or raises an exception if it does not exist (like `pamda.dissocPath`)
+        - Note: `set` and `delete` update the object in place, but also return the object
+
+        Requires:
+
+        - `path`:
+            - Type: list | str | int | tuple
+            - What: The path to compile
+            - Note: If a non list is passed, assumes a single item path list with that key
+
+        Example:
+
+        ```
+        from pamda import pamda
+
+        lens = pamda.lens(['a','b'])
+        data = {'a':{'b':1}}
+        lens.get(data) #=> 1
+        lens.set(2, data) #=> {'a':{'b':2}}
+        pamda.pluck(lens, [data, {'a':{'b':3}}]) #=> [2, 3]
+        ```
+        """
+        if not isinstance(path, list):
+            path = [path]
+        if len(path) == 0:
+            raise Exception("Lens paths must have at least one key")
+        self.path = list(path)
+        namespace = {"__getForceDict__": __getForceDict__}
+        keys = []
+        for idx, key in enumerate(self.path):
+            namespace[f"k{idx}"] = key
+            keys.append(f"[k{idx}]")
+        access = "data" + "".join(keys)
+        parent = "data" + "".join(keys[:-1])
+        walk = "".join(
+            f"    node = __getForceDict__(node, k{idx})\n"
+            for idx in range(len(keys) - 1)
+        )
+        last = f"k{len(keys) - 1}"
+        errors = "(KeyError, IndexError, TypeError)"
+        source = (
+            f"def get(data):\n"
+            f"    try:\n"
+            f"        return {access}\n"
+            f"    except {errors}:\n"
+            f"        return None\n"
+            f"def getOr(default, data):\n"
+            f"    try:\n"
+            f"        return {access}\n"
+            f"    except {errors}:\n"
+            f"        return default\n"
+            f"def has(data):\n"
+            f"    try:\n"
+            f"        {access}\n"
+            f"        return True\n"
+            f"    except {errors}:\n"
+            f"        return False\n"
+            f"def set(value, data):\n"
+            f"    node = data\n"
+            f"{walk}"
+            f"    node[{last}] = value\n"
+            f"    return data\n"
+            f"def delete(data):\n"
+            f"    try:\n"
+            f"        {parent}[{last}]\n"
+            f"        parent = {parent}\n"
+            f"    except {errors}:\n"
+            f"        raise Exception('Path does not exist')\n"
+            f"    del parent[{last}]\n"
+            f"    return data\n"
+        )
+        exec(compile(source, f"<PamdaLens {self.path!r}>", "exec"), namespace)
+        self.get = namespace["get"]
+        self.getOr = namespace["getOr"]
+        self.has = namespace["has"]
+        self.set = namespace["set"]
+        self.delete = namespace["delete"]
+
+    def __repr__(self):
+        return f"<PamdaLens path={self.path!r} at {hex(id(self))}>"
+
+    def __call__(self, data):
+        return self.get(data)
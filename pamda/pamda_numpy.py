@@ -0,0 +1,180 @@
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class __NumpyUnavailable__:
+    """
+    A placeholder type used in type annotations when numpy is not installed
+    """
+
+
+ndarray = numpy.ndarray if numpy is not None else __NumpyUnavailable__
+
+__numpy_config__ = {"enabled": False, "threshold": 100000}
+
+
+def useNumpy(enabled: bool = True, threshold: int = 100000):
+    """
+    Function:
+
+    - Opts in (or out) of the numpy backend for numeric pamda functions
+    - When enabled, numeric lists with at least `threshold` items are processed with numpy
+    - numpy arrays are always processed with numpy (regardless of this setting)
+    - Note: numpy is an optional dependency (`pip install pamda[numpy]`)
+
+    Optional:
+
+    - `enabled`:
+        - Type: bool
+        - What: Whether large numeric lists should be processed with numpy
+        - Default: True
+    - `threshold`:
+        - Type: int
+        - What: The minimum list length at which numpy is used
+        - Default: 100000
+
+    Example:
+
+    ```
+    from pamda import pamda
+    from pamda.pamda_numpy import useNumpy
+
+    useNumpy(threshold=10000)
+    pamda.median(list(range(100001))) #=> 50000 (computed with numpy)
+    ```
+    """
+    if enabled and numpy is None:
+        raise Exception(
+            "numpy is not installed. Install it with `pip install pamda[numpy]`"
+        )
+    __numpy_config__["enabled"] = enabled
+    __numpy_config__["threshold"] = threshold
+
+
+def __asNumericArray__(data):
+    """
+    An internal function to get a numeric numpy array for the numpy backend
+
+    Function:
+
+    - Returns `data` if it is already a numpy array
+    - Returns `data` as a numpy array if the backend is enabled and `data` is a numeric list of at least the threshold length
+    - Otherwise returns None (the pure python implementation should be used)
+    """
+    if numpy is None:
+        return None
+    if isinstance(data, numpy.ndarray):
+        return data
+    if (
+        __numpy_config__["enabled"]
+        and isinstance(data, list)
+        and len(data) >= __numpy_config__["threshold"]
+    ):
+        array = numpy.asarray(data)
+        if array.dtype.kind in "iuf":
+            return array
+    return None
+
+
+def __isArray__(*items):
+    """
+    An internal function to check if any of the passed items is a numpy array
+    """
+    return numpy is not None and any(
+        isinstance(i, numpy.ndarray) for i in items
+    )
+
+
+def __mean__(data):
+    """
+    An internal numpy version of pamda.mean
+    """
+    if len(data) == 0:
+        return None
+    return numpy.mean(data).item()
+
+
+def __median__(data, inplace: bool = False):
+    """
+    An internal numpy version of pamda.median
+
+    Uses numpy.partition to select only the central value(s) so results match
+    the pure python version (EG: ints are returned for odd length int data).
+    """
+    length = len(data)
+    if length == 0:
+        return None
+    mid = length // 2
+    kth = (mid - 1, mid) if length % 2 == 0 else mid
+    if inplace:
+        data.partition(kth)
+    else:
+        data = numpy.partition(data, kth)
+    if length % 2 == 0:
+        return (data[mid].item() + data[mid - 1].item()) / 2
+    return data[mid].item()
+
+
+def __clamp__(minimum, maximum, a):
+    """
+    An internal numpy version of pamda.clamp
+    """
+    return numpy.clip(a, minimum, maximum)
+
+
+def __hardRound__(decimal_places, a):
+    """
+    An internal numpy version of pamda.hardRound
+    """
+    return numpy.trunc(a * (10**decimal_places) + 0.5) / (10**decimal_places)
+
+
+def __safeDivideDefault__(default_denominator, denominator, a):
+    """
+    An internal numpy version of pamda.safeDivide and pamda.safeDivideDefault
+    """
+    return a / numpy.where(denominator == 0, default_denominator, denominator)
+
+
+def __pluck__(path: list, data):
+    """
+    An internal numpy version of pamda.pluck for structured numpy arrays
+
+    Returns a view of the (possibly nested) field without copying.
+    """
+    for key in path:
+        data = data[key]
+    return data
+
+
+def __pivot__(data):
+    """
+    An internal numpy version of pamda.pivot
+
+    Function:
+
+    - Pivots a structured numpy array into a dictionary of column views
+    - Pivots a dictionary of numpy arrays into a list of dictionaries
+        - Each column is converted with `tolist` once instead of indexing numpy scalars per item
+    """
+    if isinstance(data, numpy.ndarray):
+        return {key: data[key] for key in data.dtype.names}
+    keys = list(data.keys())
+    columns = [
+        col.tolist() if isinstance(col, numpy.ndarray) else col
+        for col in data.values()
+    ]
+    return [dict(zip(keys, row)) for row in zip(*columns)]
+
+
+def __quantiles__(qs: list, data, inplace: bool = False):
+    """
+    An internal numpy version of pamda.quantiles
+    """
+    if len(data) == 0:
+        return [None for q in qs]
+    if not all(0 <= q <= 1 for q in qs):
+        raise Exception("Quantiles must be between 0 and 1 (inclusive)")
+    return numpy.quantile(data, qs, overwrite_input=inplace).tolist()
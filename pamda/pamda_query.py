@@ -0,0 +1,251 @@
+from collections.abc import Mapping
+
+# Python limits a function to 20 statically nested blocks (each loop plus
+# the try block of a key lookup inside the innermost loop), so queries with
+# more wildcard, slice or predicate segments than this are interpreted
+# instead of compiled
+__max_compiled_loops__ = 16
+
+
+def __isLoop__(segment):
+    """
+    An internal function to check if a query segment matches many children
+    (a wildcard, slice or predicate) instead of a single key
+    """
+    return (
+        isinstance(segment, slice)
+        or callable(segment)
+        or (isinstance(segment, str) and segment == "*")
+    )
+
+
+def __children__(segment, node, keys: tuple):
+    """
+    An internal generator to yield `(keys, child)` for each child of a node
+    matched by a query segment (used by interpreted query plans)
+    """
+    if isinstance(segment, slice):
+        if isinstance(node, list):
+            yield from zip(
+                ((*keys, i) for i in range(*segment.indices(len(node)))),
+                node[segment],
+            )
+    elif isinstance(segment, str) and segment == "*" or callable(segment):
+        if isinstance(node, list):
+            items = enumerate(node)
+        elif isinstance(node, Mapping):
+            items = node.items()
+        else:
+            return
+        for key, child in items:
+            if isinstance(segment, str) or segment(child):
+                yield (*keys, key), child
+    else:
+        try:
+            child = node[segment]
+        except (KeyError, IndexError, TypeError):
+            return
+        yield (*keys, segment), child
+
+
+class PamdaQuery:
+    def __init__(self, path: list | str | int | tuple):
+        """
+        Function:
+
+        Initialize a query: a path with wildcard, slice and predicate segments that is compiled once into a plan of nested loops.
+        - Note: Like `PamdaLens`, each plan is generated as straight-line code for the exact segments of the path
+        - Note: Matches are yielded lazily, so only the matches that are consumed are ever visited
+        - Note: Calling a query (`query(data)`) returns a list of every match
+
+        Segments:
+
+        - `'*'`: Matches every value of a dict (or any Mapping, EG: a `PamdaMap`) or every item of a list
+        - `slice` (EG: `slice(0, 2)`): Matches the items of a list within the slice
+        - function: Matches every value of a dict (or any Mapping) or item of a list for which the (unary) function returns a truthy value
+        - Any other key: Matches the value at that key (like `pamda.path`), if it exists
+        - Note: Segments that do not match (missing keys or wildcards over values that are not mappings or lists) are skipped
+        - Note: Tuples (like strings) are treated as values: wildcards and slices do not iterate them, but an int key can index them
+        - Note: Queries with more than 16 wildcard, slice or predicate segments are interpreted instead of compiled (Python limits how deeply compiled loops can nest), which is slower but yields the same matches
+
+        Methods:
+
+        - `get(data)`: Returns a generator of every matching value
+        - `items(data)`: Returns a generator of `(path, value)` for every match where `path` is the concrete list of keys to the match
+        - `first(data, default=None)`: Returns the first matching value or `default` if nothing matches
+        - `has(data)`: Returns whether anything matches
+
+        Requires:
+
+        - `path`:
+            - Type: list | str | int | tuple
+            - What: The path to compile
+            - Note: If a non list is passed, assumes a single item path list with that key
+
+        Example:
+
+        ```
+        from pamda import pamda
+
+        query = pamda.query(['users', '*', 'orders', lambda x: x['total'] > 5, 'total'])
+        data = {'users': {'u1': {'orders': [{'total': 3}, {'total': 8}]}, 'u2': {'orders': [{'total': 9}]}}}
+        list(query.get(data)) #=> [8, 9]
+        list(query.items(data)) #=> [(['users', 'u1', 'orders', 1, 'total'], 8), (['users', 'u2', 'orders', 0, 'total'], 9)]
+        ```
+        """
+        if not isinstance(path, list):
+            path = [path]
+        if len(path) == 0:
+            raise Exception("Query paths must have at least one segment")
+        self.path = list(path)
+        if sum(map(__isLoop__, self.path)) > __max_compiled_loops__:
+            self.get = self.__interpretGet__
+            self.items = self.__interpretItems__
+            return
+        namespace = {"Mapping": Mapping}
+        for idx, segment in enumerate(self.path):
+            namespace[f"k{idx}"] = segment
+        source = self.__source__("get", False) + self.__source__("items", True)
+        exec(compile(source, f"<PamdaQuery {self.path!r}>", "exec"), namespace)
+        self.get = namespace["get"]
+        self.items = namespace["items"]
+
+    def __repr__(self):
+        return f"<PamdaQuery path={self.path!r} at {hex(id(self))}>"
+
+    def __call__(self, data):
+        return list(self.get(data))
+
+    def __source__(self, name: str, with_paths: bool):
+        """
+        Returns the source of a generator function that runs the query plan
+        as nested loops (one loop per wildcard, slice or predicate segment).
+        If `with_paths` is True, the concrete keys to each match are tracked
+        and yielded with it.
+        """
+        lines = [f"def {name}(data):", "    n0 = data"]
+        if with_paths:
+            lines.append("    p0 = ()")
+        depth = 1
+        for idx, segment in enumerate(self.path):
+            pad = "    " * depth
+            skip = "continue" if depth > 1 else "return"
+            node, child = f"n{idx}", f"n{idx + 1}"
+            if isinstance(segment, slice):
+                if with_paths:
+                    loop = f"zip(range(*k{idx}.indices(len({node}))), {node}[k{idx}])"
+                else:
+                    loop = f"{node}[k{idx}]"
+                lines += [
+                    f"{pad}if not isinstance({node}, list):",
+                    f"{pad}    {skip}",
+                ]
+            elif __isLoop__(segment):
+                loop = f"it{idx}"
+                values = "items" if with_paths else "values"
+                lines += [
+                    f"{pad}if isinstance({node}, dict):",
+                    f"{pad}    it{idx} = {node}.{values}()",
+                    f"{pad}elif isinstance({node}, list):",
+                    f"{pad}    it{idx} = {f'enumerate({node})' if with_paths else node}",
+                    f"{pad}elif isinstance({node}, Mapping):",
+                    f"{pad}    it{idx} = {node}.{values}()",
+                    f"{pad}else:",
+                    f"{pad}    {skip}",
+                ]
+            else:
+                lines += [
+                    f"{pad}try:",
+                    f"{pad}    {child} = {node}[k{idx}]",
+                    f"{pad}except (KeyError, IndexError, TypeError):",
+                    f"{pad}    {skip}",
+                ]
+                if with_paths:
+                    lines.append(f"{pad}p{idx + 1} = p{idx} + (k{idx},)")
+                continue
+            if with_paths:
+                lines += [
+                    f"{pad}for key, {child} in {loop}:",
+                    f"{pad}    p{idx + 1} = p{idx} + (key,)",
+                ]
+            else:
+                lines.append(f"{pad}for {child} in {loop}:")
+            depth += 1
+            if callable(segment):
+                lines += [
+                    f"{pad}    if not k{idx}({child}):",
+                    f"{pad}        continue",
+                ]
+        pad = "    " * depth
+        last = len(self.path)
+        if with_paths:
+            lines.append(f"{pad}yield list(p{last}), n{last}")
+        else:
+            lines.append(f"{pad}yield n{last}")
+        return "\n".join(lines) + "\n"
+
+    def __interpretItems__(self, data):
+        """
+        Lazily yields `(path, value)` for every match by walking the query
+        plan with an explicit stack of child iterators (one per segment)
+        instead of compiled nested loops.
+        """
+        path = self.path
+        last = len(path)
+        stack = [iter((((), data),))]
+        while stack:
+            idx = len(stack) - 1
+            for keys, node in stack[-1]:
+                if idx == last:
+                    yield list(keys), node
+                    continue
+                stack.append(__children__(path[idx], node, keys))
+                break
+            else:
+                stack.pop()
+
+    def __interpretGet__(self, data):
+        """
+        Lazily yields every matching value of an interpreted query plan
+        """
+        for _, value in self.__interpretItems__(data):
+            yield value
+
+    def first(self, data, default=None):
+        """
+        Function:
+
+        - Returns the first matching value or `default` if nothing matches
+        - Note: Stops at the first match
+
+        Requires:
+
+        - `data`:
+            - Type: any
+            - What: The data to query
+
+        Optional:
+
+        - `default`:
+            - Type: any
+            - What: The value to return if nothing matches
+            - Default: None
+        """
+        return next(self.get(data), default)
+
+    def has(self, data):
+        """
+        Function:
+
+        - Returns whether anything in `data` matches the query
+        - Note: Stops at the first match
+
+        Requires:
+
+        - `data`:
+            - Type: any
+            - What: The data to query
+        """
+        for _ in self.get(data):
+            return True
+        return False
@@ -0,0 +1,433 @@
+import random
+from hashlib import blake2b
+from itertools import islice
+from math import ceil, log
+
+
+class PamdaHyperLogLog:
+    def __init__(self, precision: int = 14):
+        """
+        Function:
+
+        Initialize an empty HyperLogLog sketch for approximate distinct counts.
+        - Note: Memory is bounded at `2**precision` bytes regardless of how many items are added
+        - Note: Sketches are mergeable, so chunks (or workers) can each be sketched separately and then combined
+
+        Optional:
+
+        - `precision`:
+            - Type: int
+            - What: The number of hash bits used to pick a register (between 4 and 18)
+            - Default: 14 (16KB of registers with a relative standard error of about 0.8%)
+            - Note: The relative standard error is about `1.04 / sqrt(2**precision)`
+
+        Example:
+
+        ```
+        from pamda.pamda_sketches import PamdaHyperLogLog
+
+        sketch = PamdaHyperLogLog().updateMany(i % 1000 for i in range(100000))
+        sketch.count() #=> ~1000
+
+        # Can be used as a reducer
+        pamda.reduce(PamdaHyperLogLog.update, PamdaHyperLogLog(), ['a', 'b', 'a']).count() #=> 2
+        ```
+        """
+        if not isinstance(precision, int) or not 4 <= precision <= 18:
+            raise Exception("`precision` must be an int between 4 and 18")
+        self.precision = precision
+        self.registers = bytearray(1 << precision)
+
+    def __repr__(self):
+        return (
+            f"<PamdaHyperLogLog precision={self.precision} at {hex(id(self))}>"
+        )
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def __hash64__(self, item):
+        """
+        Returns a stable (not randomized per process) 64 bit hash of an item
+        so sketches built in different workers can be merged.
+        """
+        if not isinstance(item, (bytes, bytearray)):
+            item = repr(item).encode()
+        return int.from_bytes(blake2b(item, digest_size=8).digest(), "big")
+
+    def update(self, item):
+        """
+        Function:
+
+        - Adds a single item to the sketch
+        - Returns the sketch so it can be used as a reducer (EG: `pamda.reduce(PamdaHyperLogLog.update, PamdaHyperLogLog(), data)`)
+
+        Requires:
+
+        - `item`:
+            - Type: any
+            - What: The item to add
+            - Note: Items are hashed by their `repr` (or their raw value for bytes)
+        """
+        return self.updateMany((item,))
+
+    def updateMany(self, data):
+        """
+        Function:
+
+        - Adds every item of an iterable to the sketch in a single pass
+        - Returns the sketch
+
+        Requires:
+
+        - `data`:
+            - Type: iterable
+            - What: The items to add (EG: a list, a generator or a file stream)
+        """
+        precision = self.precision
+        bits = 64 - precision
+        low_mask = (1 << bits) - 1
+        registers = self.registers
+        hash64 = self.__hash64__
+        for item in data:
+            hashed = hash64(item)
+            idx = hashed >> bits
+            rank = bits - (hashed & low_mask).bit_length() + 1
+            if rank > registers[idx]:
+                registers[idx] = rank
+        return self
+
+    def merge(self, other):
+        """
+        Function:
+
+        - Returns a new sketch that summarizes the items of this sketch and another sketch
+        - Note: `sketch_a + sketch_b` is equivalent to `sketch_a.merge(sketch_b)`
+
+        Requires:
+
+        - `other`:
+            - Type: PamdaHyperLogLog
+            - What: The sketch to merge with
+            - Note: Both sketches must have the same precision
+        """
+        if self.precision != other.precision:
+            raise Exception(
+                "Only sketches with the same precision can be merged"
+            )
+        output = PamdaHyperLogLog(self.precision)
+        output.registers = bytearray(map(max, self.registers, other.registers))
+        return output
+
+    def count(self):
+        """
+        Function:
+
+        - Returns the estimated number of distinct items added to the sketch
+        """
+        registers = self.registers
+        m = len(registers)
+        if m == 16:
+            alpha = 0.673
+        elif m == 32:
+            alpha = 0.697
+        elif m == 64:
+            alpha = 0.709
+        else:
+            alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum([2.0**-i for i in registers])
+        zeros = registers.count(0)
+        if estimate <= 2.5 * m and zeros > 0:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * log(m / zeros)
+        return round(estimate)
+
+    def toDict(self):
+        """
+        Function:
+
+        - Returns a JSON serializable dictionary of the sketch
+        - Use `PamdaHyperLogLog.fromDict` to restore it
+        """
+        return {
+            "type": "hyperloglog",
+            "precision": self.precision,
+            "registers": self.registers.hex(),
+        }
+
+    @classmethod
+    def fromDict(cls, data: dict):
+        """
+        Function:
+
+        - Restores a sketch from the output of `PamdaHyperLogLog.toDict`
+
+        Requires:
+
+        - `data`:
+            - Type: dict
+            - What: The serialized sketch
+        """
+        if data.get("type") != "hyperloglog":
+            raise Exception("`data` is not a serialized PamdaHyperLogLog")
+        output = cls(data["precision"])
+        registers = bytearray.fromhex(data["registers"])
+        if len(registers) != len(output.registers):
+            raise Exception("Serialized registers do not match the precision")
+        output.registers = registers
+        return output
+
+
+class PamdaQuantileSketch:
+    def __init__(self, k: int = 200):
+        """
+        Function:
+
+        Initialize an empty KLL sketch for approximate quantiles.
+        - Note: Memory is bounded at roughly `4 * k` retained items regardless of how many items are added
+        - Note: Sketches are mergeable, so chunks (or workers) can each be sketched separately and then combined
+        - Note: The min and max (quantiles 0 and 1) are tracked exactly
+
+        Optional:
+
+        - `k`:
+            - Type: int
+            - What: The size of the largest compactor, which controls the accuracy of the sketch (at least 8)
+            - Default: 200 (a rank error of roughly 1%)
+            - Note: The rank error shrinks proportionally to `1 / k`
+
+        Example:
+
+        ```
+        from pamda.pamda_sketches import PamdaQuantileSketch
+
+        sketch = PamdaQuantileSketch().updateMany(range(1000000))
+        sketch.quantile(0.99) #=> ~990000
+
+        # Can be used as a reducer
+        pamda.reduce(PamdaQuantileSketch.update, PamdaQuantileSketch(), [3, 1, 2]).quantile(0.5) #=> 2
+        ```
+        """
+        if not isinstance(k, int) or k < 8:
+            raise Exception("`k` must be an int of at least 8")
+        self.k = k
+        self.n = 0
+        self.min = None
+        self.max = None
+        self.compactors = [[]]
+
+    def __repr__(self):
+        return f"<PamdaQuantileSketch k={self.k} n={self.n} at {hex(id(self))}>"
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def __capacity__(self, level: int):
+        """
+        Returns the capacity of a compactor level. Capacities shrink
+        geometrically (by 2/3) from the top level down to a minimum of 2.
+        """
+        depth = len(self.compactors) - level - 1
+        return max(2, int(ceil(self.k * (2 / 3) ** depth)))
+
+    def __compress__(self):
+        """
+        Compacts every level (from the bottom up) that has reached its
+        capacity. Compacting a level sorts it and promotes every other item
+        (from a random offset) to the next level, doubling the weight of the
+        promoted items.
+        """
+        compactors = self.compactors
+        level = 0
+        while level < len(compactors):
+            compactor = compactors[level]
+            if len(compactor) >= self.__capacity__(level):
+                if level + 1 == len(compactors):
+                    compactors.append([])
+                compactor.sort()
+                keep = [compactor.pop()] if len(compactor) % 2 else []
+                compactors[level + 1].extend(
+                    compactor[random.getrandbits(1) :: 2]
+                )
+                compactors[level] = keep
+            level += 1
+
+    def __track__(self, chunk: list):
+        """
+        Adds a chunk of values to the lowest level and tracks the exact count,
+        min and max.
+        """
+        self.n += len(chunk)
+        chunk_min, chunk_max = min(chunk), max(chunk)
+        if self.min is None or chunk_min < self.min:
+            self.min = chunk_min
+        if self.max is None or chunk_max > self.max:
+            self.max = chunk_max
+        self.compactors[0].extend(chunk)
+        if len(self.compactors[0]) >= self.__capacity__(0):
+            self.__compress__()
+
+    def update(self, value):
+        """
+        Function:
+
+        - Adds a single value to the sketch
+        - Returns the sketch so it can be used as a reducer (EG: `pamda.reduce(PamdaQuantileSketch.update, PamdaQuantileSketch(), data)`)
+
+        Requires:
+
+        - `value`:
+            - Type: any orderable value (EG: int | float)
+            - What: The value to add
+        """
+        self.__track__([value])
+        return self
+
+    def updateMany(self, data):
+        """
+        Function:
+
+        - Adds every value of an iterable to the sketch in a single pass
+        - Values are consumed in chunks of `k`, so memory stays bounded
+        - Returns the sketch
+
+        Requires:
+
+        - `data`:
+            - Type: iterable of orderable values (EG: ints | floats)
+            - What: The values to add (EG: a list, a generator or a file stream)
+        """
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, self.k))
+            if not chunk:
+                return self
+            self.__track__(chunk)
+
+    def merge(self, other):
+        """
+        Function:
+
+        - Returns a new sketch that summarizes the values of this sketch and another sketch
+        - Note: `sketch_a + sketch_b` is equivalent to `sketch_a.merge(sketch_b)`
+
+        Requires:
+
+        - `other`:
+            - Type: PamdaQuantileSketch
+            - What: The sketch to merge with
+        """
+        output = PamdaQuantileSketch(max(self.k, other.k))
+        levels = max(len(self.compactors), len(other.compactors))
+        output.compactors = [[] for i in range(levels)]
+        for sketch in (self, other):
+            for level, compactor in enumerate(sketch.compactors):
+                output.compactors[level].extend(compactor)
+        output.n = self.n + other.n
+        mins = [i for i in (self.min, other.min) if i is not None]
+        maxs = [i for i in (self.max, other.max) if i is not None]
+        output.min = min(mins) if mins else None
+        output.max = max(maxs) if maxs else None
+        output.__compress__()
+        return output
+
+    def count(self):
+        """
+        Function:
+
+        - Returns the exact number of values added to the sketch
+        """
+        return self.n
+
+    def quantile(self, q: float | int):
+        """
+        Function:
+
+        - Returns the approximate value at quantile `q` or None if the sketch is empty
+
+        Requires:
+
+        - `q`:
+            - Type: float | int
+            - What: The quantile to get (between 0 and 1 inclusive)
+        """
+        return self.quantiles([q])[0]
+
+    def quantiles(self, qs: list):
+        """
+        Function:
+
+        - Returns the approximate values at each quantile in `qs` (sorting the retained items only once)
+        - Returns a list of None if the sketch is empty
+
+        Requires:
+
+        - `qs`:
+            - Type: list of (floats | ints)
+            - What: The quantiles to get (each between 0 and 1 inclusive)
+        """
+        if not all(0 <= q <= 1 for q in qs):
+            raise Exception("Quantiles must be between 0 and 1 (inclusive)")
+        if self.n == 0:
+            return [None for q in qs]
+        weighted = sorted(
+            (value, 1 << level)
+            for level, compactor in enumerate(self.compactors)
+            for value in compactor
+        )
+        total = sum(weight for value, weight in weighted)
+        output = []
+        for q in qs:
+            if q == 0:
+                output.append(self.min)
+                continue
+            if q == 1:
+                output.append(self.max)
+                continue
+            target = q * total
+            cumulative = 0
+            for value, weight in weighted:
+                cumulative += weight
+                if cumulative >= target:
+                    break
+            output.append(value)
+        return output
+
+    def toDict(self):
+        """
+        Function:
+
+        - Returns a serializable dictionary of the sketch
+        - The dictionary is JSON serializable if the added values are
+        - Use `PamdaQuantileSketch.fromDict` to restore it
+        """
+        return {
+            "type": "kll",
+            "k": self.k,
+            "n": self.n,
+            "min": self.min,
+            "max": self.max,
+            "compactors": [list(i) for i in self.compactors],
+        }
+
+    @classmethod
+    def fromDict(cls, data: dict):
+        """
+        Function:
+
+        - Restores a sketch from the output of `PamdaQuantileSketch.toDict`
+
+        Requires:
+
+        - `data`:
+            - Type: dict
+            - What: The serialized sketch
+        """
+        if data.get("type") != "kll":
+            raise Exception("`data` is not a serialized PamdaQuantileSketch")
+        output = cls(data["k"])
+        output.n = data["n"]
+        output.min = data["min"]
+        output.max = data["max"]
+        output.compactors = [list(i) for i in data["compactors"]]
+        return output
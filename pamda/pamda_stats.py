@@ -0,0 +1,194 @@
+from itertools import islice
+
+
+class PamdaStats:
+    def __init__(self):
+        """
+        Function:
+
+        Initialize an empty streaming statistics accumulator.
+        - Note: This computes count, mean, variance, min and max in a single pass over any iterable without storing the data
+        - Note: Accumulators are mergeable, so chunks (or workers) can each be summarized separately and then combined
+
+        Example:
+
+        ```
+        from pamda.pamda_stats import PamdaStats
+
+        stats = PamdaStats().updateMany([1, 2, 3, 4])
+        stats.mean #=> 2.5
+        stats.variance() #=> 1.6666666666666667
+
+        # Can be used as a reducer
+        pamda.reduce(PamdaStats.update, PamdaStats(), [1, 2, 3, 4]).mean #=> 2.5
+        ```
+        """
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = None
+        self.max = None
+
+    def __repr__(self):
+        return f"<PamdaStats count={self.count} mean={self.mean} at {hex(id(self))}>"
+
+    def __add__(self, other):
+        return self.merge(other)
+
+    def __mergeState__(self, count, mean, m2, minimum, maximum):
+        """
+        Merges a summary of other data into this accumulator in place using
+        the parallel variance formula (Chan et al.).
+        """
+        if count == 0:
+            return self
+        if self.count == 0:
+            self.count, self.mean, self.m2 = count, mean, m2
+            self.min, self.max = minimum, maximum
+            return self
+        total = self.count + count
+        delta = mean - self.mean
+        self.mean += delta * count / total
+        self.m2 += m2 + delta * delta * self.count * count / total
+        self.count = total
+        if minimum < self.min:
+            self.min = minimum
+        if maximum > self.max:
+            self.max = maximum
+        return self
+
+    def update(self, value: int | float):
+        """
+        Function:
+
+        - Adds a single value to the accumulator (Welford's algorithm)
+        - Returns the accumulator so it can be used as a reducer (EG: `pamda.reduce(PamdaStats.update, PamdaStats(), data)`)
+
+        Requires:
+
+        - `value`:
+            - Type: int | float
+            - What: The value to add
+        """
+        self.count += 1
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+        return self
+
+    def updateMany(self, data, chunk_size: int = 4096):
+        """
+        Function:
+
+        - Adds every value of an iterable to the accumulator in a single pass
+        - Values are consumed in chunks so count, sum, min and max run at C speed within each chunk
+        - Each chunk is summarized with a two pass variance and merged in, which keeps the result numerically stable
+        - Returns the accumulator
+
+        Requires:
+
+        - `data`:
+            - Type: iterable of (ints | floats)
+            - What: The values to add (EG: a list, a generator or a file stream)
+
+        Optional:
+
+        - `chunk_size`:
+            - Type: int
+            - What: The number of values to hold in memory at a time
+            - Default: 4096
+        """
+        iterator = iter(data)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return self
+            count = len(chunk)
+            mean = sum(chunk) / count
+            m2 = sum([(i - mean) ** 2 for i in chunk])
+            self.__mergeState__(count, mean, m2, min(chunk), max(chunk))
+
+    def merge(self, other):
+        """
+        Function:
+
+        - Returns a new accumulator that summarizes the data of this accumulator and another accumulator
+        - Note: `stats_a + stats_b` is equivalent to `stats_a.merge(stats_b)`
+
+        Requires:
+
+        - `other`:
+            - Type: PamdaStats
+            - What: The accumulator to merge with
+        """
+        output = PamdaStats()
+        output.__mergeState__(
+            self.count, self.mean, self.m2, self.min, self.max
+        )
+        return output.__mergeState__(
+            other.count, other.mean, other.m2, other.min, other.max
+        )
+
+    def variance(self, ddof: int = 1):
+        """
+        Function:
+
+        - Returns the variance of the data or None if there are not enough values
+
+        Optional:
+
+        - `ddof`:
+            - Type: int
+            - What: The delta degrees of freedom
+            - Default: 1 (sample variance)
+            - Note: Use 0 for the population variance
+        """
+        if self.count - ddof <= 0:
+            return None
+        return self.m2 / (self.count - ddof)
+
+    def std(self, ddof: int = 1):
+        """
+        Function:
+
+        - Returns the standard deviation of the data or None if there are not enough values
+
+        Optional:
+
+        - `ddof`:
+            - Type: int
+            - What: The delta degrees of freedom
+            - Default: 1 (sample standard deviation)
+            - Note: Use 0 for the population standard deviation
+        """
+        variance = self.variance(ddof)
+        return None if variance is None else variance**0.5
+
+    def toDict(self):
+        """
+        Function:
+
+        - Returns a summary dictionary of the accumulator
+
+        Returns:
+
+        - A dictionary containing the:
+            - count: (int) - The number of values
+            - mean: (float | None) - The mean of the values
+            - variance: (float | None) - The sample variance of the values
+            - std: (float | None) - The sample standard deviation of the values
+            - min: (int | float | None) - The minimum value
+            - max: (int | float | None) - The maximum value
+        """
+        return {
+            "count": self.count,
+            "mean": self.mean if self.count > 0 else None,
+            "variance": self.variance(),
+            "std": self.std(),
+            "min": self.min,
+            "max": self.max,
+        }
@@ -0,0 +1,592 @@
+import array
+from types import NoneType
+from itertools import compress
+from operator import itemgetter
+from pamda.pamda_fast import __nest__
+
+
+def __typedColumn__(values: list):
+    """
+    An internal function to store a column of numbers as a typed array designed for memory efficiency
+
+    Function:
+
+    - Returns a tuple of the stored column and its null mask
+    - The column is an `array.array('q')` if every non None value is an int
+    - The column is an `array.array('d')` if every non None value is an int or a float (with at least one float)
+    - Note: Ints too large for the array type keep the column as a list
+    - Otherwise the column is the original list unchanged
+    - The null mask is a `bytearray` with a 1 for each None value (stored as 0 in the array) or None if there are no None values
+
+    Requires:
+
+    - `values`:
+        - Type: list
+        - What: The column values to store
+    """
+    value_types = set(map(type, values))
+    mask = None
+    if NoneType in value_types:
+        value_types.discard(NoneType)
+        if value_types and value_types <= {int, float}:
+            mask = bytearray(value is None for value in values)
+            values = [0 if value is None else value for value in values]
+    if value_types == {int}:
+        try:
+            return array.array("q", values), mask
+        except OverflowError:
+            pass
+    elif value_types == {float} or value_types == {int, float}:
+        try:
+            return array.array("d", values), mask
+        except OverflowError:
+            pass
+    if mask is not None:
+        values = [None if null else value for value, null in zip(values, mask)]
+    return values, None
+
+
+class __TypedColumnBuilder__:
+    """
+    An internal class to build a column one value at a time with the same
+    storage rules as `__typedColumn__`
+
+    Values are appended straight into an `array.array('q')`, which is
+    promoted to an `array.array('d')` on the first float. A null mask is
+    only allocated once the first None is appended. Ints too large for 'q'
+    are held in a list until a float arrives (when the column becomes 'd')
+    and any value that is not a number turns the column into a plain list.
+    This avoids holding the whole column as boxed values while it is read.
+    """
+
+    __slots__ = ("values", "mask", "kind", "numbers")
+
+    def __init__(self):
+        self.values = array.array("q")
+        self.mask = None
+        # One of "q", "d", "int" (a list of large ints and Nones) or "list"
+        self.kind = "q"
+        self.numbers = 0
+
+    def __toList__(self, kind: str):
+        """
+        Converts the column to a list (restoring None values from the mask)
+        """
+        values = self.values
+        if self.mask is not None:
+            values = [
+                None if null else value
+                for value, null in zip(values, self.mask)
+            ]
+            self.mask = None
+        self.values = list(values)
+        self.kind = kind
+
+    def __toFloat__(self):
+        """
+        Converts the column to an `array.array('d')` (moving None values
+        from a list into a null mask)
+        """
+        values = self.values
+        mask = self.mask
+        if self.kind == "int" and None in values:
+            mask = bytearray(value is None for value in values)
+            values = [0 if value is None else value for value in values]
+        try:
+            self.values = array.array("d", values)
+        except OverflowError:
+            # An int is too large for a float
+            self.__toList__("list")
+            return
+        self.mask = mask
+        self.kind = "d"
+
+    def append(self, value):
+        kind = self.kind
+        if kind == "list":
+            self.values.append(value)
+            return
+        value_type = type(value)
+        if value is None:
+            if kind == "int":
+                self.values.append(None)
+                return
+            if self.mask is None:
+                self.mask = bytearray(len(self.values))
+            self.mask.append(1)
+            self.values.append(0)
+            return
+        if value_type is float:
+            if kind != "d":
+                self.__toFloat__()
+                kind = self.kind
+                if kind == "list":
+                    self.values.append(value)
+                    return
+        elif value_type is not int:
+            self.__toList__("list")
+            self.values.append(value)
+            return
+        self.numbers += 1
+        if kind == "int":
+            self.values.append(value)
+            return
+        try:
+            self.values.append(value)
+        except OverflowError:
+            self.__toList__("int" if self.kind == "q" else "list")
+            self.values.append(value)
+            return
+        if self.mask is not None:
+            self.mask.append(0)
+
+    def finish(self):
+        """
+        Returns a tuple of the stored column and its null mask
+        """
+        if self.numbers == 0 and self.kind != "list":
+            # Empty or all None columns are not numeric
+            return [None] * len(self.values), None
+        return self.values, self.mask
+
+
+def __takeRows__(column, idxs: list):
+    """
+    An internal function to select rows (by index) from a column (or null mask) keeping its storage type
+    """
+    values = map(column.__getitem__, idxs)
+    if isinstance(column, array.array):
+        return array.array(column.typecode, values)
+    if isinstance(column, bytearray):
+        return bytearray(values)
+    return list(values)
+
+
+def __compressRows__(column, selectors: list):
+    """
+    An internal function to select rows (by a list of booleans) from a column (or null mask) keeping its storage type
+    """
+    values = compress(column, selectors)
+    if isinstance(column, array.array):
+        return array.array(column.typecode, values)
+    if isinstance(column, bytearray):
+        return bytearray(values)
+    return list(values)
+
+
+class PamdaTable:
+    def __init__(self, columns: dict, masks: dict | None = None):
+        """
+        Function:
+
+        Initialize a columnar table.
+        - Note: Columns are stored as given (no copies are made)
+        - Note: Use `PamdaTable.fromDictOfLists` or `PamdaTable.fromListOfDicts` to build a table with typed numeric columns
+
+        Requires:
+
+        - `columns`:
+            - Type: dict of (lists | array.arrays)
+            - What: A dictionary of equal length columns keyed by column name
+
+        Optional:
+
+        - `masks`:
+            - Type: dict of bytearrays | None
+            - What: Null masks (1 for a None value) keyed by column name for typed columns that contain None values
+            - Default: None
+        """
+        lengths = set(map(len, columns.values()))
+        if len(lengths) > 1:
+            raise Exception(
+                "All `PamdaTable` columns must have the same length"
+            )
+        self.columns = columns
+        self.masks = masks if masks is not None else {}
+        self.length = lengths.pop() if lengths else 0
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return f"<PamdaTable columns={list(self.columns.keys())} rows={self.length} at {hex(id(self))}>"
+
+    def __eq__(self, other):
+        if not isinstance(other, PamdaTable):
+            return NotImplemented
+        return self.toDictOfLists(as_lists=True) == other.toDictOfLists(
+            as_lists=True
+        )
+
+    ######################
+    # Conversions
+    @classmethod
+    def fromDictOfLists(cls, data: dict, typed: bool = True):
+        """
+        Function:
+
+        - Creates a `PamdaTable` from a dictionary of lists (EG: `pamda.pivot` or `pamda.read_csv(return_type='dict_of_lists')` output)
+
+        Requires:
+
+        - `data`:
+            - Type: dict of lists
+            - What: The columns of the table keyed by column name
+
+        Optional:
+
+        - `typed`:
+            - Type: bool
+            - What: Whether to store numeric columns as typed `array.array`s
+            - Default: True
+            - Note: None values in numeric columns are tracked with a null mask (see `mask`)
+            - Note: If False, the passed lists are used as is (zero-copy)
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2], 'b':['x','y']})
+        table.pluck('a') #=> array('q', [1, 2])
+        ```
+        """
+        if not typed:
+            return cls(dict(data))
+        columns = {}
+        masks = {}
+        for key, col in data.items():
+            columns[key], mask = __typedColumn__(col)
+            if mask is not None:
+                masks[key] = mask
+        return cls(columns, masks)
+
+    @classmethod
+    def fromListOfDicts(cls, data: list, typed: bool = True):
+        """
+        Function:
+
+        - Creates a `PamdaTable` from a list of dictionaries
+        - Note: All dictionaries must have the same keys as the first dictionary
+
+        Requires:
+
+        - `data`:
+            - Type: list of dicts
+            - What: The records of the table
+
+        Optional:
+
+        - `typed`:
+            - Type: bool
+            - What: Whether to store numeric columns as typed `array.array`s
+            - Default: True
+
+        Example:
+
+        ```
+        table = PamdaTable.fromListOfDicts([{'a':1,'b':'x'},{'a':2,'b':'y'}])
+        table.pluck('b') #=> ['x', 'y']
+        ```
+        """
+        if len(data) == 0:
+            return cls({})
+        return cls.fromDictOfLists(
+            {key: list(map(itemgetter(key), data)) for key in data[0].keys()},
+            typed=typed,
+        )
+
+    def toDictOfLists(self, as_lists: bool = False):
+        """
+        Function:
+
+        - Returns the table as a dictionary of columns
+
+        Optional:
+
+        - `as_lists`:
+            - Type: bool
+            - What: Whether to convert typed array columns into lists
+            - Default: False
+            - Note: If False, the stored columns are returned as is (zero-copy) unless they have a null mask (see `pluck`)
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2], 'b':['x','y']})
+        table.toDictOfLists() #=> {'a':array('q', [1, 2]), 'b':['x','y']}
+        table.toDictOfLists(as_lists=True) #=> {'a':[1,2], 'b':['x','y']}
+        ```
+        """
+        output = {key: self.pluck(key) for key in self.columns.keys()}
+        if as_lists:
+            return {
+                key: col.tolist() if isinstance(col, array.array) else col
+                for key, col in output.items()
+            }
+        return output
+
+    def toListOfDicts(self):
+        """
+        Function:
+
+        - Returns the table as a list of dictionaries (records)
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2], 'b':['x','y']})
+        table.toListOfDicts() #=> [{'a':1,'b':'x'},{'a':2,'b':'y'}]
+        ```
+        """
+        keys = list(self.columns.keys())
+        return [
+            dict(zip(keys, row))
+            for row in zip(*[self.pluck(key) for key in keys])
+        ]
+
+    ######################
+    # Column Functions
+    def pluck(self, key):
+        """
+        Function:
+
+        - Returns a column of the table
+        - Note: The stored column is returned (zero-copy)
+        - Note: If the column has a null mask, a list with None values restored is returned instead
+
+        Requires:
+
+        - `key`:
+            - Type: str
+            - What: The column to return
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2], 'b':['x','y']})
+        table.pluck('b') #=> ['x','y']
+        ```
+        """
+        column = self.columns[key]
+        mask = self.masks.get(key)
+        if mask is None:
+            return column
+        return [None if null else value for value, null in zip(column, mask)]
+
+    def mask(self, key):
+        """
+        Function:
+
+        - Returns the null mask of a column (a `bytearray` with a 1 for each None value) or None if the column has no null mask
+
+        Requires:
+
+        - `key`:
+            - Type: str
+            - What: The column to return the null mask for
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,None,3]})
+        table.mask('a') #=> bytearray(b'\\x00\\x01\\x00')
+        ```
+        """
+        return self.masks.get(key)
+
+    def memoryview(self, key):
+        """
+        Function:
+
+        - Returns a `memoryview` over the buffer of a typed column for zero-copy hand off to other libraries (EG: `numpy.frombuffer`)
+        - Note: Rows that are None (see `mask`) hold a 0 in the buffer
+
+        Requires:
+
+        - `key`:
+            - Type: str
+            - What: The column to return a memoryview of
+            - Note: The column must be stored as a typed `array.array`
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2]})
+        table.memoryview('a').tolist() #=> [1, 2]
+        ```
+        """
+        column = self.columns[key]
+        if not isinstance(column, array.array):
+            raise Exception(
+                f"Column `{key}` is not a typed column and has no buffer to view"
+            )
+        return memoryview(column)
+
+    def project(self, keys: list):
+        """
+        Function:
+
+        - Returns a new table with only the columns provided
+        - Note: The columns are shared with this table (zero-copy)
+
+        Requires:
+
+        - `keys`:
+            - Type: list of strs
+            - What: The columns to select
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2], 'b':['x','y']})
+        table.project(['b']).toDictOfLists() #=> {'b':['x','y']}
+        ```
+        """
+        return PamdaTable(
+            {key: self.columns[key] for key in keys},
+            {key: self.masks[key] for key in keys if key in self.masks},
+        )
+
+    def filter(self, fn, keys: list):
+        """
+        Function:
+
+        - Returns a new table with only the rows where a function returns True
+
+        Requires:
+
+        - `fn`:
+            - Type: function | method
+            - What: A function that returns a boolean for each row
+            - Note: This function takes one input per key in `keys` (the row values for those columns in order)
+        - `keys`:
+            - Type: list of strs
+            - What: The columns to pass to `fn`
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2], 'b':['x','y']})
+        table.filter(lambda a: a > 1, ['a']).toDictOfLists(as_lists=True) #=> {'a':[2], 'b':['y']}
+        ```
+        """
+        selectors = list(map(fn, *[self.pluck(key) for key in keys]))
+        return PamdaTable(
+            {
+                key: __compressRows__(col, selectors)
+                for key, col in self.columns.items()
+            },
+            {
+                key: __compressRows__(mask, selectors)
+                for key, mask in self.masks.items()
+            },
+        )
+
+    def pluckIf(self, fn, keys: list, key):
+        """
+        Function:
+
+        - Returns the values of a column for the rows where a function returns True
+
+        Requires:
+
+        - `fn`:
+            - Type: function | method
+            - What: A function that returns a boolean for each row
+            - Note: This function takes one input per key in `keys` (the row values for those columns in order)
+        - `keys`:
+            - Type: list of strs
+            - What: The columns to pass to `fn`
+        - `key`:
+            - Type: str
+            - What: The column to pluck values from
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2], 'b':['x','y']})
+        table.pluckIf(lambda a: a > 1, ['a'], 'b') #=> ['y']
+        ```
+        """
+        selectors = map(fn, *[self.pluck(i) for i in keys])
+        return list(compress(self.pluck(key), selectors))
+
+    def groupKeys(self, keys: list):
+        """
+        Function:
+
+        - Splits the table into a list of tables separated by rows with equal values in the provided columns
+        - Groups are returned in order of first appearance
+
+        Requires:
+
+        - `keys`:
+            - Type: list of strs
+            - What: The columns to group by
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':[1,2,1], 'b':['x','y','z']})
+        [i.pluck('b') for i in table.groupKeys(['a'])] #=> [['x','z'],['y']]
+        ```
+        """
+        groups = {}
+        for idx, group_key in enumerate(zip(*[self.pluck(i) for i in keys])):
+            if group_key not in groups:
+                groups[group_key] = []
+            groups[group_key].append(idx)
+        return [
+            PamdaTable(
+                {
+                    key: __takeRows__(col, idxs)
+                    for key, col in self.columns.items()
+                },
+                {
+                    key: __takeRows__(mask, idxs)
+                    for key, mask in self.masks.items()
+                },
+            )
+            for idxs in groups.values()
+        ]
+
+    def nest(self, path_keys: list, value_key, agg_fn=None):
+        """
+        Function:
+
+        - Nests the table into a nested dictionary (see `pamda.nest`)
+        - Similar values are appended to a list in the end of the nested dictionary
+
+        Requires:
+
+        - `path_keys`:
+            - Type: list of strs
+            - What: The columns used to build out the nested dictionary (in order)
+        - `value_key`:
+            - Type: str
+            - What: The column to add to the list at the end of the nested dictionary path
+
+        Optional:
+
+        - `agg_fn`:
+            - Type: function | method | None
+            - What: A unary function applied to each list at the end of the nested dictionary
+            - Default: None
+
+        Example:
+
+        ```
+        table = PamdaTable.fromDictOfLists({'a':['x','x','y'], 'b':[1,2,3]})
+        table.nest(['a'], 'b') #=> {'x':[1,2], 'y':[3]}
+        table.nest(['a'], 'b', agg_fn=sum) #=> {'x':3, 'y':3}
+        ```
+        """
+        depth = len(path_keys)
+        return __nest__(
+            path_keys=list(range(depth)),
+            value_fn=itemgetter(depth),
+            agg_fn=agg_fn,
+            data=zip(
+                *[self.pluck(key) for key in path_keys],
+                self.pluck(value_key),
+            ),
+        )
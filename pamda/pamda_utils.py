@@ -1,6 +1,7 @@
 import csv, json
 from pamda import pamda_wrappers
 from pamda.pamda_fast import __getForceDict__
+from pamda.pamda_table import PamdaTable, __TypedColumnBuilder__
 import type_enforced
 
 
@@ -54,6 +55,14 @@ class pamda_utils:
                 - `list_of_col_lists`
                     - A list of lists (columns) with each column being a list of the values in that column
                     - The first item in each sublist is the header for that column
+                - `table`
+                    - A `PamdaTable` (see `pamda.pamda_table`) with each column keyed by its header
+                    - Numeric columns are stored as typed `array.array('q')` (ints) or `array.array('d')` (floats)
+                    - None values in numeric columns are tracked with a null mask (see `PamdaTable.mask`)
+                    - Typed columns can be handed off without copying using `PamdaTable.memoryview`
+                    - This uses far less memory than the other return types for large numeric csvs
+                    - Values are appended to their typed columns as each row is read, so rows are never held in memory
+                    - Every row must have one item per header
         - `cast_items`:
             - Type: bool
             - What: Flag to indicate if an attempt to cast each item to a proper type
@@ -89,7 +98,64 @@ class pamda_utils:
             "dict_of_lists",
             "list_of_row_lists",
             "list_of_col_lists",
+            "table",
         ], f"Invalid return_type: {return_type}"
+
+        def cast(obj):
+            if not isinstance(obj, str):
+                return obj
+            obj_lower = obj.lower()
+            if obj == "" or obj_lower == "none" or obj_lower == "null":
+                return None
+            if obj_lower == "true":
+                return True
+            if obj_lower == "false":
+                return False
+            try:
+                float_obj = float(obj)
+                return (
+                    int(float_obj) if float_obj == int(float_obj) else float_obj
+                )
+            except:
+                return obj
+
+        if return_type == "table":
+            # Append each cast value straight into its typed column while
+            # reading so rows are never held as boxed values
+            with open(filename) as f:
+                file_data = csv.reader(f, delimiter=",", quotechar='"')
+                headers = next(file_data)
+                builders = [__TypedColumnBuilder__() for _ in headers]
+                appends = [builder.append for builder in builders]
+                if not cast_items:
+                    cast_fns = None
+                elif cast_dict is not None:
+                    cast_fns = [
+                        cast_dict.get(header, lambda x: x) for header in headers
+                    ]
+                else:
+                    cast_fns = [cast for _ in headers]
+                n_cols = len(headers)
+                for row in file_data:
+                    if len(row) != n_cols:
+                        raise Exception(
+                            f"Row {file_data.line_num} has {len(row)} items but there are {n_cols} headers"
+                        )
+                    if cast_fns is None:
+                        for append, item in zip(appends, row):
+                            append(item)
+                    else:
+                        for append, cast_fn, item in zip(
+                            appends, cast_fns, row
+                        ):
+                            append(cast_fn(item))
+            columns = {}
+            masks = {}
+            for header, builder in zip(headers, builders):
+                columns[header], mask = builder.finish()
+                if mask is not None:
+                    masks[header] = mask
+            return PamdaTable(columns, masks)
         with open(filename) as f:
             file_data = csv.reader(f, delimiter=",", quotechar='"')
             headers = next(file_data)
@@ -100,27 +166,6 @@ class pamda_utils:
                     cast_fn = cast_dict.get(header, lambda x: x)
                     data[idx] = [cast_fn(item) for item in data[idx]]
             else:
-
-                def cast(obj):
-                    if not isinstance(obj, str):
-                        return obj
-                    obj_lower = obj.lower()
-                    if obj == "" or obj_lower == "none" or obj_lower == "null":
-                        return None
-                    if obj_lower == "true":
-                        return True
-                    if obj_lower == "false":
-                        return False
-                    try:
-                        float_obj = float(obj)
-                        return (
-                            int(float_obj)
-                            if float_obj == int(float_obj)
-                            else float_obj
-                        )
-                    except:
-                        return obj
-
                 for idx, header in enumerate(headers):
                     data[idx] = [cast(item) for item in data[idx]]
         # Maintain backwards compatibility
@@ -1,5 +1,7 @@
+import array
 import pytest
 from pamda import pamda
+from pamda.pamda_hamt import PamdaMap
 
 
 def test_accumulate():
@@ -13,10 +15,35 @@ def test_add():
     assert pamda.add(1, 2) == 3
 
 
+def test_addBatch():
+    assert pamda.addBatch([1, 2, 3], 1) == [2, 3, 4]
+    assert pamda.addBatch(1, [1, 2]) == [2, 3]
+    assert pamda.addBatch([1, 2], (3, 4)) == [4, 6]
+    out = pamda.addBatch(array.array("q", [1, 2]), 0.5)
+    assert out == array.array("d", [1.5, 2.5])
+    out = pamda.addBatch(memoryview(array.array("q", [1, 2])), 1)
+    assert out == array.array("q", [2, 3])
+    with pytest.raises(Exception):
+        pamda.addBatch([1, 2], [1])
+
+
 def test_adjust():
     assert pamda.adjust(index=1, fn=pamda.inc, data=[1, 5, 9]) == [1, 6, 9]
 
 
+def test_adjustImmutable():
+    data = [1, 5, 9]
+    assert pamda.adjustImmutable(index=1, fn=pamda.inc, data=data) == [1, 6, 9]
+    assert data == [1, 5, 9]
+
+
+def test_aperture():
+    assert list(pamda.aperture(2, [1, 2, 3, 4])) == [[1, 2], [2, 3], [3, 4]]
+    assert list(pamda.aperture(5, iter([1, 2]))) == []
+    with pytest.raises(Exception):
+        pamda.aperture(0, [1])
+
+
 def test_assocPath():
     data = {"a": {"b": 1}}
     assert pamda.assocPath(path=["a", "c"], value=3, data=data) == {
@@ -53,11 +80,85 @@ def test_assocPathComplex():
     assert out == {"a": {"b": 1, "c": [2, 1]}}
 
 
+def test_assocPathComplexImmutable():
+    data = {"a": {"b": 1}, "x": {"y": 2}}
+    output = pamda.assocPathComplexImmutable(
+        default=[2], default_fn=lambda x: x + [1], path=["a", "c"], data=data
+    )
+    assert output == {"a": {"b": 1, "c": [2, 1]}, "x": {"y": 2}}
+    assert data == {"a": {"b": 1}, "x": {"y": 2}}
+    assert output["x"] is data["x"]
+
+
+def test_assocPathImmutable():
+    data = {"a": {"b": 1, "l": [{"m": 1}]}, "x": {"y": 2}}
+    output = pamda.assocPathImmutable(path=["a", "c"], value=3, data=data)
+    assert output == {"a": {"b": 1, "c": 3, "l": [{"m": 1}]}, "x": {"y": 2}}
+    assert data == {"a": {"b": 1, "l": [{"m": 1}]}, "x": {"y": 2}}
+    assert output["x"] is data["x"] and output["a"]["l"] is data["a"]["l"]
+    output = pamda.assocPathImmutable(["a", "l", 0, "m"], 5, data)
+    assert output["a"]["l"] == [{"m": 5}] and data["a"]["l"] == [{"m": 1}]
+    assert pamda.assocPathImmutable(["a", "b", "c"], 1, data)["a"]["b"] == {
+        "c": 1
+    }
+    assert data["a"]["b"] == 1
+
+
+def test_assocPaths():
+    data = {"a": {"b": 1}}
+    pairs = [(["a", "c"], 2), (["a", "d", "e"], 3), ("f", 4)]
+    assert pamda.assocPaths(pairs, data) == {
+        "a": {"b": 1, "c": 2, "d": {"e": 3}},
+        "f": 4,
+    }
+    pairs = [
+        (["x", "y"], 1),
+        (["x"], 2),
+        (["x", "z", "w"], 3),
+        (["x", "z", "v"], 4),
+        (["q", 0], 5),
+        (["x", "y"], 6),
+        (["a", "b", "c"], 7),
+        (["a", "b"], 8),
+        (["a", "b", "d"], 9),
+        (["a", "e"], 10),
+    ]
+    expected = {}
+    for path, value in pairs:
+        pamda.assocPath(path, value, expected)
+    assert pamda.assocPaths(pairs, {}) == expected
+    with pytest.raises(Exception):
+        pamda.assocPaths([([], 1)], {})
+
+
 def test_clamp():
     assert pamda.clamp(1, 10, 11) == 10
     assert pamda.clamp(1, 10, 0) == 1
 
 
+def test_clampBatch():
+    assert pamda.clampBatch(1, 10, [0, 5, 11]) == [1, 5, 10]
+    assert pamda.clampBatch([0, 2], 10, [1, 1]) == [1, 2]
+
+
+def test_countBy():
+    data = [
+        {"color": "red", "size": 1},
+        {"color": "blue", "size": 1},
+        {"color": "red", "size": 2},
+    ]
+    assert pamda.countBy("color", data) == {"red": 2, "blue": 1}
+    assert pamda.countBy(("color", "size"), iter(data))[("red", 1)] == 1
+    assert pamda.countBy(lambda x: x["size"] > 1, data) == {False: 2, True: 1}
+    merged = pamda.countBy("color", data[:1]) + pamda.countBy("color", data[1:])
+    assert merged == pamda.countBy("color", data)
+    rows = [{"a": {"b": 1}, "c": 1}, {"x": 1}, {"a": {}, "c": 1}]
+    assert pamda.countBy(["c"], rows) == {1: 2, None: 1}
+    assert pamda.countBy(["a", "b"], rows) == {1: 1, None: 2}
+    records = [[2, "x"], [1, "y"], [2, "z"], []]
+    assert pamda.countBy([0], records) == {2: 2, 1: 1, None: 1}
+
+
 def test_curry():
     def add(a, b):
         return a + b
@@ -81,13 +182,93 @@ def test_dec():
     assert pamda.dec(1) == 0
 
 
+def test_decBatch():
+    assert pamda.decBatch([1, 2]) == [0, 1]
+
+
+def test_describe():
+    assert pamda.describe(i for i in [1, 2, 3, 4]) == {
+        "count": 4,
+        "mean": 2.5,
+        "variance": 5 / 3,
+        "std": (5 / 3) ** 0.5,
+        "min": 1,
+        "max": 4,
+    }
+    assert pamda.describe([])["mean"] is None
+
+
 def test_difference():
     assert pamda.difference([1, 2, 3], [2, 3, 4]) == [1]
+    assert pamda.difference([3, 1, 3, 2, 5], [2]) == [3, 1, 5]
+    assert pamda.difference([3, 1, 2], [2, 4, 5, 6, 7]) == [3, 1]
+    assert pamda.difference([{"a": 1}, {"a": 2}], [{"a": 2}]) == [{"a": 1}]
+    assert pamda.difference([1, 1, 2, 3], [2, 4], presorted=True) == [1, 3]
+    with pytest.raises(Exception):
+        pamda.difference([2, 1], [3], presorted=True)
+
+
+def test_differenceBy():
+    a = [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}, {"id": 1, "v": "z"}]
+    b = [{"id": 2, "v": "x"}, {"id": 3, "v": "c"}]
+    assert pamda.differenceBy(lambda x: x["id"], a, b) == [a[0]]
+    assert pamda.differenceBy(lambda x: x["id"], a[:2], b, presorted=True) == [
+        a[0]
+    ]
+
+
+def test_differenceExternal():
+    a = [{"id": i % 7, "n": i} for i in range(50)]
+    b = ({"id": i} for i in [2, 4, 8])
+    output = pamda.differenceExternal("id", a, b, chunk_size=8)
+    assert not isinstance(output, list)
+    assert list(output) == [a[0], a[1], a[3], a[5], a[6]]
+    assert list(
+        pamda.differenceExternal([], [3, 1, 3, 2], [2], chunk_size=2)
+    ) == [
+        1,
+        3,
+    ]
 
 
 def test_dissocPath():
     data = {"a": {"b": 1, "c": 2}}
     assert pamda.dissocPath(path=["a", "c"], data=data) == {"a": {"b": 1}}
+    assert pamda.dissocPath("a", data) == {}
+    with pytest.raises(Exception):
+        pamda.dissocPath(["a", "b"], data)
+    with pytest.raises(Exception):
+        pamda.dissocPath(["a", "b", "c"], {"a": {"b": 1}})
+    data = {"a": {"b": 1}}
+    with pytest.raises(Exception):
+        pamda.dissocPath(["x", "b"], data)
+    assert data == {"a": {"b": 1}}
+
+
+def test_dissocPathImmutable():
+    data = {"a": {"b": {"c": 0, "d": 1}}, "x": {"y": 2}}
+    output = pamda.dissocPathImmutable(path=["a", "b", "c"], data=data)
+    assert output == {"a": {"b": {"d": 1}}, "x": {"y": 2}}
+    assert data == {"a": {"b": {"c": 0, "d": 1}}, "x": {"y": 2}}
+    assert output["x"] is data["x"]
+    with pytest.raises(Exception):
+        pamda.dissocPathImmutable(["a", "q", "c"], data)
+    with pytest.raises(Exception):
+        pamda.dissocPathImmutable(["a", "b", "q"], data)
+
+
+def test_dissocPaths():
+    data = {"a": {"b": {"c": 0}, "d": 1}, "e": {"f": 2}}
+    paths = [["a", "b", "c"], ["e", "f"], ["x", "y"], ["a", "d", "z"]]
+    assert pamda.dissocPaths(paths, data) == {"a": {"b": {}, "d": 1}, "e": {}}
+    data = {"a": {"b": {"c": 0}, "d": 1}, "e": {"f": 2}, "g": {}}
+    assert pamda.dissocPaths(paths, data, prune=True) == {
+        "a": {"d": 1},
+        "g": {},
+    }
+    data = {"a": {"b": {"c": 0, "d": 1}, "e": [1, 2]}}
+    paths = [["a", "b", "c"], ["a", "b"], ["a", "b", "d"], ["a", "e", 0], "q"]
+    assert pamda.dissocPaths(paths, data) == {"a": {"e": [2]}}
 
 
 def test_flatten():
@@ -163,6 +344,22 @@ def test_groupWith():
     data = [1, 2, 3, 1, 1, 2, 2, 3, 3, 3]
     expected = [[1], [2], [3], [1, 1], [2, 2], [3, 3, 3]]
     assert pamda.groupWith(areEqual, data) == expected
+    assert pamda.groupWith(lambda x: x, data) == expected
+
+    data = [{"a": 1}, {"a": 1}, {"a": 2}, {"a": 1}]
+    assert pamda.groupWith(lambda x: x["a"], data) == [
+        [{"a": 1}, {"a": 1}],
+        [{"a": 2}],
+        [{"a": 1}],
+    ]
+
+
+def test_groupWithSorted():
+    data = [{"a": 2, "b": 0}, {"a": 1, "b": 1}, {"a": 2, "b": 2}]
+    assert pamda.groupWithSorted(lambda x: x["a"], data) == [
+        [{"a": 1, "b": 1}],
+        [{"a": 2, "b": 0}, {"a": 2, "b": 2}],
+    ]
 
 
 def test_hardRound():
@@ -170,6 +367,10 @@ def test_hardRound():
     assert pamda.hardRound(0, 1.2345) == 1
 
 
+def test_hardRoundBatch():
+    assert pamda.hardRoundBatch(2, [1.2345, 2.3456]) == [1.23, 2.35]
+
+
 def test_hasPath():
     data = {"a": {"b": 1}}
     assert pamda.hasPath(path=["a", "b"], data=data)
@@ -185,8 +386,147 @@ def test_inc():
     assert pamda.inc(1) == 2
 
 
+def test_incBatch():
+    assert pamda.incBatch(array.array("q", [1, 2])) == array.array("q", [2, 3])
+
+
+def test_indexBy():
+    data = [
+        {"id": 1, "user": {"name": "a"}},
+        {"id": 2, "user": {"name": "b"}},
+        {"id": 1, "user": {"name": "c"}},
+    ]
+    assert pamda.indexBy("id", data) == {1: data[2], 2: data[1]}
+    first = pamda.indexBy("id", data, duplicates="first")
+    assert first == {1: data[0], 2: data[1]}
+    assert list(first) == [1, 2]
+    assert pamda.indexBy(["user", "name"], data) == {
+        "a": data[0],
+        "b": data[1],
+        "c": data[2],
+    }
+    rows = [{"a": 1, "b": 2}, {"a": 1, "b": 3}]
+    assert pamda.indexBy(("a", "b"), rows) == {(1, 2): rows[0], (1, 3): rows[1]}
+    with pytest.raises(Exception):
+        pamda.indexBy("id", data, duplicates="error")
+    assert pamda.indexBy("id", data[:2], duplicates="error") == {
+        1: data[0],
+        2: data[1],
+    }
+    rows = [{"id": 1}, {"x": 1}, {"user": {"id": 2}}]
+    assert pamda.indexBy(["id"], rows) == {1: rows[0], None: rows[2]}
+    assert pamda.indexBy(["user", "id"], rows, duplicates="first") == {
+        None: rows[0],
+        2: rows[2],
+    }
+    records = [[1, "a"], (2, "b"), [1, "c"]]
+    assert pamda.indexBy([0], records) == {1: records[2], 2: records[1]}
+    # `duplicates` is validated before any key is read
+    with pytest.raises(Exception, match="duplicates"):
+        pamda.indexBy("id", [1, 2], duplicates="bad")
+
+
 def test_intersection():
     assert pamda.intersection([1, 2, 3], [2, 3, 4]) == [2, 3]
+    assert pamda.intersection([3, 2, 3, 1], [1, 2, 3, 4, 5]) == [3, 2, 1]
+    assert pamda.intersection([3, 2, 3, 1, 5], [1, 3]) == [3, 1]
+    assert pamda.intersection([[1], [2]], [[2]]) == [[2]]
+    assert pamda.intersection([1, 2, 2, 3], [2, 3, 4], presorted=True) == [2, 3]
+
+
+def test_intersectionBy():
+    a = [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}]
+    b = [{"id": 2, "v": "x"}, {"id": 3, "v": "c"}]
+    assert pamda.intersectionBy(lambda x: x["id"], a, b) == [a[1]]
+    assert pamda.intersectionBy(lambda x: x["id"], a, b, presorted=True) == [
+        a[1]
+    ]
+
+
+def test_intersectionExternal():
+    a = [{"a": {"id": i % 7}, "n": i} for i in range(50)]
+    b = [{"a": {"id": i}} for i in [4, 2, 8]]
+    output = pamda.intersectionExternal(["a", "id"], a, b, chunk_size=8)
+    assert list(output) == [a[2], a[4]]
+
+
+def test_join():
+    users = [{"id": 1, "name": "a"}, {"id": 2, "name": "b"}]
+    orders = [
+        {"user_id": 1, "total": 5},
+        {"user_id": 1, "total": 7},
+        {"user_id": 3, "total": 9},
+    ]
+    inner = [
+        {"id": 1, "name": "a", "user_id": 1, "total": 5},
+        {"id": 1, "name": "a", "user_id": 1, "total": 7},
+    ]
+    unmatched_left = {"id": 2, "name": "b", "user_id": None, "total": None}
+    unmatched_right = {"id": None, "name": None, "user_id": 3, "total": 9}
+    assert pamda.join(["id"], ["user_id"], users, orders) == inner
+    assert pamda.join(["user_id"], ["id"], orders, users) == [
+        {"user_id": 1, "total": 5, "id": 1, "name": "a"},
+        {"user_id": 1, "total": 7, "id": 1, "name": "a"},
+    ]
+    assert pamda.join(
+        ["id"], ["user_id"], users, orders, how="left"
+    ) == inner + [unmatched_left]
+    assert pamda.join(
+        ["id"], ["user_id"], users, orders, how="outer"
+    ) == inner + [
+        unmatched_left,
+        unmatched_right,
+    ]
+    assert pamda.join(["user_id"], ["id"], orders, users, how="outer")[-1] == {
+        "user_id": None,
+        "total": None,
+        "id": 2,
+        "name": "b",
+    }
+    output = pamda.join(
+        ["id"],
+        ["user_id"],
+        iter(users),
+        iter(orders),
+        how="outer",
+        presorted=True,
+    )
+    assert list(output) == inner + [unmatched_left, unmatched_right]
+    with pytest.raises(Exception):
+        list(pamda.join(["id"], ["id"], users[::-1], users, presorted=True))
+    with pytest.raises(Exception):
+        pamda.join(["id"], ["user_id"], users, orders, how="cross")
+
+
+def test_lens():
+    lens = pamda.lens(["a", "b"])
+    data = [{"a": {"b": 1}}, {"a": {"b": 2}}, {"a": {}}]
+    assert pamda.pluck(lens, data) == [1, 2, None]
+    assert pamda.pluckIf(lambda x: "b" in x["a"], lens, data) == [1, 2]
+    assert lens.getOr(0, data[2]) == 0
+    assert not lens.has(data[2])
+    assert lens.set(3, data[2]) == {"a": {"b": 3}}
+    assert lens.has(data[2]) and lens(data[2]) == 3
+    assert pamda.lens("x").set(1, {}) == {"x": 1}
+    assert pamda.lens(["x", "y", "z"]).set(1, {"x": 5}) == {
+        "x": {"y": {"z": 1}}
+    }
+    assert pamda.path(lens, data[0]) == 1
+    assert pamda.pathOr(4, pamda.lens(["a", "c"]), data[0]) == 4
+    assert pamda.hasPath(lens, data[0])
+    assert pamda.assocPath(lens, 5, {"a": 1}) == {"a": {"b": 5}}
+    assert pamda.dissocPath(lens, {"a": {"b": 1, "c": 2}}) == {"a": {"c": 2}}
+    with pytest.raises(Exception):
+        pamda.dissocPath(lens, {"a": {"c": 2}})
+    records = [
+        {"k": {"x": "a"}, "v": {"w": 1}},
+        {"k": {"x": "a"}, "v": {"w": 2}},
+        {"k": {"x": "b"}, "v": {"w": 3}},
+    ]
+    assert pamda.nest(
+        [pamda.lens(["k", "x"])], pamda.lens(["v", "w"]), records
+    ) == {"a": [1, 2], "b": [3]}
+    assert pamda.sortBy(pamda.lens(["v", "w"]), records[::-1]) == records
 
 
 def test_map():
@@ -199,6 +539,23 @@ def test_mean():
 
 def test_median():
     assert pamda.median([1, 2, 3]) == 2
+    assert pamda.median([7, 2, 8, 9]) == 7.5
+    assert pamda.median([]) is None
+    data = [5, 3, 1, 4, 2] * 30
+    assert pamda.median(data, inplace=True) == 3
+    assert sorted(data) == sorted([5, 3, 1, 4, 2] * 30)
+    assert pamda.median(array.array("d", [3, 1, 2, 4])) == 2.5
+    # In place partitioning keeps the original items (EG: 1.0 stays a float)
+    data = [1, 1.0, 2, 3.5] * 40
+    assert pamda.median(data, inplace=True) == 1.5
+    assert sum(isinstance(i, float) for i in data) == 80
+    data = array.array("d", [5, 3, 1, 4, 2] * 30)
+    assert pamda.median(data, inplace=True) == 3
+    assert sorted(data) == sorted([5.0, 3.0, 1.0, 4.0, 2.0] * 30)
+    data = [(i * 7919) % 1001 // 3 for i in range(2001)]
+    expected = sorted(data)[1000]
+    assert pamda.median(data, inplace=True) == expected
+    assert data[1000] == expected
 
 
 def test_mergeDeep():
@@ -206,6 +563,50 @@ def test_mergeDeep():
     data2 = {"a": {"b": 3, "d": 4}}
     expected = {"a": {"b": 3, "c": 2, "d": 4}}
     assert pamda.mergeDeep(update_data=data2, data=data1) == expected
+    assert data1 == {"a": {"b": 1, "c": 2}}
+    assert pamda.mergeDeep(data2, data1, inplace=True) is data1
+    assert data1 == expected
+    deep = {}
+    node = deep
+    for i in range(5000):
+        node["a"] = {}
+        node = node["a"]
+    output = pamda.mergeDeep(deep, deep)
+    depth = 0
+    while "a" in output:
+        output = output["a"]
+        depth += 1
+    assert depth == 5000
+
+
+def test_mergeDeepMany():
+    data = {"a": {"b": 1, "c": 2}, "x": {"y": 1}}
+    updates = [{"a": {"b": 3}}, {"a": 1}, {"a": {"d": 4}}, {"x": {"z": 2}}]
+    expected = {"a": {"d": 4}, "x": {"y": 1, "z": 2}}
+    assert pamda.mergeDeepMany(updates, data) == expected
+    assert data == {"a": {"b": 1, "c": 2}, "x": {"y": 1}}
+    assert pamda.mergeDeepMany(updates[:1], data) == pamda.mergeDeep(
+        updates[0], data
+    )
+    assert pamda.mergeDeepMany([], data) == data
+    assert pamda.mergeDeepMany([{"a": 1}, 2], data) == 2
+    assert pamda.mergeDeepMany(updates, data, inplace=True) is data
+    assert data == expected
+    assert updates[2] == {"a": {"d": 4}}
+
+
+def test_mergeDeepParallel():
+    data = {f"k{i}": {"a": {"b": i}, "c": i} for i in range(10)}
+    data["x"] = 1
+    update_data = {f"k{i}": {"a": {"d": i}} for i in range(0, 10, 2)}
+    update_data["y"] = {"z": 1}
+    expected = pamda.mergeDeep(update_data, data)
+    output = pamda.mergeDeepParallel(update_data, data, workers=2, threshold=0)
+    assert output == expected
+    assert list(output) == list(expected)
+    assert data["k0"] == {"a": {"b": 0}, "c": 0}
+    assert pamda.mergeDeepParallel(update_data, data) == expected
+    assert pamda.mergeDeepParallel(1, data) == 1
 
 
 def test_nest():
@@ -218,6 +619,15 @@ def test_nest():
     out = pamda.nest(path_keys=["x_1", "x_2"], value_key="output", data=data)
     assert out == expected
 
+    data = [
+        {"x_1": "a", "x_2": "b", "output": 1},
+        {"x_1": "b", "x_2": "b", "output": 2},
+        {"x_1": "a", "x_2": "b", "output": 3},
+    ]
+    out = pamda.nest(["x_1", "x_2"], "output", data, agg_fn=sum)
+    assert out == {"a": {"b": 4}, "b": {"b": 2}}
+    assert pamda.nest(["x_1"], "output", data) == {"a": [1, 3], "b": [2]}
+
 
 def test_nestItem():
     data = [
@@ -232,6 +642,9 @@ def test_nestItem():
         }
     }
     assert pamda.nestItem(path_keys=["x_1", "x_2"], data=data) == expected
+    assert pamda.nestItem(["x_1", "x_2"], data, agg_fn=len) == {
+        "a": {"b": 2, "e": 1}
+    }
 
 
 def test_path():
@@ -285,6 +698,11 @@ def test_pivot():
         "c": ["c1", "c2"],
     }
 
+    table = pamda.pivot([{"a": 1, "b": 1.5}, {"a": None, "b": 2.5}], typed=True)
+    assert table.pluck("b").typecode == "d"
+    assert table.mask("a") == bytearray([0, 1])
+    assert pamda.pivot(table) == [{"a": 1, "b": 1.5}, {"a": None, "b": 2.5}]
+
     data = {"a": ["a1", "a2"], "b": ["b1", "b2"], "c": ["c1", "c2"]}
     assert pamda.pivot(data) == [
         {"a": "a1", "b": "b1", "c": "c1"},
@@ -317,24 +735,196 @@ def test_props():
     assert pamda.props(keys=["a", "c"], data=data) == [1, 3]
 
 
+def test_quantile():
+    data = [5, 4, 3, 2, 1]
+    assert pamda.quantile(0.5, data) == 3
+    assert pamda.quantile(0.9, data) == 4.6
+    assert pamda.quantile(0, data) == 1
+    assert pamda.quantile(1, data) == 5
+    assert pamda.quantile(0.5, []) is None
+    with pytest.raises(Exception):
+        pamda.quantile(1.5, data)
+
+
+def test_quantiles():
+    data = list(range(1000, 0, -1))
+    expected = [1, 10.99, 500.5, 990.01, 1000]
+    out = pamda.quantiles([0, 0.01, 0.5, 0.99, 1], data)
+    assert out == pytest.approx(expected)
+    out = pamda.quantiles([0, 0.01, 0.5, 0.99, 1], data, inplace=True)
+    assert out == pytest.approx(expected)
+
+
+def test_query():
+    data = {
+        "users": {
+            "u1": {"orders": [{"total": 3}, {"total": 8}]},
+            "u2": {"orders": [{"total": 9}]},
+            "u3": {"orders": None},
+            "u4": 5,
+        }
+    }
+    query = pamda.query(["users", "*", "orders", "*", "total"])
+    assert query(data) == [3, 8, 9]
+    assert list(query.items(data)) == [
+        (["users", "u1", "orders", 0, "total"], 3),
+        (["users", "u1", "orders", 1, "total"], 8),
+        (["users", "u2", "orders", 0, "total"], 9),
+    ]
+    assert query.first(data) == 3 and query.first({}, 0) == 0
+    assert pamda.hasPath(query, data)
+    assert not pamda.hasPath(query, {"users": {}})
+    big = pamda.query(["orders", lambda x: x["total"] > 5, "total"])
+    users = list(data["users"].values())[:2]
+    assert pamda.pluck(big, users) == [8, 9]
+    assert pamda.pluckIf(lambda x: len(x["orders"]) > 1, big, users) == [8]
+    first_two = pamda.query(["orders", slice(0, 2), "total"])
+    assert first_two(data["users"]["u1"]) == [3, 8]
+    assert list(first_two.items(data["users"]["u2"])) == [
+        (["orders", 0, "total"], 9)
+    ]
+    records = [
+        {"region": "n", "orders": [{"total": 1}, {"total": 2}]},
+        {"region": "s", "orders": [{"total": 3}]},
+        {"region": "n", "orders": [{"total": 4}]},
+    ]
+    totals = pamda.query(["orders", "*", "total"])
+    assert pamda.nest(["region"], totals, records) == {"n": [1, 2, 4], "s": [3]}
+    assert pamda.nest(["region"], totals, records, agg_fn=sum) == {
+        "n": 7,
+        "s": 3,
+    }
+    lazy = query.get(data)
+    assert next(lazy) == 3
+    with pytest.raises(Exception):
+        pamda.query([])
+    deep = "leaf"
+    for i in range(25):
+        deep = {"k": [deep]} if i % 2 else {"k": deep}
+    deep_query = pamda.query(["*"] * 37)
+    assert deep_query(deep) == ["leaf"]
+    assert list(deep_query.items(deep))[0][0][:3] == ["k", "k", 0]
+    assert pamda.query(["*"] * 38)(deep) == []
+    mapped = PamdaMap({"a": {"x": 1}, "b": PamdaMap({"x": 2})})
+    assert sorted(pamda.query(["*", "x"])(mapped)) == [1, 2]
+    assert pamda.hasPath(pamda.query(["*", "x"]), mapped)
+    assert pamda.query(["*"])({"t": (1, 2)}) == [(1, 2)]
+    assert pamda.query(["t", "*"])({"t": (1, 2)}) == []
+
+
 def test_reduce():
     assert (
         pamda.reduce(fn=pamda.add, initial_accumulator=0, data=[1, 2, 3]) == 6
     )
 
 
+def test_rolling():
+    data = [1, 3, 2, 5, 4]
+    assert pamda.rolling(3, "sum", data) == [6, 10, 11]
+    assert pamda.rolling(3, "mean", iter(data)) == [2, 10 / 3, 11 / 3]
+    assert pamda.rolling(3, "max", data) == [3, 5, 5]
+    assert pamda.rolling(2, "min", data) == [1, 2, 2, 4]
+    assert pamda.rolling(2, lambda x: x[1] - x[0], data) == [2, -1, 3, -1]
+    series = [(i * 7919) % 101 / 10 for i in range(500)]
+    expected = [sum(series[i : i + 20]) for i in range(481)]
+    output = pamda.rolling(20, "sum", series)
+    assert all(abs(a - b) < 1e-9 for a, b in zip(output, expected))
+    assert pamda.rolling(20, "min", series) == [
+        min(series[i : i + 20]) for i in range(481)
+    ]
+    with pytest.raises(Exception):
+        pamda.rolling(2, "median", data)
+
+
 def test_safeDivide():
     assert pamda.safeDivide(2, 1) == 0.5
     assert pamda.safeDivide(0, 1) == 1
 
 
+def test_safeDivideBatch():
+    assert pamda.safeDivideBatch(2, [1, 4]) == [0.5, 2]
+    assert pamda.safeDivideBatch([2, 0], [1, 4]) == [0.5, 4]
+
+
 def test_safeDivideDefault():
     assert pamda.safeDivideDefault(5, 2, 1) == 0.5
     assert pamda.safeDivideDefault(5, 0, 1) == 0.2
 
 
+def test_safeDivideDefaultBatch():
+    assert pamda.safeDivideDefaultBatch(5, [2, 0], [1, 1]) == [0.5, 0.2]
+    assert pamda.safeDivideDefaultBatch(5, 0, [1, 2]) == [0.2, 0.4]
+
+
+def test_sortBy():
+    data = [{"a": 2, "b": "x"}, {"a": 1, "b": "y"}, {"a": 2, "b": "z"}]
+    assert pamda.sortBy("a", data) == [data[1], data[0], data[2]]
+    assert pamda.sortBy(lambda x: x["b"], data, descending=True) == data[::-1]
+    assert pamda.sortBy("a", data, descending=True) == [
+        data[0],
+        data[2],
+        data[1],
+    ]
+    assert pamda.sortBy(["a"], data) == pamda.sortBy(("a",), data)
+    rows = [{"a": {"b": 2}}, {"x": 1}, {"a": {"b": 1}}]
+    assert pamda.sortBy(["a", "b"], rows[::2]) == [rows[2], rows[0]]
+    records = [[2], [1], (3,)]
+    assert pamda.sortBy([0], records) == [[1], [2], (3,)]
+
+
+def test_sortWith():
+    data = [
+        {"a": 1, "b": 1},
+        {"a": 2, "b": 1},
+        {"a": 1, "b": 2},
+        {"a": 2, "b": 2},
+    ]
+    assert pamda.sortWith([("a", True), "b"], data) == [
+        data[1],
+        data[3],
+        data[0],
+        data[2],
+    ]
+    assert pamda.sortWith([("b", True), ("a", True)], data) == [
+        data[3],
+        data[2],
+        data[1],
+        data[0],
+    ]
+    # A tuple spec is a tuple of keys unless it is (key, bool)
+    assert pamda.sortWith([("b", "a")], data) == [
+        data[0],
+        data[1],
+        data[2],
+        data[3],
+    ]
+    assert pamda.sortWith([(("b", "a"), True)], data) == data[::-1]
+    with pytest.raises(Exception, match="spec"):
+        pamda.sortWith([(["a"], "desc")], data)
+    with pytest.raises(Exception, match="spec"):
+        pamda.sortWith([("a", True, False)], data)
+
+
+def test_splitEvery():
+    assert list(pamda.splitEvery(2, [1, 2, 3, 4, 5])) == [[1, 2], [3, 4], [5]]
+    assert list(pamda.splitEvery(2, iter([]))) == []
+
+
 def test_symmetricDifference():
     assert pamda.symmetricDifference([1, 2, 3], [2, 3, 4]) == [1, 4]
+    assert pamda.symmetricDifference([5, 1, 2, 3], [4, 2]) == [5, 1, 3, 4]
+    assert pamda.symmetricDifference([4, 2], [5, 1, 2, 3]) == [4, 5, 1, 3]
+    assert pamda.symmetricDifference([1, 3], [2, 3, 4], presorted=True) == [
+        1,
+        2,
+        4,
+    ]
+
+
+def test_symmetricDifferenceBy():
+    a = [{"id": 1, "v": "a"}, {"id": 2, "v": "b"}]
+    b = [{"id": 2, "v": "x"}, {"id": 3, "v": "c"}]
+    assert pamda.symmetricDifferenceBy(lambda x: x["id"], a, b) == [a[0], b[1]]
 
 
 def test_tail():
@@ -349,6 +939,71 @@ def test_thunkify():
     assert thunkedAdd(1, 2)() == 3
 
 
+def test_topK():
+    data = [{"a": 3}, {"a": 1}, {"a": 5}, {"a": 4}]
+    assert pamda.topK(2, "a", data) == [data[2], data[3]]
+    assert pamda.topK(2, "a", iter(data), descending=False) == [
+        data[1],
+        data[0],
+    ]
+    assert pamda.topK(3, lambda x: -x, range(100)) == [0, 1, 2]
+
+
+def test_uniq():
+    assert pamda.uniq([3, 1, 3, 2, 1]) == [3, 1, 2]
+    assert pamda.uniq(iter([3, 1, 3, 2, 1])) == [3, 1, 2]
+    assert pamda.uniq([{"a": 1}, {"a": 1}, {"a": 2}, [1], [1]]) == [
+        {"a": 1},
+        {"a": 2},
+        [1],
+    ]
+    stream = pamda.uniq(iter([3, 1, 3, {"a": 1}, {"a": 1}]), lazy=True)
+    assert next(stream) == 3
+    assert list(stream) == [1, {"a": 1}]
+
+
+def test_uniqBy():
+    data = [
+        {"event": {"id": 1}, "v": "a"},
+        {"event": {"id": 2}, "v": "b"},
+        {"event": {"id": 1}, "v": "c"},
+    ]
+    assert pamda.uniqBy(["event", "id"], data) == data[:2]
+    assert pamda.uniqBy("event", iter(data)) == data[:2]
+    assert pamda.uniqBy(lambda x: x["v"], data) == data
+    calls = []
+
+    def key(item):
+        calls.append(item)
+        return item["event"]
+
+    assert pamda.uniqBy(key, data) == data[:2]
+    assert len(calls) == len(data)
+    stream = pamda.uniqBy(["event", "id"], iter(data), lazy=True)
+    assert next(stream) is data[0]
+    assert list(stream) == [data[1]]
+    rows = [{"id": 1}, {"x": 1}, {"x": 2}, {"id": {"n": 1}}]
+    assert pamda.uniqBy(["id"], rows) == [rows[0], rows[1], rows[3]]
+    assert pamda.uniqBy(["id", "n"], rows) == [rows[0], rows[3]]
+    records = [[1, "a"], (2, "b"), [1, "c"]]
+    assert pamda.uniqBy([0], records) == records[:2]
+
+
+def test_uniqExternal(monkeypatch):
+    data = [{"id": i % 5, "n": i} for i in range(40)]
+    assert list(pamda.uniqExternal("id", iter(data), chunk_size=3)) == data[:5]
+    # Runs are merged in levels (and then capped) when there are too many
+    monkeypatch.setattr("pamda.pamda_external.__max_open_runs__", 4)
+    data = [{"id": (i * 7) % 50, "n": i} for i in range(301)]
+    output = list(pamda.uniqExternal("id", data, chunk_size=2))
+    assert output == sorted(data[:50], key=lambda x: x["id"])
+    assert list(pamda.uniqExternal([], [3, 1, 3, 2, 1], chunk_size=2)) == [
+        1,
+        2,
+        3,
+    ]
+
+
 def test_unnest():
     assert pamda.unnest([["a", "b"], ["c", "d"]]) == ["a", "b", "c", "d"]
     assert pamda.unnest([["a", "b"], ["c", ["d"]]]) == ["a", "b", "c", ["d"]]
@@ -0,0 +1,121 @@
+import random, pytest
+from pamda import pamda
+from pamda.pamda_hamt import PamdaMap
+
+
+class CollidingKey:
+    def __init__(self, value):
+        self.value = value
+
+    def __hash__(self):
+        return 7
+
+    def __eq__(self, other):
+        return isinstance(other, CollidingKey) and other.value == self.value
+
+
+def test_map_assoc_dissoc():
+    random.seed(1)
+    expected = {}
+    output = PamdaMap()
+    snapshots = []
+    for i in range(5000):
+        key = random.randrange(1000)
+        if random.random() < 0.3:
+            expected.pop(key, None)
+            output = output.dissoc(key)
+        else:
+            expected[key] = i
+            output = output.assoc(key, i)
+        if i % 1000 == 0:
+            snapshots.append((dict(expected), output))
+    assert len(output) == len(expected)
+    assert output == expected
+    for snapshot_dict, snapshot_map in snapshots:
+        assert snapshot_map == snapshot_dict
+    empty = PamdaMap({"a": 1}).dissoc("a")
+    assert len(empty) == 0 and empty.get("a") is None
+    assert output.dissoc("missing") is output
+
+
+def test_map_reads():
+    data = PamdaMap({"a": 1, "b": 2})
+    assert data["a"] == 1 and data.get("c", 3) == 3
+    assert "b" in data and "c" not in data
+    assert sorted(data) == ["a", "b"]
+    assert dict(data.items()) == {"a": 1, "b": 2}
+    items = data.items()
+    assert len(items) == 2 and list(items) == list(items)
+    assert items == {("a", 1), ("b", 2)} and ("a", 1) in items
+    assert data.keys() & {"a", "c"} == {"a"}
+    assert sorted(data.values()) == [1, 2] and len(data.values()) == 2
+    with pytest.raises(KeyError):
+        data["c"]
+
+
+def test_map_collisions():
+    keys = [CollidingKey(i) for i in range(10)]
+    output = PamdaMap({"x": 1})
+    for key in keys:
+        output = output.assoc(key, key.value)
+    assert len(output) == 11
+    assert all(output[key] == key.value for key in keys)
+    for key in keys[:5]:
+        output = output.dissoc(key)
+    assert len(output) == 6
+    assert CollidingKey(7) in output and CollidingKey(2) not in output
+
+
+def test_map_transient():
+    base = PamdaMap({i: i for i in range(100)})
+    transient = base.transient()
+    for i in range(100, 1000):
+        transient.assoc(i, i)
+    transient.dissoc(0)
+    output = transient.persistent()
+    assert len(base) == 100 and base[0] == 0 and 100 not in base
+    assert len(output) == 999 and output[999] == 999 and 0 not in output
+    with pytest.raises(Exception):
+        transient.assoc(1, 1)
+    assert base.update({0: "a", 1000: "b"}) == {
+        **{i: i for i in range(1, 100)},
+        0: "a",
+        1000: "b",
+    }
+
+
+def test_map_nested_and_pamda_compatibility():
+    config = PamdaMap.fromDict(
+        {"db": {"host": "x", "port": 1}, "app": {"a": 1}}
+    )
+    updated = config.assocPath(["db", "port"], 2)
+    assert pamda.path(["db", "port"], config) == 1
+    assert pamda.path(["db", "port"], updated) == 2
+    assert pamda.pathOr(5, ["db", "user"], updated) == 5
+    assert pamda.hasPath(["db", "host"], updated)
+    assert not pamda.hasPath(["db", "user"], updated)
+    assert updated["app"] is config["app"]
+    assert updated.dissocPath(["db", "host"]).toDict() == {
+        "db": {"port": 2},
+        "app": {"a": 1},
+    }
+    merged = pamda.mergeDeep({"db": {"user": "u"}, "new": 1}, updated)
+    assert isinstance(merged, PamdaMap)
+    assert merged.toDict() == {
+        "db": {"host": "x", "port": 2, "user": "u"},
+        "app": {"a": 1},
+        "new": 1,
+    }
+    assert merged["app"] is updated["app"]
+    assert updated.toDict()["db"] == {"host": "x", "port": 2}
+    with_map = pamda.mergeDeep(
+        PamdaMap({"a": {"b": 1}}), {"a": {"c": 2}, "d": 3}
+    )
+    assert isinstance(with_map, PamdaMap)
+    assert with_map.toDict() == {"a": {"b": 1, "c": 2}, "d": 3}
+    nested = PamdaMap({"a": {"c": 2}}).mergeDeep({"a": PamdaMap({"b": 1})})
+    assert nested.toDict() == {"a": {"b": 1, "c": 2}}
+    assert pamda.mergeDeepMany(
+        [PamdaMap({"a": {"b": 1}}), {"a": {"e": 4}}], {"a": {"c": 2}}
+    ).toDict() == {"a": {"b": 1, "c": 2, "e": 4}}
+    assert pamda.mergeDeep(PamdaMap({"a": 1}), 5) == PamdaMap({"a": 1})
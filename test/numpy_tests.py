@@ -0,0 +1,42 @@
+import pytest
+from pamda import pamda
+from pamda.pamda_numpy import useNumpy
+
+numpy = pytest.importorskip("numpy")
+
+
+def test_numpy_numeric_functions():
+    data = numpy.array([7, 2, 8, 9])
+    assert pamda.mean(data) == 6.5
+    assert pamda.median(data) == 7.5
+    assert pamda.median(numpy.array([7, 8, 9])) == 8
+    assert pamda.add(data, 1).tolist() == [8, 3, 9, 10]
+    assert pamda.clamp(3, 8, data).tolist() == [7, 3, 8, 8]
+    assert pamda.hardRound(1, numpy.array([1.26, 12.34])).tolist() == [
+        1.3,
+        12.3,
+    ]
+    assert pamda.safeDivide(numpy.array([2, 0]), 10).tolist() == [5, 10]
+    assert pamda.safeDivideDefault(5, numpy.array([2, 0]), 10).tolist() == [
+        5,
+        2,
+    ]
+
+
+def test_numpy_threshold():
+    useNumpy(threshold=3)
+    try:
+        assert pamda.median([9, 1, 8, 2]) == 5
+        assert pamda.median([3, 1, 2]) == 2
+        assert pamda.mean([1, 2, 3]) == 2
+        assert pamda.median(["b", "a", "c"]) == "b"
+    finally:
+        useNumpy(enabled=False)
+
+
+def test_numpy_columnar_functions():
+    data = numpy.array([(1, 1.5), (2, 2.5)], dtype=[("a", "i8"), ("b", "f8")])
+    assert pamda.pluck("a", data).tolist() == [1, 2]
+    columns = pamda.pivot(data)
+    assert columns["b"].tolist() == [1.5, 2.5]
+    assert pamda.pivot(columns) == [{"a": 1, "b": 1.5}, {"a": 2, "b": 2.5}]
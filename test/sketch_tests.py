@@ -0,0 +1,60 @@
+import json, random, pytest
+from pamda import pamda
+from pamda.pamda_sketches import PamdaHyperLogLog, PamdaQuantileSketch
+
+
+def test_hyperloglog():
+    sketch = PamdaHyperLogLog().updateMany(i % 20000 for i in range(100000))
+    assert abs(sketch.count() - 20000) < 20000 * 0.05
+    assert PamdaHyperLogLog().updateMany(["a", "b", "a"]).count() == 2
+    assert (
+        pamda.reduce(
+            PamdaHyperLogLog.update, PamdaHyperLogLog(), ["a", "b", "a"]
+        ).count()
+        == 2
+    )
+
+
+def test_hyperloglog_merge_and_serialize():
+    a = PamdaHyperLogLog(12).updateMany(range(0, 6000))
+    b = PamdaHyperLogLog(12).updateMany(range(4000, 10000))
+    merged = a + b
+    assert abs(merged.count() - 10000) < 10000 * 0.1
+    restored = PamdaHyperLogLog.fromDict(
+        json.loads(json.dumps(merged.toDict()))
+    )
+    assert restored.count() == merged.count()
+    with pytest.raises(Exception):
+        a + PamdaHyperLogLog(10)
+
+
+def test_quantile_sketch():
+    data = list(range(100000))
+    random.shuffle(data)
+    sketch = PamdaQuantileSketch().updateMany(iter(data))
+    assert sketch.count() == 100000
+    assert sum(len(i) for i in sketch.compactors) < 4 * sketch.k
+    p50, p99 = sketch.quantiles([0.5, 0.99])
+    assert abs(p50 - 50000) < 100000 * 0.02
+    assert abs(p99 - 99000) < 100000 * 0.02
+    assert sketch.quantiles([0, 1]) == [0, 99999]
+    assert PamdaQuantileSketch().quantile(0.5) is None
+    assert (
+        pamda.reduce(
+            PamdaQuantileSketch.update, PamdaQuantileSketch(), [3, 1, 2]
+        ).quantile(0.5)
+        == 2
+    )
+
+
+def test_quantile_sketch_merge_and_serialize():
+    a = PamdaQuantileSketch().updateMany(range(0, 50000))
+    b = PamdaQuantileSketch().updateMany(range(50000, 100000))
+    merged = a + b
+    assert merged.count() == 100000
+    assert abs(merged.quantile(0.5) - 50000) < 100000 * 0.02
+    assert merged.quantile(0) == 0 and merged.quantile(1) == 99999
+    restored = PamdaQuantileSketch.fromDict(
+        json.loads(json.dumps(merged.toDict()))
+    )
+    assert restored.quantiles([0.1, 0.9]) == merged.quantiles([0.1, 0.9])
@@ -0,0 +1,40 @@
+import random, statistics
+from pamda import pamda
+from pamda.pamda_stats import PamdaStats
+
+data = [random.uniform(-1000, 1000) for i in range(10000)]
+
+
+def test_stats_update():
+    stats = pamda.reduce(PamdaStats.update, PamdaStats(), data)
+    assert stats.count == len(data)
+    assert abs(stats.mean - statistics.mean(data)) < 1e-9
+    assert abs(stats.variance() - statistics.variance(data)) < 1e-6
+    assert abs(stats.variance(0) - statistics.pvariance(data)) < 1e-6
+    assert stats.min == min(data)
+    assert stats.max == max(data)
+
+
+def test_stats_updateMany():
+    stats = PamdaStats().updateMany(iter(data), chunk_size=333)
+    assert stats.count == len(data)
+    assert abs(stats.mean - statistics.mean(data)) < 1e-9
+    assert abs(stats.std() - statistics.stdev(data)) < 1e-6
+    assert PamdaStats().updateMany([5]).variance() is None
+
+
+def test_stats_merge():
+    a = PamdaStats().updateMany(data[:3000])
+    b = PamdaStats().updateMany(data[3000:])
+    merged = a + b
+    assert merged.count == len(data)
+    assert abs(merged.mean - statistics.mean(data)) < 1e-9
+    assert abs(merged.variance() - statistics.variance(data)) < 1e-6
+    assert merged.min == min(data)
+    assert (a + PamdaStats()).toDict() == a.toDict()
+    assert a.count == 3000
+
+
+def test_stats_numerical_stability():
+    stats = PamdaStats().updateMany([1e9 + 4, 1e9 + 7, 1e9 + 13, 1e9 + 16])
+    assert stats.variance() == 30.0
@@ -0,0 +1,96 @@
+import array
+from pamda.pamda_table import PamdaTable
+
+data = [
+    {"color": "red", "size": 1, "weight": 1.5},
+    {"color": "blue", "size": 2, "weight": 2.0},
+    {"color": "red", "size": 3, "weight": 2.5},
+]
+
+
+def test_table_conversions():
+    table = PamdaTable.fromListOfDicts(data)
+    assert isinstance(table.pluck("size"), array.array)
+    assert table.pluck("size").typecode == "q"
+    assert table.pluck("weight").typecode == "d"
+    assert table.pluck("color") == ["red", "blue", "red"]
+    assert len(table) == 3
+    assert table.toListOfDicts() == data
+    assert table.toDictOfLists(as_lists=True) == {
+        "color": ["red", "blue", "red"],
+        "size": [1, 2, 3],
+        "weight": [1.5, 2.0, 2.5],
+    }
+
+    columns = {"a": [1, 2], "b": [None, 2]}
+    table = PamdaTable.fromDictOfLists(columns, typed=False)
+    assert table.pluck("a") is columns["a"]
+    assert table.toDictOfLists()["b"] is columns["b"]
+
+
+def test_table_project():
+    table = PamdaTable.fromListOfDicts(data)
+    projected = table.project(["color"])
+    assert projected.toListOfDicts() == [
+        {"color": "red"},
+        {"color": "blue"},
+        {"color": "red"},
+    ]
+    assert projected.pluck("color") is table.pluck("color")
+
+
+def test_table_filter_pluckIf():
+    table = PamdaTable.fromListOfDicts(data)
+    filtered = table.filter(
+        lambda c, s: c == "red" and s > 1, ["color", "size"]
+    )
+    assert filtered.toListOfDicts() == [data[2]]
+    assert filtered.pluck("size").typecode == "q"
+    assert table.pluckIf(lambda c: c == "red", ["color"], "size") == [1, 3]
+
+
+def test_table_groupKeys():
+    table = PamdaTable.fromListOfDicts(data)
+    groups = table.groupKeys(["color"])
+    assert [i.toListOfDicts() for i in groups] == [
+        [data[0], data[2]],
+        [data[1]],
+    ]
+
+
+def test_table_nest():
+    table = PamdaTable.fromListOfDicts(data)
+    assert table.nest(["color"], "size") == {"red": [1, 3], "blue": [2]}
+    assert table.nest(["color", "size"], "weight", agg_fn=sum) == {
+        "red": {1: 1.5, 3: 2.5},
+        "blue": {2: 2.0},
+    }
+
+
+def test_table_null_masks():
+    table = PamdaTable.fromDictOfLists(
+        {"a": [1, None, 3], "b": [None, None, None]}
+    )
+    assert table.pluck("a") == [1, None, 3]
+    assert table.mask("a") == bytearray([0, 1, 0])
+    assert table.mask("b") is None
+    assert table.memoryview("a").tolist() == [1, 0, 3]
+    assert table.toListOfDicts() == [
+        {"a": 1, "b": None},
+        {"a": None, "b": None},
+        {"a": 3, "b": None},
+    ]
+    filtered = table.filter(lambda a: a != 1, ["a"])
+    assert filtered.pluck("a") == [None, 3]
+    assert filtered.mask("a") == bytearray([1, 0])
+
+
+def test_table_large_ints():
+    big = 10**400
+    table = PamdaTable.fromDictOfLists(
+        {"a": [1.5, 2, big], "b": [None, 1.5, big]}
+    )
+    assert isinstance(table.columns["a"], list)
+    assert table.pluck("a") == [1.5, 2, big]
+    assert table.pluck("b") == [None, 1.5, big]
+    assert table.mask("b") is None
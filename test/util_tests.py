@@ -51,6 +51,33 @@ def test_read_csv_return_type_list_of_col_lists():
     assert data == [["a", 1], ["b", True], ["c", 1.5], ["d", "abc"]]
 
 
+def test_read_csv_return_type_table():
+    table = pamda.read_csv("test/test_data/data.csv", return_type="table")
+    assert table.pluck("a").typecode == "q"
+    assert table.pluck("c").typecode == "d"
+    assert table.memoryview("c").tolist() == [1.5]
+    assert table.toListOfDicts() == [{"a": 1, "b": True, "c": 1.5, "d": "abc"}]
+
+
+def test_read_csv_return_type_table_streamed_columns(tmp_path):
+    filename = str(tmp_path / "columns.csv")
+    with open(filename, "w") as f:
+        f.write("i,f,n,s,e\n1,2,,x,\n2,2.5,3,4,\n,3,4,y,\n")
+    table = pamda.read_csv(filename, return_type="table")
+    assert table.pluck("i") == [1, 2, None]
+    assert table.pluck("f").typecode == "d"
+    assert list(table.pluck("f")) == [2.0, 2.5, 3.0]
+    assert table.pluck("n") == [None, 3, 4]
+    assert table.pluck("s") == ["x", 4, "y"]
+    assert table.pluck("e") == [None, None, None]
+    raw = pamda.read_csv(filename, return_type="table", cast_items=False)
+    assert raw.pluck("i") == ["1", "2", ""]
+    with open(filename, "a") as f:
+        f.write("1,2\n")
+    with pytest.raises(Exception):
+        pamda.read_csv(filename, return_type="table")
+
+
 def test_pamda_timer_decorator():
     @pamda_timer(units="ms", iterations=10)
     def my_fn(a, b):
@@ -3,7 +3,6 @@ from pamda.pamda_timer import pamda_timer
 from pamda.pamda_fast import __assocPath__
 import random
 
-
 # seed the random number generator for reproducibility
 random.seed(42)
 
@@ -47,16 +46,24 @@ for i in range(int(data_size / 2)):
     path = [f"level{random.randint(1, 10)}" for _ in range(10)]
     __assocPath__(path, random.randint(1, 10), data_merge_b)
 
+data_assoc_pairs = [
+    ([f"level{random.randint(1, 10)}" for _ in range(10)], i)
+    for i in range(int(data_size / 2))
+]
+
 data_zip_a = list(range(int(data_size / 2)))
 data_zip_b = list(range(int(data_size / 2), data_size))
 
 unflat_data = [[i] for i in range(data_size)]
 
 for function, args in [
+    (pamda.assocPaths, [data_assoc_pairs, {}]),
     (pamda.flatten, [unflat_data]),
     (pamda.groupBy, [lambda x: str(x["color"] + x["shape"]), data]),
     (pamda.groupKeys, [["color", "size"], data]),
     (pamda.groupWith, [lambda x, y: x["color"] == y["color"], data]),
+    (pamda.groupWith, [lambda x: x["color"], data]),
+    (pamda.groupWithSorted, [lambda x: x["color"], data]),
     (pamda.mergeDeep, [data_merge_a, data_merge_b]),
     (pamda.nest, [["color", "size"], "size", data]),
     (pamda.nestItem, [["color", "size"], data]),
@@ -71,5 +78,3 @@ for function, args in [
     pamda_timer(function, iterations=3, print_time_stats=True).get_time_stats(
         *args
     )
-
-